@@ -0,0 +1,60 @@
+"""Import-time benchmark of the SkyPulse package and CLI.
+
+Runs ``python -X importtime -c "import <module>"`` in fresh interpreters,
+reports the best total over several runs and the most expensive modules
+of that run. With ``--max-ms`` it exits non-zero when the total exceeds
+the budget, so it can guard CLI startup latency in CI. Run with::
+
+    python benchmarks/bench_import_time.py [--module skypulse.cli] [--runs 5] [--top 15] [--max-ms 400]
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def import_times(module):
+    """Return ``{module: (self_us, cumulative_us)}`` for one fresh import of module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="skypulse.cli")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--max-ms", type=float, default=None, help="fail if the best total exceeds this")
+    args = parser.parse_args()
+
+    runs = [import_times(args.module) for _ in range(args.runs)]
+    best = min(runs, key=lambda times: times[args.module][1])
+    total_ms = best[args.module][1] / 1000
+    print(f"import {args.module}: {total_ms:.1f} ms (best of {args.runs})")
+    print(f"  {'module':<40} {'self ms':>9} {'cumul ms':>9}")
+    ranked = sorted(best.items(), key=lambda item: item[1][0], reverse=True)
+    for name, (self_us, cumulative_us) in ranked[: args.top]:
+        print(f"  {name:<40} {self_us / 1000:>9.1f} {cumulative_us / 1000:>9.1f}")
+
+    if args.max_ms is not None and total_ms > args.max_ms:
+        print(f"FAIL: {total_ms:.1f} ms exceeds the {args.max_ms:.1f} ms budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Micro-benchmark of JSON decoders on recorded wttr.in payloads.
+
+Compares the previous ``bytes -> str -> json.loads`` path with decoding the
+raw bytes directly using each installed library, and shows the model-build
+cost for reference. Run with::
+
+    python benchmarks/bench_json_decode.py [iterations]
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from skypulse.decoders import AVAILABLE_DECODERS  # noqa: E402
+from skypulse.models import WttrResponse  # noqa: E402
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+
+def bench(label, func, iterations):
+    seconds = min(timeit.repeat(func, number=iterations, repeat=5)) / iterations
+    print(f"  {label:<28} {seconds * 1e6:>9.1f} µs")
+    return seconds
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    for name in ("london_j1.json", "london_j2.json"):
+        raw = (FIXTURES / name).read_bytes()
+        print(f"{name} ({len(raw) / 1024:.1f} KiB), best of 5 x {iterations}")
+        stdlib = AVAILABLE_DECODERS["json"]
+        baseline = bench("json (bytes -> str)", lambda: stdlib(raw.decode("utf-8")), iterations)
+        for label, decoder in AVAILABLE_DECODERS.items():
+            seconds = bench(f"{label} (raw bytes)", lambda: decoder(raw), iterations)
+            print(f"  {'':<28} {baseline / seconds:>9.2f}x vs baseline")
+        data = stdlib(raw)
+        bench("WttrResponse.from_dict", lambda: WttrResponse.from_dict(data), iterations)
+        bench("  lazy=True", lambda: WttrResponse.from_dict(data, lazy=True), iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""Load-test benchmark of the SkyPulse client against the local mock wttr.in.
+
+Starts ``benchmarks/mock_wttr.py`` in a subprocess (or targets ``--url``)
+and drives the sync and async request paths, ``compare_locations*`` and
+``WeatherNotifier`` with many distinct locations. Reports throughput,
+p50/p95/p99 latency of individual lookups (request plus decoding) and
+memory per scenario. Run with::
+
+    python benchmarks/bench_load.py [--requests 1000] [--concurrency 32] [--latency 0.02]
+        [--error-rate 0] [--throttle-rate 0] [--scenarios sync_get,async_fetch_many,...]
+        [--memory] [--json]
+
+``--memory`` traces Python allocations with tracemalloc and reports each
+scenario's peak; it slows the client down, so throughput figures from such
+a run are not comparable with untraced ones. Without it the process's
+peak RSS so far is shown.
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from skypulse import SkyPulse, TransportConfig  # noqa: E402
+from skypulse.notifications import WeatherNotifier  # noqa: E402
+
+MOCK_SERVER = Path(__file__).resolve().parent / "mock_wttr.py"
+
+
+class Recorder:
+    """Collects per-lookup latencies and error counts of one scenario."""
+
+    def __init__(self):
+        self.latencies = []
+        self.errors = 0
+
+    def wrap(self, func):
+        """Time every call of a sync client method."""
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                self.errors += 1
+                raise
+            finally:
+                self.latencies.append(time.perf_counter() - started)
+        return timed
+
+    def wrap_async(self, func):
+        """Time every call of an async client method."""
+        async def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            except Exception:
+                self.errors += 1
+                raise
+            finally:
+                self.latencies.append(time.perf_counter() - started)
+        return timed
+
+
+def percentile(ordered, q):
+    """Nearest-rank q-quantile of an ascending list."""
+    if not ordered:
+        return float("nan")
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def sync_get(url, locations, args, recorder):
+    with SkyPulse(api_url=url) as client:
+        get = recorder.wrap(client.get_weather)
+        for location in locations:
+            try:
+                get(location)
+            except Exception:
+                pass
+
+
+def sync_fetch_many(url, locations, args, recorder):
+    transport = TransportConfig(pool_maxsize=args.concurrency)
+    with SkyPulse(api_url=url, transport=transport) as client:
+        client.get_weather = recorder.wrap(client.get_weather)
+        for _ in client.fetch_many(locations, concurrency=args.concurrency):
+            pass
+
+
+def sync_compare(url, locations, args, recorder):
+    with SkyPulse(api_url=url) as client:
+        client.get_weather = recorder.wrap(client.get_weather)
+        for start in range(0, len(locations), args.compare_size):
+            try:
+                client.compare_locations(locations[start:start + args.compare_size])
+            except Exception:
+                pass  # compare_locations stops at the first failed location
+
+
+async def async_get(url, locations, args, recorder):
+    semaphore = asyncio.Semaphore(args.concurrency)
+    async with SkyPulse(api_url=url, async_mode=True) as client:
+        get = recorder.wrap_async(client.get_weather_async)
+
+        async def one(location):
+            async with semaphore:
+                await get(location)
+
+        await asyncio.gather(*(one(location) for location in locations), return_exceptions=True)
+
+
+async def async_fetch_many(url, locations, args, recorder):
+    async with SkyPulse(api_url=url, async_mode=True) as client:
+        client.get_weather_async = recorder.wrap_async(client.get_weather_async)
+        async for _ in client.fetch_many_async(locations, concurrency=args.concurrency):
+            pass
+
+
+async def async_compare(url, locations, args, recorder):
+    async with SkyPulse(api_url=url, async_mode=True) as client:
+        client.get_weather_async = recorder.wrap_async(client.get_weather_async)
+        for start in range(0, len(locations), args.compare_size):
+            await client.compare_locations_async(locations[start:start + args.compare_size])
+
+
+async def notifier(url, locations, args, recorder):
+    """Watch every location for --duration seconds, polling each every --interval."""
+    client = SkyPulse(api_url=url, async_mode=True)
+    client.get_current_weather_async = recorder.wrap_async(client.get_current_weather_async)
+    async with WeatherNotifier(update_interval=args.interval, client=client, max_concurrency=args.concurrency) as watcher:
+        watcher.add_locations(locations)
+
+        async def consume():
+            async for _ in watcher.stream_notifications():
+                pass
+
+        consumer = asyncio.ensure_future(consume())
+        await asyncio.wait({consumer}, timeout=args.duration)
+        consumer.cancel()
+        await asyncio.gather(consumer, return_exceptions=True)
+
+
+SCENARIOS = {
+    "sync_get": sync_get,
+    "sync_fetch_many": sync_fetch_many,
+    "sync_compare": sync_compare,
+    "async_get": async_get,
+    "async_fetch_many": async_fetch_many,
+    "async_compare": async_compare,
+    "notifier": notifier,
+}
+
+
+def run_scenario(name, url, args):
+    """Run one scenario and return its report."""
+    count = args.locations if name == "notifier" else args.requests
+    locations = [f"location-{i}" for i in range(count)]
+    recorder = Recorder()
+    if args.memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    result = SCENARIOS[name](url, locations, args, recorder)
+    if asyncio.iscoroutine(result):
+        asyncio.run(result)
+    elapsed = time.perf_counter() - started
+    if args.memory:
+        memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    else:
+        memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024  # KiB on Linux
+
+    ordered = sorted(recorder.latencies)
+    return {
+        "scenario": name,
+        "lookups": len(ordered),
+        "errors": recorder.errors,
+        "seconds": elapsed,
+        "throughput": len(ordered) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(ordered, 0.50) * 1000,
+        "p95_ms": percentile(ordered, 0.95) * 1000,
+        "p99_ms": percentile(ordered, 0.99) * 1000,
+        "memory_kib": memory / 1024,
+    }
+
+
+def start_mock_server(args):
+    """Start mock_wttr.py in a subprocess and return it with its URL."""
+    command = [
+        sys.executable, str(MOCK_SERVER), "--port", "0",
+        "--latency", str(args.latency), "--jitter", str(args.jitter),
+        "--error-rate", str(args.error_rate), "--throttle-rate", str(args.throttle_rate),
+    ]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    url = process.stdout.readline().strip()
+    if not url:
+        process.kill()
+        raise RuntimeError("mock wttr.in server failed to start")
+    return process, url
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test SkyPulse against a local mock wttr.in.")
+    parser.add_argument("--url", help="Target an already running server instead of starting mock_wttr.py")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="Comma-separated subset of scenarios")
+    parser.add_argument("--requests", type=int, default=500, help="Lookups per request scenario")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--compare-size", type=int, default=10, help="Locations per compare_locations call")
+    parser.add_argument("--locations", type=int, default=1000, help="Locations watched by the notifier")
+    parser.add_argument("--interval", type=float, default=2.0, help="Notifier update interval in seconds")
+    parser.add_argument("--duration", type=float, default=6.0, help="Seconds the notifier scenario runs")
+    parser.add_argument("--latency", type=float, default=0.02, help="Mock server response delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--memory", action="store_true", help="Report tracemalloc peaks (slows the client)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    process, url = (None, args.url) if args.url else start_mock_server(args)
+    try:
+        reports = [run_scenario(name, url, args) for name in names]
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+        return
+    memory = "peak KiB" if args.memory else "maxRSS KiB"
+    print(f"{'scenario':<18} {'lookups':>8} {'errors':>7} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {memory:>11}")
+    for r in reports:
+        print(
+            f"{r['scenario']:<18} {r['lookups']:>8} {r['errors']:>7} {r['throughput']:>9.1f} "
+            f"{r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['p99_ms']:>8.1f} {r['memory_kib']:>11.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
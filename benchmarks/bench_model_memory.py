@@ -0,0 +1,77 @@
+"""Per-object memory footprint of dataclass vs. slotted compact models.
+
+Decodes N distinct copies of a recorded j1 payload into CurrentCondition and
+Weather models, drops the raw payloads and reports the memory the models
+retain. Run with::
+
+    python benchmarks/bench_model_memory.py [N]
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from skypulse.models import (  # noqa: E402
+    CurrentCondition,
+    Weather,
+    CompactCurrentCondition,
+    CompactWeather,
+)
+
+FIXTURE = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "london_j1.json"
+
+
+def make_payloads(count):
+    """Return count independently decoded payloads with varied readings."""
+    raw = FIXTURE.read_text(encoding="utf-8")
+    payloads = []
+    for i in range(count):
+        data = json.loads(raw)
+        current = data["current_condition"][0]
+        current["temp_C"] = str(i % 40 - 5)
+        current["humidity"] = str(i % 100)
+        payloads.append(data)
+    return payloads
+
+
+def measure(count, condition_model, weather_model):
+    """Return retained bytes per location for the given model classes."""
+    gc.collect()
+    tracemalloc.start()
+    payloads = make_payloads(count)
+    fleet = [
+        (
+            condition_model.from_dict(p["current_condition"][0]),
+            [weather_model.from_dict(day) for day in p["weather"]],
+        )
+        for p in payloads
+    ]
+    del payloads
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del fleet
+    return retained / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    print(f"Models for {count:,} locations (1 current condition + 3 forecast days each)")
+    results = {}
+    for label, condition_model, weather_model in (
+        ("dataclass", CurrentCondition, Weather),
+        ("compact", CompactCurrentCondition, CompactWeather),
+    ):
+        per_location = measure(count, condition_model, weather_model)
+        results[label] = per_location
+        print(f"  {label:<10} {per_location:>10,.0f} bytes/location")
+    saved = 1 - results["compact"] / results["dataclass"]
+    print(f"  reduction  {saved:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""Local stand-in for wttr.in serving the recorded test fixtures.
+
+Answers ``GET /<location>?format=j1|j2`` with ``tests/fixtures/london_<format>.json``
+(every location gets the same payload) after a configurable delay, and
+fails a configurable share of requests with 5xx errors or 429 throttling
+(with Retry-After). Responses carry an ETag and are gzip-compressed when
+the client accepts it, so conditional requests and transport compression
+behave as against the real service.
+
+Use ``MockWttrServer`` to run it on a background thread from tests or
+benchmarks, or run it standalone::
+
+    python benchmarks/mock_wttr.py [--port 8000] [--latency 0.05] [--jitter 0.02] [--error-rate 0.01] [--throttle-rate 0.01]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import random
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional
+
+from aiohttp import web
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+
+@dataclass
+class MockConfig:
+    """Behaviour of the mock server."""
+    latency: float = 0.0  # Seconds added to every response
+    jitter: float = 0.0  # Extra delay drawn uniformly from [0, jitter]
+    error_rate: float = 0.0  # Share of requests failed with error_status
+    error_status: int = 500
+    throttle_rate: float = 0.0  # Share of requests throttled with 429
+    retry_after: Optional[float] = 1.0  # Retry-After sent with 429s, None to omit
+    compress: bool = True
+    seed: Optional[int] = None
+
+
+@dataclass
+class MockStats:
+    """Requests served, by response status."""
+    statuses: Counter = field(default_factory=Counter)
+
+    @property
+    def requests(self) -> int:
+        return sum(self.statuses.values())
+
+
+def load_fixtures(directory: Path = FIXTURES) -> Dict[str, bytes]:
+    """Return the recorded payload bodies keyed by format."""
+    return {fmt: (directory / f"london_{fmt}.json").read_bytes() for fmt in ("j1", "j2")}
+
+
+def create_app(config: Optional[MockConfig] = None, stats: Optional[MockStats] = None) -> web.Application:
+    """Build the aiohttp application serving the fixtures."""
+    config = config or MockConfig()
+    stats = stats if stats is not None else MockStats()
+    bodies = load_fixtures()
+    etags = {fmt: '"%s"' % hashlib.sha1(body).hexdigest()[:16] for fmt, body in bodies.items()}
+    rng = random.Random(config.seed)
+
+    async def weather(request: web.Request) -> web.StreamResponse:
+        delay = config.latency + (rng.uniform(0, config.jitter) if config.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        fmt = request.query.get("format", "j1")
+        roll = rng.random()
+        if fmt not in bodies:
+            response = web.Response(status=400, text=f"Unsupported format: {fmt}")
+        elif roll < config.throttle_rate:
+            headers = {} if config.retry_after is None else {"Retry-After": f"{config.retry_after:g}"}
+            response = web.Response(status=429, text="Too Many Requests", headers=headers)
+        elif roll < config.throttle_rate + config.error_rate:
+            response = web.Response(status=config.error_status, text="Upstream error")
+        elif request.headers.get("If-None-Match") == etags[fmt]:
+            response = web.Response(status=304, headers={"ETag": etags[fmt]})
+        else:
+            response = web.Response(body=bodies[fmt], content_type="application/json", headers={"ETag": etags[fmt]})
+            if config.compress:
+                response.enable_compression()
+        stats.statuses[response.status] += 1
+        return response
+
+    app = web.Application()
+    app.router.add_get("/{location:.*}", weather)
+    return app
+
+
+class MockWttrServer:
+    """Runs the mock app on its own event loop in a background thread.
+
+    Usable from sync and async code alike::
+
+        with MockWttrServer(MockConfig(latency=0.05)) as server:
+            client = SkyPulse(api_url=server.url)
+    """
+
+    def __init__(self, config: Optional[MockConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or MockConfig()
+        self.stats = MockStats()
+        self.host = host
+        self.port = port
+        self.url: Optional[str] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> str:
+        """Start serving and return the base URL."""
+        ready = threading.Event()
+        errors = []
+
+        def serve():
+            self._loop = asyncio.new_event_loop()
+            try:
+                self._runner = web.AppRunner(create_app(self.config, self.stats), access_log=None)
+                self._loop.run_until_complete(self._runner.setup())
+                site = web.TCPSite(self._runner, self.host, self.port)
+                self._loop.run_until_complete(site.start())
+                self.port = self._runner.addresses[0][1]
+                self.url = f"http://{self.host}:{self.port}"
+            except Exception as e:
+                errors.append(e)
+                ready.set()
+                return
+            ready.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self._runner.cleanup())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=serve, name="mock-wttr", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if errors:
+            raise errors[0]
+        return self.url
+
+    def stop(self) -> None:
+        """Stop serving and wait for the server thread to exit."""
+        if self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+async def serve(config: MockConfig, host: str, port: int) -> None:
+    """Serve until cancelled, announcing the URL on the first line of stdout."""
+    runner = web.AppRunner(create_app(config), access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    print(f"http://{host}:{runner.addresses[0][1]}", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for wttr.in serving recorded fixtures.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000, help="0 picks a free port")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--no-compress", action="store_true")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = MockConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        compress=not args.no_compress,
+        seed=args.seed,
+    )
+    try:
+        asyncio.run(serve(config, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -63,6 +63,19 @@ setup(
         "typer>=0.9.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.8.0",
+            "Brotli>=1.0.9",
+        ],
+        "arrow": [
+            "pyarrow>=8.0.0",
+        ],
+        "prometheus": [
+            "prometheus-client>=0.14.0",
+        ],
+        "opentelemetry": [
+            "opentelemetry-api>=1.12.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -1,11 +1,31 @@
 """SkyPulse Weather Data Package."""
 
 from .version import __version__, __prog__
-from .client import SkyPulse, SkyPulseError, APIError, LocationError
+from .client import SkyPulse, SkyPulseError, APIError, LocationError, RateLimitError, TransportError, CircuitOpenError
+from .cache import ResponseCache, DiskCache, CacheStats, ValidatorStore
+from .transport import TransportConfig
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .breaker import CircuitBreaker
+from .endpoints import EndpointPool
+from .metrics import Metrics, MetricsHook, RequestTrace, PrometheusHook, OpenTelemetryHook
+from .columnar import ColumnarView, SeriesTable
+from .export import (
+    CSVExporter,
+    JSONExporter,
+    NDJSONExporter,
+    ArrowExporter,
+    ParquetExporter,
+    export_records,
+    get_exporter,
+)
+from .units import UnitConverter, convert_values
 from .models import (
     WttrResponse,
+    LazyWttrResponse,
     CurrentCondition,
     Weather,
+    Hourly,
     NearestArea,
     WeatherDesc,
     WeatherIconUrl,
@@ -15,7 +35,13 @@ from .models import (
     WeatherUrl,
     Request,
     Astronomy,
-    UnitPreferences
+    UnitPreferences,
+    CompactValue,
+    CompactAstronomy,
+    CompactCurrentCondition,
+    CompactHourly,
+    CompactNearestArea,
+    CompactWeather,
 )
 
 __all__ = [
@@ -24,11 +50,36 @@ __all__ = [
     "SkyPulseError",
     "APIError",
     "LocationError",
+    "RateLimitError",
+    "TransportError",
+    "CircuitOpenError",
+
+    # Caching
+    "ResponseCache",
+    "DiskCache",
+    "CacheStats",
+    "ValidatorStore",
+
+    # Transport
+    "TransportConfig",
+    "RateLimiter",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "EndpointPool",
+
+    # Instrumentation
+    "Metrics",
+    "MetricsHook",
+    "RequestTrace",
+    "PrometheusHook",
+    "OpenTelemetryHook",
     
     # Model classes
     "WttrResponse",
+    "LazyWttrResponse",
     "CurrentCondition",
     "Weather",
+    "Hourly",
     "NearestArea",
     "WeatherDesc",
     "WeatherIconUrl",
@@ -39,6 +90,29 @@ __all__ = [
     "Request",
     "Astronomy",
     "UnitPreferences",
+    "CompactValue",
+    "CompactAstronomy",
+    "CompactCurrentCondition",
+    "CompactHourly",
+    "CompactNearestArea",
+    "CompactWeather",
+
+    # Columnar views
+    "ColumnarView",
+    "SeriesTable",
+
+    # Streaming export
+    "CSVExporter",
+    "JSONExporter",
+    "NDJSONExporter",
+    "ArrowExporter",
+    "ParquetExporter",
+    "export_records",
+    "get_exporter",
+
+    # Unit conversion
+    "UnitConverter",
+    "convert_values",
     
     # Version info
     "__version__",
@@ -0,0 +1,110 @@
+"""Circuit breaking for SkyPulse upstream hosts."""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+@dataclass
+class CircuitState:
+    """Breaker state of one upstream host."""
+    state: str = CLOSED
+    failures: int = 0  # Consecutive failures while closed
+    opened_at: float = 0.0  # When the circuit opened or the last probe was let through
+    trips: int = 0  # Times the circuit has opened
+
+class CircuitBreaker:
+    """Per-host circuit breaker shared by every request of one or more clients.
+
+    A host's circuit opens after ``failure_threshold`` consecutive failures
+    (connection errors, timeouts and 5xx responses); requests to it then
+    fail immediately. After ``recovery_timeout`` seconds a single probe
+    request is let through (half-open): success closes the circuit, failure
+    opens it again for another ``recovery_timeout``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        fallback_to_cache: bool = True,
+    ):
+        """Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open a circuit.
+            recovery_timeout: Seconds an open circuit waits before probing.
+            fallback_to_cache: Let clients answer from cached (including
+                stale) payloads while a circuit is open.
+
+        Raises:
+            ValueError: If failure_threshold or recovery_timeout is not positive.
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if recovery_timeout <= 0:
+            raise ValueError("recovery_timeout must be positive")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.fallback_to_cache = fallback_to_cache
+        self._circuits: Dict[str, CircuitState] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, host: str) -> bool:
+        """Return True if a request to host may be sent now."""
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None or circuit.state == CLOSED:
+                return True
+            now = time.monotonic()
+            if now - circuit.opened_at < self.recovery_timeout:
+                return False
+            # Let one probe through; another follows if it never reports back
+            circuit.state = HALF_OPEN
+            circuit.opened_at = now
+            return True
+
+    def record_success(self, host: str) -> None:
+        """Report a successful request, closing the host's circuit."""
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is not None:
+                circuit.state = CLOSED
+                circuit.failures = 0
+
+    def record_failure(self, host: str) -> None:
+        """Report a failed request, opening the circuit once the threshold is reached."""
+        with self._lock:
+            circuit = self._circuits.setdefault(host, CircuitState())
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+                if circuit.state != OPEN:
+                    circuit.trips += 1
+                circuit.state = OPEN
+                circuit.opened_at = time.monotonic()
+
+    def state(self, host: str) -> str:
+        """Return "closed", "open" or "half-open" for host."""
+        with self._lock:
+            circuit = self._circuits.get(host)
+            return CLOSED if circuit is None else circuit.state
+
+    def retry_in(self, host: str) -> Optional[float]:
+        """Return seconds until host's open circuit lets a probe through, or None if not open."""
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None or circuit.state == CLOSED:
+                return None
+            return max(0.0, circuit.opened_at + self.recovery_timeout - time.monotonic())
+
+    def reset(self, host: Optional[str] = None) -> None:
+        """Close one host's circuit, or all circuits."""
+        with self._lock:
+            if host is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(host, None)
@@ -0,0 +1,364 @@
+"""Response caching for SkyPulse."""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple, Hashable
+
+from .decoders import loads
+
+CacheKey = Tuple[Hashable, ...]
+
+@dataclass
+class CacheStats:
+    """Hit/miss statistics for a response cache."""
+    hits: int = 0
+    misses: int = 0
+    stale_hits: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def lookups(self) -> int:
+        """Total number of cache lookups."""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+class ResponseCache:
+    """In-memory TTL cache with LRU eviction for raw API payloads.
+
+    The cache is safe to share between threads and between several
+    SkyPulse clients; entries are keyed on the full request identity.
+    Expired entries are kept for ``stale_ttl`` more seconds so a client
+    can serve them while it revalidates in the background.
+    """
+
+    def __init__(self, ttl: float = 300.0, maxsize: int = 1024, stale_ttl: float = 0.0):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays fresh. Defaults to 5 minutes.
+            maxsize: Maximum number of entries before the least recently
+                used one is evicted. Defaults to 1024.
+            stale_ttl: Seconds past ``ttl`` during which an entry may still
+                be served stale. Defaults to 0 (disabled).
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if stale_ttl < 0:
+            raise ValueError("stale_ttl must not be negative")
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.stale_ttl = stale_ttl
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(base_url: str, location: str, format: str, params: Dict[str, Any]) -> CacheKey:
+        """Build a cache key from the request identity."""
+        return (base_url, location, format, tuple(sorted(params.items())))
+
+    def get(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        """Return the cached payload for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            expires_at, value = entry
+            now = time.monotonic()
+            if expires_at <= now:
+                if expires_at + self.stale_ttl <= now:
+                    del self._entries[key]
+                    self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def get_stale(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        """Return an expired payload still inside the stale window, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at + self.stale_ttl <= time.monotonic():
+                return None
+            self.stats.stale_hits += 1
+            return value
+
+    def set(self, key: CacheKey, value: Dict[str, Any]) -> None:
+        """Store a payload, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def invalidate(self, key: CacheKey) -> None:
+        """Remove a single entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: CacheKey) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+
+
+class DiskCache:
+    """SQLite-backed payload cache that survives restarts.
+
+    Payloads are stored as JSON bytes together with their fetch timestamp:
+    the raw response body when the client has one, re-encoded JSON
+    otherwise (e.g. a payload reused after a 304). The database uses WAL
+    journaling, so several worker processes on one host can point at the
+    same file and share fetched results.
+
+    Background revalidation of stale entries is coordinated per process:
+    each client refreshes a stale key at most once at a time, but several
+    processes sharing the file may each refresh the same key.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = 300.0,
+        stale_ttl: float = 3600.0,
+        maxsize: Optional[int] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: Path of the SQLite database file. Created if missing.
+            ttl: Seconds an entry stays fresh. Defaults to 5 minutes.
+            stale_ttl: Seconds past ``ttl`` during which an entry may still
+                be served stale. Defaults to 1 hour.
+            maxsize: Optional maximum number of entries; the oldest fetches
+                are pruned when it is exceeded.
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if stale_ttl < 0:
+            raise ValueError("stale_ttl must not be negative")
+        self.path = path
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.maxsize = maxsize
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, fetched_at REAL NOT NULL, payload BLOB NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_fetched_at ON responses(fetched_at)")
+
+    @staticmethod
+    def _encode_key(key: CacheKey) -> str:
+        return json.dumps(key, separators=(",", ":"))
+
+    def _load(self, key: CacheKey) -> Optional[Tuple[float, bytes]]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT fetched_at, payload FROM responses WHERE key = ?",
+                (self._encode_key(key),),
+            ).fetchone()
+
+    def get(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        """Return the cached payload for key, or None if missing or expired."""
+        row = self._load(key)
+        if row is None or row[0] + self.ttl <= time.time():
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return loads(row[1])
+
+    def get_stale(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        """Return an expired payload still inside the stale window, or None."""
+        row = self._load(key)
+        if row is None or row[0] + self.ttl + self.stale_ttl <= time.time():
+            return None
+        self.stats.stale_hits += 1
+        return loads(row[1])
+
+    def age(self, key: CacheKey) -> Optional[float]:
+        """Return seconds since the entry was fetched, or None if missing."""
+        row = self._load(key)
+        return None if row is None else time.time() - row[0]
+
+    def set(self, key: CacheKey, value: Dict[str, Any], raw: Optional[bytes] = None) -> None:
+        """Store a payload with the current time as its fetch timestamp.
+
+        Args:
+            key: Cache key.
+            value: Decoded payload.
+            raw: The JSON body value was decoded from; stored as is instead
+                of re-encoding value.
+        """
+        payload = raw if raw is not None else json.dumps(value, separators=(",", ":")).encode("utf-8")
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, fetched_at, payload) VALUES (?, ?, ?)",
+                (self._encode_key(key), time.time(), payload),
+            )
+            if self.maxsize is not None:
+                pruned = self._conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "SELECT key FROM responses ORDER BY fetched_at DESC LIMIT -1 OFFSET ?)",
+                    (self.maxsize,),
+                ).rowcount
+                self.stats.evictions += max(pruned, 0)
+
+    def invalidate(self, key: CacheKey) -> None:
+        """Remove a single entry if present."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (self._encode_key(key),))
+
+    def purge(self) -> int:
+        """Delete entries that are past their stale window. Returns the count."""
+        cutoff = time.time() - self.ttl - self.stale_ttl
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM responses WHERE fetched_at <= ?", (cutoff,)).rowcount
+        self.stats.expirations += max(removed, 0)
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+        self.stats = CacheStats()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def __contains__(self, key: CacheKey) -> bool:
+        row = self._load(key)
+        return row is not None and row[0] + self.ttl > time.time()
+
+
+@dataclass
+class Validated:
+    """Validators and decoded results remembered for one request."""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    digest: bytes
+    stamp: Optional[Tuple[str, str]]
+    payload: Dict[str, Any]
+    response: Any = None
+
+class ValidatorStore:
+    """LRU store of per-request validators for conditional GETs.
+
+    Besides ETag/Last-Modified it keeps a digest of the last body and its
+    observation stamp, so unchanged payloads are recognised even when the
+    upstream sends no validators (the stamp is only compared for responses
+    without ETag/Last-Modified), and the parsed response can be reused.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        """Initialize the store.
+
+        Args:
+            maxsize: Maximum number of requests remembered. Defaults to 4096.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.not_modified = 0
+        self.unchanged = 0
+        self._entries: "OrderedDict[CacheKey, Validated]" = OrderedDict()
+        self._by_payload: Dict[int, CacheKey] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey) -> Optional[Validated]:
+        """Return the entry for key, if any."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def headers(self, key: CacheKey) -> Dict[str, str]:
+        """Return conditional request headers for key."""
+        entry = self.get(key)
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(self, key: CacheKey, entry: Validated) -> None:
+        """Remember entry for key, evicting the least recently used one if full."""
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None and previous.payload is not entry.payload:
+                self._by_payload.pop(id(previous.payload), None)
+            self._entries[key] = entry
+            self._by_payload[id(entry.payload)] = key
+            while len(self._entries) > self.maxsize:
+                _, evicted = self._entries.popitem(last=False)
+                self._by_payload.pop(id(evicted.payload), None)
+
+    def response_for(self, payload: Dict[str, Any]) -> Any:
+        """Return the parsed response remembered for this exact payload object."""
+        with self._lock:
+            key = self._by_payload.get(id(payload))
+            entry = self._entries.get(key) if key is not None else None
+            if entry is None or entry.payload is not payload:
+                return None
+            return entry.response
+
+    def remember_response(self, payload: Dict[str, Any], response: Any) -> None:
+        """Attach a parsed response to the entry holding payload."""
+        with self._lock:
+            key = self._by_payload.get(id(payload))
+            entry = self._entries.get(key) if key is not None else None
+            if entry is not None and entry.payload is payload:
+                entry.response = response
+
+    def forget_responses(self) -> None:
+        """Drop the parsed responses, keeping validators and payloads."""
+        with self._lock:
+            for entry in self._entries.values():
+                entry.response = None
+
+    def clear(self) -> None:
+        """Forget all validators."""
+        with self._lock:
+            self._entries.clear()
+            self._by_payload.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
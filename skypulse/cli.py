@@ -4,22 +4,21 @@ import sys
 import json
 import locale
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import TYPE_CHECKING, IO, Optional, Dict, Any, Iterable, Iterator, List, TextIO, Tuple, Union
 from pathlib import Path
 
 import typer
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.columns import Columns
-from rich import print as rprint
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.markdown import Markdown
-from rich.live import Live
 
 from .client import SkyPulse, SkyPulseError
+from .transport import TransportConfig
 from .version import __version__, __prog__
-from .ai_weather import WeatherAnalyzer
+
+# Heavier modules (rich renderables, openai via ai_weather) are imported
+# inside the commands that use them, keeping CLI startup fast.
+if TYPE_CHECKING:
+    from rich.panel import Panel
+    from rich.table import Table
 
 # Configure console for proper Unicode handling
 if sys.platform == "win32":
@@ -38,8 +37,10 @@ def version_callback(value: bool):
         console.print(f"{__prog__} version: [cyan]{__version__}[/]")
         raise typer.Exit()
 
-def create_weather_table(data: Dict[str, Any], location: str) -> Table:
+def create_weather_table(data: Dict[str, Any], location: str) -> "Table":
     """Create a formatted table for weather data."""
+    from rich.table import Table
+
     table = Table(title=f"Weather in {location}", show_header=True, border_style="cyan")
     table.add_column("Metric", style="cyan", justify="right")
     table.add_column("Value", style="green", justify="left")
@@ -50,8 +51,10 @@ def create_weather_table(data: Dict[str, Any], location: str) -> Table:
     
     return table
 
-def format_current_weather(current, location: str) -> Panel:
+def format_current_weather(current, location: str) -> "Panel":
     """Format current weather data into a rich panel."""
+    from rich.panel import Panel
+
     weather_data = {
         "Temperature": f"{current.temperature_c}°C ({current.temperature_f}°F)",
         "Feels Like": f"{current.feels_like_c}°C ({current.feels_like_f}°F)",
@@ -67,8 +70,10 @@ def format_current_weather(current, location: str) -> Panel:
     table = create_weather_table(weather_data, location)
     return Panel(table, title="[bold cyan]Current Weather[/]", border_style="blue")
 
-def format_forecast_day(day, detailed: bool = False) -> Panel:
+def format_forecast_day(day, detailed: bool = False) -> "Panel":
     """Format forecast day data into a rich panel."""
+    from rich.panel import Panel
+
     forecast_data = {
         "Temperature": f"{day.min_temp_c}°C to {day.max_temp_c}°C",
         "Condition": day.condition.description if hasattr(day, 'condition') else "N/A",
@@ -86,29 +91,47 @@ def format_forecast_day(day, detailed: bool = False) -> Panel:
     table = create_weather_table(forecast_data, day.date)
     return Panel(table, title=f"[bold magenta]Forecast for {day.date}[/]", border_style="magenta")
 
-def export_data(data: Dict[str, Any], format: str, filename: Optional[str] = None):
-    """Export weather data to file."""
+def export_data(
+    data: Union[Dict[str, Any], Iterable[Dict[str, Any]]],
+    format: str,
+    filename: Optional[str] = None,
+    schema: Optional[Dict[str, type]] = None,
+) -> Path:
+    """Export weather data to file.
+
+    A single dict is written as one record (pretty-printed in json format).
+    An iterable of flat records is streamed to the file one record, or one
+    record batch for parquet/arrow, at a time; see ``skypulse.export``.
+    """
+    from .export import export_records
+
     if not filename:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"weather_data_{timestamp}.{format}"
-    
+
     filepath = Path(filename)
-    if format == "json":
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
-    else:
-        raise ValueError(f"Unsupported export format: {format}")
-    
+    if isinstance(data, dict):
+        if format == "json":
+            with open(filepath, 'w') as f:
+                json.dump(data, f, indent=2)
+            console.print(f"✓ Data exported to {filepath}", style="green")
+            return filepath
+        data = [data]
+    export_records(data, format, filepath, schema)
+
     console.print(f"✓ Data exported to {filepath}", style="green")
+    return filepath
 
 @app.command()
 def current(
     location: str = typer.Option(None, "--location", "-l", help="Location for weather data"),
     api_key: str = typer.Option(None, "--api-key", "-k", help="API key for weather service", envvar="SKYPULSE_API_KEY"),
-    export: str = typer.Option(None, "--export", "-e", help="Export data (json)"),
+    export: str = typer.Option(None, "--export", "-e", help="Export data (json, ndjson, csv, parquet, arrow)"),
     version: bool = typer.Option(None, "--version", "-v", callback=version_callback, is_eager=True, help="Show version and exit"),
 ):
     """Get current weather conditions."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     try:
         with Progress(
             SpinnerColumn(),
@@ -139,9 +162,12 @@ def forecast(
     api_key: str = typer.Option(None, "--api-key", "-k", help="API key for weather service", envvar="SKYPULSE_API_KEY"),
     days: int = typer.Option(3, "--days", "-d", help="Number of forecast days"),
     detailed: bool = typer.Option(False, "--detailed", help="Show detailed information"),
-    export: str = typer.Option(None, "--export", "-e", help="Export data (json)"),
+    export: str = typer.Option(None, "--export", "-e", help="Export data (json, ndjson, csv, parquet, arrow)"),
 ):
     """Get weather forecast."""
+    from rich.columns import Columns
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     try:
         with Progress(
             SpinnerColumn(),
@@ -153,7 +179,7 @@ def forecast(
             forecast = client.get_forecast(location, days=days)
             loc = f"{forecast.location.name}, {forecast.location.country}"
         
-        panels: List[Panel] = []
+        panels: List["Panel"] = []
         for day in forecast.days[:days]:
             panels.append(format_forecast_day(day, detailed))
         
@@ -177,6 +203,9 @@ def analyze(
     openai_api_key: str = typer.Option(None, "--openai-key", help="OpenAI API key", envvar="OPENAI_API_KEY"),
 ):
     """Get AI-powered weather analysis and insights."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from .ai_weather import WeatherAnalyzer
+
     try:
         with Progress(
             SpinnerColumn(),
@@ -198,6 +227,91 @@ def analyze(
         console.print(f"[red]Error:[/] {str(e)}")
         raise typer.Exit(1)
 
+def read_locations(source: TextIO) -> Iterator[str]:
+    """Yield locations from a text stream, one per line, skipping blanks and # comments."""
+    for line in source:
+        location = line.strip()
+        if location and not location.startswith("#"):
+            yield location
+
+def write_batch(
+    results: Iterable[Tuple[str, Any]],
+    output: Union[IO, Path],
+    format: str = "ndjson",
+    series: str = "current",
+) -> Tuple[int, int]:
+    """Stream batch results to output as they arrive.
+
+    Args:
+        results: ``(location, response_or_error)`` pairs, e.g. from fetch_many.
+        output: Path or open stream (binary for parquet/arrow) to write to.
+        format: Any format of ``skypulse.export.EXPORTERS``.
+        series: "current", "hourly" or "daily" rows.
+
+    Returns:
+        Number of successful and failed locations.
+    """
+    from .export import SERIES, get_exporter
+
+    records, schema = SERIES[series]
+    outcomes = {"succeeded": 0, "failed": 0}
+
+    def counted():
+        for location, result in results:
+            outcomes["failed" if isinstance(result, Exception) else "succeeded"] += 1
+            yield location, result
+
+    with get_exporter(format, output, schema) as exporter:
+        exporter.write_many(records(counted()))
+    return outcomes["succeeded"], outcomes["failed"]
+
+@app.command()
+def batch(
+    input: Optional[Path] = typer.Argument(
+        None, exists=True, dir_okay=False, allow_dash=True,
+        help="File with one location per line; stdin when omitted or '-'",
+    ),
+    format: str = typer.Option("ndjson", "--format", "-f", help="Output format (ndjson, csv, json, parquet, arrow)"),
+    series: str = typer.Option("current", "--series", "-s", help="Rows to write (current, hourly, daily)"),
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Write to a file instead of stdout"),
+    concurrency: int = typer.Option(8, "--concurrency", "-c", min=1, help="Maximum concurrent requests"),
+    timeout: Optional[float] = typer.Option(None, "--timeout", "-t", help="Per-request timeout in seconds"),
+    ordered: bool = typer.Option(False, "--ordered", help="Keep input order instead of completion order"),
+    api_url: Optional[List[str]] = typer.Option(None, "--api-url", help="API endpoint; repeat to balance across mirrors"),
+):
+    """Fetch weather for many locations and stream the results as rows."""
+    from .export import EXPORTERS, SERIES
+
+    errors = Console(stderr=True)
+    if format not in EXPORTERS:
+        errors.print(f"[red]Error:[/] Unsupported batch format: {format}")
+        raise typer.Exit(2)
+    if series not in SERIES:
+        errors.print(f"[red]Error:[/] Unknown series: {series}")
+        raise typer.Exit(2)
+
+    source = sys.stdin if input is None or str(input) == "-" else open(input, encoding="utf-8")
+    if output is not None:
+        sink: Union[IO, Path] = output
+    else:
+        sink = sys.stdout.buffer if EXPORTERS[format].binary else sys.stdout
+    # One pooled client for the whole batch; payloads are read without building models
+    transport = TransportConfig(pool_maxsize=max(concurrency, TransportConfig.pool_maxsize))
+    try:
+        with SkyPulse(api_url=api_url or None, transport=transport, lazy=True) as client:
+            results = client.fetch_many(read_locations(source), concurrency=concurrency, timeout=timeout, ordered=ordered)
+            succeeded, failed = write_batch(results, sink, format, series)
+    except ImportError as e:
+        errors.print(f"[red]Error:[/] {e}")
+        raise typer.Exit(2)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+    errors.print(f"{succeeded} succeeded, {failed} failed", style="red" if failed else "green")
+    if failed:
+        raise typer.Exit(1)
+
 def main():
     """Main entry point for the CLI."""
     try:
@@ -1,13 +1,30 @@
 """SkyPulse client implementation."""
 
-import aiohttp
 import requests
-from typing import Dict, Any, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Union, Iterable, Iterator, AsyncIterator, Tuple, Sequence
 from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from collections import deque
+from itertools import islice
 import asyncio
+import hashlib
+import threading
+import time
 
 from .version import __version__
 from .models import WttrResponse, CurrentCondition, Weather, NearestArea, UnitPreferences
+from .cache import ResponseCache, DiskCache, ValidatorStore, Validated
+from .transport import TransportConfig, create_session, create_connector, create_client_timeout, default_headers, session_headers
+from .decoders import JSONDecoder, get_decoder
+from .units import UnitConverter
+from .ratelimit import RateLimiter, parse_retry_after
+from .retry import RetryPolicy, LatencyTracker
+from .breaker import CircuitBreaker
+from .endpoints import EndpointPool
+from .metrics import Metrics, RequestTrace, aiohttp_trace_config
+
+if TYPE_CHECKING:  # aiohttp is imported on first async use, keeping sync startup light
+    import aiohttp
 
 class SkyPulseError(Exception):
     """Base exception for SkyPulse errors."""
@@ -15,73 +32,357 @@ class SkyPulseError(Exception):
 
 class APIError(SkyPulseError):
     """API related errors."""
-    pass
+
+    def __init__(self, message: str = "", status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status  # HTTP status of the failed response, if any
 
 class LocationError(SkyPulseError):
     """Location related errors."""
     pass
 
+class RateLimitError(APIError):
+    """The API throttled the request (HTTP 429, or 503 with Retry-After)."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None, status: int = 429):
+        super().__init__(message, status)
+        self.retry_after = retry_after
+
+class TransportError(APIError):
+    """The API could not be reached: connection failure, reset or timeout."""
+    pass
+
+class CircuitOpenError(APIError):
+    """The request was not sent because the host's circuit breaker is open."""
+
+    def __init__(self, message: str, retry_in: Optional[float] = None):
+        super().__init__(message)
+        self.retry_in = retry_in  # Seconds until the breaker lets a probe through
+
 class SkyPulse:
     """Main SkyPulse client with both sync and async support."""
 
     DEFAULT_API_URL = "https://wttr.in"
     USER_AGENT = f"SkyPulse-Python/{__version__}"
 
-    def __init__(self, api_url: Optional[str] = None, async_mode: bool = False, format: str = "j1"):
+    def __init__(
+        self,
+        api_url: Optional[Union[str, Sequence[str], EndpointPool]] = None,
+        async_mode: bool = False,
+        format: str = "j1",
+        cache: Optional[Union[ResponseCache, DiskCache]] = None,
+        transport: Optional[TransportConfig] = None,
+        session: Optional[requests.Session] = None,
+        connector: Optional["aiohttp.BaseConnector"] = None,
+        lazy: bool = False,
+        compact: bool = False,
+        typed: bool = False,
+        json_decoder: Optional[Union[str, JSONDecoder]] = None,
+        conditional: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        load_balancing: str = "round_robin",
+        metrics: Optional[Metrics] = None,
+    ):
         """Initialize SkyPulse client.
 
         Args:
             api_url: Base URL for the SkyPulse API. Defaults to the public endpoint.
+                A list of URLs (or an EndpointPool) spreads requests across
+                interchangeable mirrors and fails over between them.
             async_mode: Whether to use async client. Defaults to False.
             format: API response format, either "j1" or "j2". Defaults to "j1".
+            cache: Optional response cache shared by all lookups. Any object
+                with ResponseCache's get/set interface can be used; caches that
+                also provide get_stale are served stale-while-revalidate.
+            transport: Connection pool, keep-alive and timeout settings.
+                Defaults to TransportConfig().
+            session: Optional requests session to share between clients in
+                sync mode. It is not closed or modified by this client; the
+                client's User-Agent, Accept-Encoding and keep-alive headers are
+                sent with each request instead.
+            connector: Optional aiohttp connector to share between clients in
+                async mode. It is not closed by this client.
+            lazy: Decode response sections only when they are first accessed.
+            compact: Build slotted, memory-compact models (CompactCurrentCondition,
+                CompactWeather, ...) with the same attribute API.
+            typed: Decode numeric readings (temp_C, humidity, maxtempC, ...)
+                to int/float once instead of keeping the API's strings.
+            json_decoder: Callable decoding raw response bytes, or the name of
+                a JSON library ("orjson", "ujson", "json"). Defaults to the
+                fastest installed library.
+            conditional: Remember ETag/Last-Modified validators per request and
+                send conditional GETs. A 304, an identical body, or (for responses
+                without validators) an unchanged observation time reuses the
+                previous payload and parsed response.
+            rate_limiter: Optional RateLimiter every request waits on. It backs
+                off when the API answers 429/503 and may be shared between
+                clients (and, with a state file, between processes).
+            retry: Optional RetryPolicy for transient failures (connection
+                errors, timeouts, 429 and 5xx responses), including hedged
+                async requests.
+            circuit_breaker: Optional CircuitBreaker keyed on the API URL. While
+                a host's circuit is open, requests fail fast with
+                CircuitOpenError or are answered from cached data.
+            load_balancing: How requests are spread over several endpoints,
+                "round_robin" or "least_latency".
+            metrics: Optional Metrics recording per-request phase timings,
+                decode and model-build times, cache/retry/error counters and
+                in-flight requests, and forwarding them to its hooks.
         """
-        self.base_url = api_url or self.DEFAULT_API_URL
+        if isinstance(api_url, (list, tuple)):
+            api_url = EndpointPool(api_url, load_balancing)
+        self.endpoints = api_url if isinstance(api_url, EndpointPool) else None
+        # Cache and validator keys use the first endpoint, so mirrors share entries
+        self.base_url = self.endpoints.urls[0] if self.endpoints is not None else api_url or self.DEFAULT_API_URL
         self.async_mode = async_mode
         self.format = format
+        self.cache = cache
+        self.transport = transport or TransportConfig()
+        self.lazy = lazy
+        self.compact = compact
+        self.typed = typed
+        self.json_decoder = json_decoder if callable(json_decoder) else get_decoder(json_decoder)
+        self.validators = ValidatorStore() if conditional else None
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.metrics = metrics
+        self.latency = LatencyTracker()
+        self.hedged = 0  # Hedge requests fired
         if format not in ["j1", "j2"]:
             raise ValueError("Format must be either 'j1' or 'j2'")
         
+        self._headers = default_headers(self.transport, self.USER_AGENT)
+
         # Sync client
+        self._owns_session = session is None
         if not async_mode:
-            self.session = requests.Session()
-            self.session.headers.update({"User-Agent": self.USER_AGENT})
+            self.session = session or create_session(self.transport, self._headers)
+        # Sent with every sync request on an injected session, which keeps its own defaults
+        self._request_headers = None if self._owns_session else session_headers(self.transport, self._headers)
         
         # Async client
         self._async_session = None
-        self._headers = {"User-Agent": self.USER_AGENT}
-        self._unit_preferences = None
+        self._connector = connector
+        self.converter = UnitConverter()
+
+        # Background revalidation of stale cache entries
+        self._revalidating = set()
+        self._revalidate_lock = threading.Lock()
+        self._background_tasks = set()
+
+        # In-flight async requests, shared by identical concurrent lookups
+        self._inflight: Dict[Any, "asyncio.Future[Dict[str, Any]]"] = {}
 
     async def __aenter__(self):
         """Async context manager entry."""
         if self._async_session is None:
-            self._async_session = aiohttp.ClientSession(headers=self._headers)
+            import aiohttp
+
+            self._async_session = aiohttp.ClientSession(
+                headers=self._headers,
+                connector=self._connector or create_connector(self.transport),
+                connector_owner=self._connector is None,
+                timeout=create_client_timeout(self.transport),
+                trace_configs=[aiohttp_trace_config()] if self.metrics is not None else None,
+            )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
+        if self._background_tasks:
+            for task in list(self._background_tasks):
+                task.cancel()
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
         if self._async_session is not None:
             await self._async_session.close()
             self._async_session = None
 
-    def _make_request(self, location: str, **params) -> Dict[str, Any]:
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    @property
+    def is_open(self) -> bool:
+        """True while the async session is open (inside ``async with``)."""
+        return self._async_session is not None
+
+    def close(self) -> None:
+        """Close the sync session if this client created it."""
+        if self._owns_session and getattr(self, "session", None) is not None:
+            self.session.close()
+
+    def _make_request(self, location: str, timeout: Optional[float] = None, **params) -> Dict[str, Any]:
         """Make synchronous HTTP request to SkyPulse API."""
         params.update({
             "format": self.format
         })
-        
-        url = f"{self.base_url}/{location}"
+
+        cache_key = self._cache_key(location, params)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                if self.metrics is not None:
+                    self.metrics.count("cache_hit")
+                return cached
+            stale = self._get_stale(cache_key)
+            if stale is not None:
+                if self.metrics is not None:
+                    self.metrics.count("cache_stale")
+                self._revalidate(location, params, cache_key)
+                return stale
+            if self.metrics is not None:
+                self.metrics.count("cache_miss")
+
         try:
-            response = self.session.get(url, params=params)
+            data, body = self._fetch(location, params, timeout=timeout)
+        except CircuitOpenError:
+            data = self._fallback(location, params, cache_key)
+            if data is None:
+                raise
+            return data
+        if cache_key is not None:
+            self._store(cache_key, data, body)
+        return data
+
+    def _fetch(
+        self,
+        location: str,
+        params: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> Tuple[Dict[str, Any], Optional[bytes]]:
+        """Fetch and decode one payload from the API, bypassing the cache.
+
+        Returns:
+            The payload and the raw body it was decoded from; the body is
+            None when a 304 reused the previous payload.
+        """
+        key, headers = self._conditional_headers(location, params)
+        status, response_headers, body = self._request(location, params, timeout, headers)
+        if status == 304:
+            return self._not_modified(key), None
+        return self._decode_body(key, body, response_headers), body
+
+    def _request(
+        self,
+        location: str,
+        params: Dict[str, Any],
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[int, Any, bytes]:
+        """Send a GET to the API, retrying per the retry policy, and return (status, headers, body).
+
+        The body is returned as transferred, after transport decompression.
+        A 304 is only accepted when conditional headers were sent.
+        """
+        attempt = 1
+        while True:
+            try:
+                return self._send_with_failover(location, params, timeout, headers)
+            except Exception as e:  # The retry policy decides, including its retry_on types
+                delay = self.retry.delay_for(e, attempt) if self.retry is not None else None
+                if delay is None:
+                    raise
+                if self.metrics is not None:
+                    self.metrics.count("retry", type(e).__name__)
+            time.sleep(delay)
+            attempt += 1
+
+    def _send_with_failover(
+        self,
+        location: str,
+        params: Dict[str, Any],
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[int, Any, bytes]:
+        """Send one GET, moving on to the next endpoint when one is down or throttling."""
+        error = None
+        for host in self._hosts():
+            try:
+                self._check_circuit(host)
+                result = self._send(host, location, params, timeout, headers)
+            except SkyPulseError as e:
+                self._record_outcome(host, e)
+                if not _fails_over(e):
+                    raise
+                if error is None or isinstance(error, CircuitOpenError):
+                    error = e
+                continue
+            self._record_outcome(host, None)
+            return result
+        raise error
+
+    def _send(
+        self,
+        host: str,
+        location: str,
+        params: Dict[str, Any],
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[int, Any, bytes]:
+        """Send one GET to an endpoint, tracing it when metrics are enabled."""
+        if self.metrics is None:
+            return self._transfer(host, location, params, timeout, headers)
+        trace = self.metrics.request_started(host, location)
+        began = time.perf_counter()
+        try:
+            result = self._transfer(host, location, params, timeout, headers, trace)
+            trace.size = len(result[2])
+            return result
+        except BaseException as e:
+            trace.error = type(e).__name__
+            raise
+        finally:
+            trace.total = time.perf_counter() - began - (trace.wait or 0.0)
+            if trace.error is None and trace.ttfb is not None:
+                trace.body = max(0.0, trace.total - trace.ttfb)  # requests reads the body before returning
+            self.metrics.request_finished(trace)
+
+    def _transfer(
+        self,
+        host: str,
+        location: str,
+        params: Dict[str, Any],
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+        trace: Optional[RequestTrace] = None,
+    ) -> Tuple[int, Any, bytes]:
+        """Send one GET to an endpoint."""
+        url = f"{host}/{location}"
+        if self.rate_limiter is not None:
+            waited = self.rate_limiter.acquire()
+            if trace is not None:
+                trace.wait = waited
+        request_headers = headers
+        if self._request_headers is not None:
+            request_headers = dict(self._request_headers, **headers) if headers else self._request_headers
+        started = time.monotonic()
+        try:
+            response = self.session.get(url, params=params, timeout=timeout or self.transport.timeout, headers=request_headers)
+            if trace is not None:
+                trace.status = response.status_code
+                elapsed = getattr(response, "elapsed", None)
+                trace.ttfb = elapsed.total_seconds() if elapsed is not None else None
+            self._check_throttled(location, response.status_code, response.headers)
+            if headers is not None and response.status_code == 304:
+                return 304, response.headers, b""
             response.raise_for_status()
-            return response.json()
+            self._observe_latency(host, time.monotonic() - started)
+            return response.status_code, response.headers, response.content
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
                 raise LocationError(f"Invalid location: {location}")
-            raise APIError(f"API request failed: {e}")
+            raise APIError(f"API request failed: {e}", e.response.status_code)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            raise TransportError(f"Request failed: {e}")
         except requests.exceptions.RequestException as e:
             raise APIError(f"Request failed: {e}")
-        except ValueError as e:
-            raise APIError(f"Invalid JSON response: {e}")
 
     async def _make_request_async(self, location: str, **params) -> Dict[str, Any]:
         """Make asynchronous HTTP request to SkyPulse API."""
@@ -89,36 +390,492 @@ class SkyPulse:
             "format": self.format
         })
 
+        cache_key = self._cache_key(location, params)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                if self.metrics is not None:
+                    self.metrics.count("cache_hit")
+                return cached
+            stale = self._get_stale(cache_key)
+            if stale is not None:
+                if self.metrics is not None:
+                    self.metrics.count("cache_stale")
+                self._revalidate_async(location, params, cache_key)
+                return stale
+            if self.metrics is not None:
+                self.metrics.count("cache_miss")
+
+        try:
+            return await self._fetch_coalesced(location, params, cache_key)
+        except CircuitOpenError:
+            data = self._fallback(location, params, cache_key)
+            if data is None:
+                raise
+            return data
+
+    async def _fetch_coalesced(self, location: str, params: Dict[str, Any], cache_key) -> Dict[str, Any]:
+        """Fetch a payload, sharing one upstream request among identical concurrent callers.
+
+        The first caller starts the request; callers arriving while it is in
+        flight await the same future. The request is shielded so a cancelled
+        caller does not abort it for the others.
+        """
+        flight_key = ResponseCache.make_key(self.base_url, location, self.format, params)
+        task = self._inflight.get(flight_key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_store_async(location, params, cache_key))
+            self._inflight[flight_key] = task
+
+            def done(finished):
+                if self._inflight.get(flight_key) is finished:
+                    del self._inflight[flight_key]
+                if not finished.cancelled():
+                    finished.exception()  # Mark retrieved if every caller went away
+
+            task.add_done_callback(done)
+        elif self.metrics is not None:
+            self.metrics.count("coalesced")
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store_async(self, location: str, params: Dict[str, Any], cache_key) -> Dict[str, Any]:
+        data, body = await self._fetch_async(location, params)
+        if cache_key is not None:
+            self._store(cache_key, data, body)
+        return data
+
+    async def _fetch_async(self, location: str, params: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[bytes]]:
+        """Async counterpart of :meth:`_fetch`."""
+        key, headers = self._conditional_headers(location, params)
+        status, response_headers, body = await self._request_async(location, params, headers)
+        if status == 304:
+            return self._not_modified(key), None
+        return self._decode_body(key, body, response_headers), body
+
+    async def _request_async(
+        self,
+        location: str,
+        params: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[int, Any, bytes]:
+        """Async counterpart of :meth:`_request`, hedging slow attempts when enabled."""
         if not self._async_session:
             raise APIError("No active async session. Use 'async with' context manager.")
 
-        url = f"{self.base_url}/{location}"
+        attempt = 1
+        while True:
+            try:
+                return await self._send_with_failover_async(location, params, headers)
+            except Exception as e:
+                delay = self.retry.delay_for(e, attempt) if self.retry is not None else None
+                if delay is None:
+                    raise
+                if self.metrics is not None:
+                    self.metrics.count("retry", type(e).__name__)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send_with_failover_async(
+        self,
+        location: str,
+        params: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[int, Any, bytes]:
+        """Async counterpart of :meth:`_send_with_failover`.
+
+        A hedge request, when fired, goes to the next endpoint in line.
+        Each attempt's outcome is recorded against the endpoint it went to.
+        """
+        hosts = self._hosts()
+        error = None
+        for i, host in enumerate(hosts):
+            try:
+                self._check_circuit(host)
+                return await self._send_hedged_async(host, hosts[(i + 1) % len(hosts)], location, params, headers)
+            except SkyPulseError as e:
+                if not _fails_over(e):
+                    raise
+                if error is None or isinstance(error, CircuitOpenError):
+                    error = e
+        raise error
+
+    async def _send_hedged_async(
+        self,
+        host: str,
+        hedge_host: str,
+        location: str,
+        params: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[int, Any, bytes]:
+        """Send one request, racing a second one if it is slower than the hedge delay.
+
+        No hedge is sent while the hedge endpoint's circuit is open.
+        """
+        hedge_after = self._hedge_delay()
+        if hedge_after is None:
+            return await self._send_recorded_async(host, location, params, headers)
+
+        first = asyncio.ensure_future(self._send_recorded_async(host, location, params, headers))
+        pending = {first}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=hedge_after)
+            if not done and self._circuit_allows(hedge_host):
+                self.hedged += 1
+                if self.metrics is not None:
+                    self.metrics.count("hedge")
+                pending.add(asyncio.ensure_future(self._send_recorded_async(hedge_host, location, params, headers)))
+            error = None
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = error or task.exception()
+                if not pending:
+                    raise error
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _send_recorded_async(
+        self,
+        host: str,
+        location: str,
+        params: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[int, Any, bytes]:
+        """Send one GET to an endpoint, recording its outcome against that endpoint."""
         try:
-            async with self._async_session.get(url, params=params) as response:
+            result = await self._send_async(host, location, params, headers)
+        except SkyPulseError as e:
+            self._record_outcome(host, e)
+            raise
+        self._record_outcome(host, None)
+        return result
+
+    def _circuit_allows(self, host: str) -> bool:
+        """Return whether a request may be sent to an endpoint now."""
+        try:
+            self._check_circuit(host)
+        except CircuitOpenError:
+            return False
+        return True
+
+    def _hedge_delay(self) -> Optional[float]:
+        """Return how long to wait before hedging a request, or None not to hedge."""
+        if self.retry is None or not self.retry.hedge:
+            return None
+        if self.retry.hedge_delay is not None:
+            return self.retry.hedge_delay
+        if len(self.latency) < self.retry.hedge_min_samples:
+            return None
+        return self.latency.quantile(self.retry.hedge_quantile)
+
+    async def _send_async(
+        self,
+        host: str,
+        location: str,
+        params: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[int, Any, bytes]:
+        """Send one GET to an endpoint asynchronously, tracing it when metrics are enabled."""
+        if self.metrics is None:
+            return await self._transfer_async(host, location, params, headers)
+        trace = self.metrics.request_started(host, location)
+        began = time.perf_counter()
+        try:
+            result = await self._transfer_async(host, location, params, headers, trace)
+            trace.size = len(result[2])
+            return result
+        except BaseException as e:  # Including cancellation of a losing hedge
+            trace.error = type(e).__name__
+            raise
+        finally:
+            trace.total = time.perf_counter() - began - (trace.wait or 0.0)
+            self.metrics.request_finished(trace)
+
+    async def _transfer_async(
+        self,
+        host: str,
+        location: str,
+        params: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+        trace: Optional[RequestTrace] = None,
+    ) -> Tuple[int, Any, bytes]:
+        """Send one GET to an endpoint asynchronously."""
+        import aiohttp
+
+        url = f"{host}/{location}"
+        if self.rate_limiter is not None:
+            waited = await self.rate_limiter.acquire_async()
+            if trace is not None:
+                trace.wait = waited
+        started = time.monotonic()
+        # The trace is filled in by the session's aiohttp_trace_config
+        options = {"trace_request_ctx": trace} if trace is not None else {}
+        try:
+            async with self._async_session.get(url, params=params, headers=headers, **options) as response:
+                if trace is not None:
+                    trace.status = response.status
+                self._check_throttled(location, response.status, response.headers)
+                if headers is not None and response.status == 304:
+                    return 304, response.headers, b""
                 response.raise_for_status()
-                return await response.json()
+                if trace is not None:
+                    read_started = time.perf_counter()
+                    body = await response.read()
+                    trace.body = time.perf_counter() - read_started
+                else:
+                    body = await response.read()
+                self._observe_latency(host, time.monotonic() - started)
+                return response.status, response.headers, body
         except aiohttp.ClientResponseError as e:
             if e.status == 404:
                 raise LocationError(f"Invalid location: {location}")
-            raise APIError(f"API request failed: {e}")
+            raise APIError(f"API request failed: {e}", e.status)
+        except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError) as e:
+            raise TransportError(f"Request failed: {str(e) or type(e).__name__}")
         except aiohttp.ClientError as e:
             raise APIError(f"Request failed: {e}")
+
+    def _hosts(self) -> List[str]:
+        """Return the endpoints to try for the next request, in order."""
+        return self.endpoints.order() if self.endpoints is not None else [self.base_url]
+
+    def _observe_latency(self, host: str, seconds: float) -> None:
+        self.latency.record(seconds)
+        if self.endpoints is not None:
+            self.endpoints.record_success(host, seconds)
+
+    def _check_circuit(self, host: str) -> None:
+        """Raise CircuitOpenError if the breaker does not let a request to host through."""
+        breaker = self.circuit_breaker
+        if breaker is not None and not breaker.allow(host):
+            raise CircuitOpenError(f"Circuit open for {host}; failing fast", breaker.retry_in(host))
+
+    def _record_outcome(self, host: str, error: Optional[Exception]) -> None:
+        """Report a request outcome to the circuit breaker and endpoint pool.
+
+        Connection errors, timeouts and 5xx responses count as failures;
+        throttling is left to the rate limiter and counts as neither.
+        """
+        if isinstance(error, (RateLimitError, CircuitOpenError)):
+            return
+        outage = _is_outage(error)
+        if outage and self.endpoints is not None:
+            self.endpoints.record_failure(host)
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            if outage:
+                breaker.record_failure(host)
+            else:
+                breaker.record_success(host)
+
+    def _fallback(self, location: str, params: Dict[str, Any], cache_key) -> Optional[Dict[str, Any]]:
+        """Return the last known payload for a request while its circuit is open."""
+        if self.metrics is not None:
+            self.metrics.count("circuit_open")
+        if not self.circuit_breaker.fallback_to_cache:
+            return None
+        payload = None
+        if cache_key is not None:
+            payload = self._get_stale(cache_key)
+        if payload is None and self.validators is not None:
+            entry = self.validators.get(ResponseCache.make_key(self.base_url, location, self.format, params))
+            if entry is not None:
+                payload = entry.payload
+        if payload is not None and self.metrics is not None:
+            self.metrics.count("fallback")
+        return payload
+
+    def _check_throttled(self, location: str, status: int, headers) -> None:
+        """Feed the rate limiter and raise RateLimitError for throttled responses."""
+        retry_after = parse_retry_after(headers.get("Retry-After")) if status in (429, 503) else None
+        if status == 429 or retry_after is not None:
+            if self.rate_limiter is not None:
+                self.rate_limiter.backoff(retry_after)
+            raise RateLimitError(f"Rate limited by API (HTTP {status}): {location}", retry_after, status)
+        if self.rate_limiter is not None and status < 400:
+            self.rate_limiter.record_success()
+
+    def _conditional_headers(self, location: str, params: Dict[str, Any]):
+        """Return the validator key and conditional headers for a request."""
+        if self.validators is None:
+            return None, None
+        key = ResponseCache.make_key(self.base_url, location, self.format, params)
+        return key, self.validators.headers(key) or None
+
+    def _not_modified(self, key) -> Dict[str, Any]:
+        """Return the remembered payload after a 304 response."""
+        entry = self.validators.get(key)
+        if entry is None:
+            raise APIError("Received 304 Not Modified without a cached response")
+        self.validators.not_modified += 1
+        if self.metrics is not None:
+            self.metrics.count("not_modified")
+        return entry.payload
+
+    def _decode_body(self, key, body: bytes, headers) -> Dict[str, Any]:
+        """Decode a JSON response body, tracking validators when enabled."""
+        started = time.perf_counter() if self.metrics is not None else None
+        try:
+            if key is None:
+                return self.json_decoder(body)
+            return self._decode(key, body, headers)
         except ValueError as e:
             raise APIError(f"Invalid JSON response: {e}")
+        finally:
+            if started is not None:
+                self.metrics.timing("decode", time.perf_counter() - started)
+
+    def _decode(self, key, body: bytes, headers) -> Dict[str, Any]:
+        """Decode a response body, reusing the previous payload when it is unchanged.
+
+        An identical body is always reused. The observation-time comparison
+        only applies to responses without ETag/Last-Modified validators; when
+        the server sends validators, a different body is always decoded.
+        """
+        previous = self.validators.get(key)
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        etag, last_modified = headers.get("ETag"), headers.get("Last-Modified")
+        if previous is not None and previous.digest == digest:
+            payload, stamp = previous.payload, previous.stamp
+            self.validators.unchanged += 1
+        else:
+            payload = self.json_decoder(body)
+            stamp = _observation_stamp(payload)
+            if (
+                etag is None and last_modified is None
+                and previous is not None and stamp is not None and stamp == previous.stamp
+            ):
+                payload = previous.payload
+                self.validators.unchanged += 1
+
+        response = previous.response if previous is not None and payload is previous.payload else None
+        self.validators.store(key, Validated(
+            etag=etag,
+            last_modified=last_modified,
+            digest=digest,
+            stamp=stamp,
+            payload=payload,
+            response=response,
+        ))
+        return payload
+
+    def _cache_key(self, location: str, params: Dict[str, Any]):
+        """Return the response cache key for a request, or None without a cache."""
+        if self.cache is None:
+            return None
+        return ResponseCache.make_key(self.base_url, location, self.format, params)
+
+    def _store(self, cache_key, data: Dict[str, Any], body: Optional[bytes]) -> None:
+        """Cache a fetched payload; a DiskCache keeps the raw body it was decoded from."""
+        if body is not None and isinstance(self.cache, DiskCache):
+            self.cache.set(cache_key, data, raw=body)
+        else:
+            self.cache.set(cache_key, data)
+
+    def _get_stale(self, cache_key) -> Optional[Dict[str, Any]]:
+        """Return a stale cache entry if the cache supports stale reads."""
+        get_stale = getattr(self.cache, "get_stale", None)
+        return get_stale(cache_key) if get_stale is not None else None
+
+    def _claim_revalidation(self, cache_key) -> bool:
+        """Mark cache_key as being refreshed; False if a refresh is already running."""
+        with self._revalidate_lock:
+            if cache_key in self._revalidating:
+                return False
+            self._revalidating.add(cache_key)
+            return True
+
+    def _release_revalidation(self, cache_key) -> None:
+        with self._revalidate_lock:
+            self._revalidating.discard(cache_key)
+
+    def _revalidate(self, location: str, params: Dict[str, Any], cache_key) -> None:
+        """Refresh a stale cache entry on a background thread."""
+        if not self._claim_revalidation(cache_key):
+            return
+
+        def refresh():
+            try:
+                self._store(cache_key, *self._fetch(location, params))
+            except SkyPulseError:
+                pass
+            finally:
+                self._release_revalidation(cache_key)
+
+        threading.Thread(target=refresh, name="skypulse-revalidate", daemon=True).start()
+
+    def _revalidate_async(self, location: str, params: Dict[str, Any], cache_key) -> None:
+        """Refresh a stale cache entry in a background task."""
+        if not self._claim_revalidation(cache_key):
+            return
+
+        async def refresh():
+            try:
+                await self._fetch_coalesced(location, params, cache_key)
+            except SkyPulseError:
+                pass
+            finally:
+                self._release_revalidation(cache_key)
+
+        task = asyncio.ensure_future(refresh())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _build_response(self, data: Dict[str, Any]) -> WttrResponse:
+        """Turn a decoded payload into a response model using the client's decoding options."""
+        if self.validators is not None:
+            response = self.validators.response_for(data)
+            if response is not None:
+                return response
+        if self.metrics is None:
+            response = self._convert_and_build(data)
+        else:
+            started = time.perf_counter()
+            response = self._convert_and_build(data)
+            self.metrics.timing("build", time.perf_counter() - started)
+        if self.validators is not None:
+            self.validators.remember_response(data, response)
+        return response
+
+    def _convert_and_build(self, data: Dict[str, Any]) -> WttrResponse:
+        """Build a response carrying its readings in the preferred units."""
+        response = WttrResponse.from_dict(data, lazy=self.lazy, compact=self.compact, typed=self.typed)
+        if not self.converter.is_metric:
+            response.units = dict(self.converter.units)
+            response.converted = self.converter.convert_columns(data)
+        return response
 
     def set_units(self, preferences: UnitPreferences) -> None:
         """Set unit preferences for weather data.
-        
+
+        The metric fields of returned models (temp_C, tempC, maxtempC,
+        windspeedKmph, pressure, precipMM, visibility, ...) are left as the API
+        sent them. Responses returned from then on also carry those readings
+        in the preferred units, converted in one batch per payload by
+        ``self.converter``: ``response.converted[section][field]`` is an
+        array('d') with one value per record of "current_condition",
+        "weather" or "hourly", and ``response.units`` names the unit of each
+        quantity.
+
         Args:
             preferences: UnitPreferences object with desired units
+
+        Raises:
+            ValueError: If a preference names an unsupported unit.
         """
-        self._unit_preferences = preferences
+        self.converter = UnitConverter(preferences)
+        if self.validators is not None:
+            self.validators.forget_responses()  # They were built in the previous units
 
-    def get_weather(self, location: str) -> WttrResponse:
+    def get_weather(self, location: str, timeout: Optional[float] = None) -> WttrResponse:
         """Get weather data for a location.
 
         Args:
             location: Location to get weather for.
+            timeout: Optional request timeout in seconds.
 
         Returns:
             WttrResponse object containing weather data.
@@ -129,8 +886,8 @@ class SkyPulse:
         if self.async_mode:
             raise APIError("Use get_weather_async for async mode")
         
-        data = self._make_request(location)
-        return WttrResponse.from_dict(data)
+        data = self._make_request(location, timeout=timeout)
+        return self._build_response(data)
 
     async def get_weather_async(self, location: str) -> WttrResponse:
         """Get weather data for a location asynchronously.
@@ -148,7 +905,54 @@ class SkyPulse:
             raise APIError("Client is not in async mode")
 
         data = await self._make_request_async(location)
-        return WttrResponse.from_dict(data)
+        return self._build_response(data)
+
+    def get_raw(self, location: str, timeout: Optional[float] = None) -> bytes:
+        """Get the undecoded JSON body of a weather response.
+
+        The body is returned exactly as served (after transport
+        decompression) without being parsed, so it can be written straight
+        to storage. It is buffered, not streamed: the whole body is read into
+        memory first, like every request that goes through retries and
+        endpoint failover. The response cache and conditional requests are
+        bypassed.
+
+        Args:
+            location: Location to get weather for.
+            timeout: Optional request timeout in seconds.
+
+        Returns:
+            The response body as bytes.
+
+        Raises:
+            APIError: If the API request fails.
+        """
+        if self.async_mode:
+            raise APIError("Use get_raw_async for async mode")
+
+        _, _, body = self._request(location, {"format": self.format}, timeout)
+        return body
+
+    async def get_raw_async(self, location: str) -> bytes:
+        """Get the undecoded JSON body of a weather response asynchronously.
+
+        Like :meth:`get_raw`, the whole body is read into memory before it is
+        returned.
+
+        Args:
+            location: Location to get weather for.
+
+        Returns:
+            The response body as bytes.
+
+        Raises:
+            APIError: If the API request fails.
+        """
+        if not self.async_mode:
+            raise APIError("Client is not in async mode")
+
+        _, _, body = await self._request_async(location, {"format": self.format})
+        return body
 
     def get_current_weather(self, location: str) -> CurrentCondition:
         """Get current weather conditions for a location.
@@ -242,19 +1046,176 @@ class SkyPulse:
         return result
 
     async def compare_locations_async(self, locations: List[str]) -> Dict[str, WttrResponse]:
-        """Compare current weather between multiple locations asynchronously."""
+        """Compare current weather between multiple locations asynchronously.
+
+        Locations that fail are mapped to None, except that throttling is
+        raised so callers can back off instead of losing the entries.
+
+        Raises:
+            RateLimitError: If any request was throttled by the API.
+        """
         result = {}
         tasks = [self.get_weather_async(location) for location in locations]
         weather_data = await asyncio.gather(*tasks, return_exceptions=True)
         
         for location, data in zip(locations, weather_data):
+            if isinstance(data, RateLimitError):
+                raise data
             if isinstance(data, Exception):
                 result[location] = None
             else:
                 result[location] = data
         return result
 
+    def fetch_many(
+        self,
+        locations: Iterable[str],
+        concurrency: int = 8,
+        timeout: Optional[float] = None,
+        ordered: bool = False,
+        raw: bool = False,
+    ) -> Iterator[Tuple[str, Union[WttrResponse, bytes, Exception]]]:
+        """Fetch weather for many locations on a bounded thread pool.
+
+        Results are yielded as ``(location, response_or_error)`` pairs as soon
+        as they are available. At most ``concurrency`` requests are in flight
+        and ``locations`` is consumed lazily, so very large (or generated)
+        location lists never sit fully in memory.
+
+        Args:
+            locations: Locations to fetch.
+            concurrency: Maximum number of concurrent requests. Defaults to 8.
+            timeout: Optional per-request timeout in seconds.
+            ordered: Yield results in input order instead of completion order.
+            raw: Yield undecoded response bodies (see :meth:`get_raw`)
+                instead of WttrResponse objects.
+
+        Yields:
+            Tuples of location and WttrResponse (or bytes), or the exception
+            raised for it.
+        """
+        if self.async_mode:
+            raise APIError("Use fetch_many_async for async mode")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        get = self.get_raw if raw else self.get_weather
+        pending = iter(locations)
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="skypulse") as executor:
+            def outcome(location, future):
+                try:
+                    return location, future.result()
+                except Exception as e:
+                    return location, e
+
+            if ordered:
+                window = deque(
+                    (location, executor.submit(get, location, timeout))
+                    for location in islice(pending, concurrency)
+                )
+                while window:
+                    location, future = window.popleft()
+                    for next_location in islice(pending, 1):
+                        window.append((next_location, executor.submit(get, next_location, timeout)))
+                    yield outcome(location, future)
+                return
+
+            in_flight = {}
+            for location in islice(pending, concurrency):
+                in_flight[executor.submit(get, location, timeout)] = location
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    location = in_flight.pop(future)
+                    for next_location in islice(pending, 1):
+                        in_flight[executor.submit(get, next_location, timeout)] = next_location
+                    yield outcome(location, future)
+
+    async def fetch_many_async(
+        self,
+        locations: Iterable[str],
+        concurrency: int = 32,
+        timeout: Optional[float] = None,
+        ordered: bool = False,
+        raw: bool = False,
+    ) -> AsyncIterator[Tuple[str, Union[WttrResponse, bytes, Exception]]]:
+        """Fetch weather for many locations with bounded concurrency.
+
+        Async counterpart of :meth:`fetch_many`; results are yielded as
+        ``(location, response_or_error)`` pairs as each request completes.
+
+        Args:
+            locations: Locations to fetch.
+            concurrency: Maximum number of concurrent requests. Defaults to 32.
+            timeout: Optional per-request timeout in seconds; a location
+                that exceeds it yields a TransportError.
+            ordered: Yield results in input order instead of completion order.
+            raw: Yield undecoded response bodies (see :meth:`get_raw`)
+                instead of WttrResponse objects.
+
+        Yields:
+            Tuples of location and WttrResponse (or bytes), or the exception
+            raised for it.
+        """
+        if not self.async_mode:
+            raise APIError("Client is not in async mode")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        get = self.get_raw_async if raw else self.get_weather_async
+
+        async def fetch(location):
+            try:
+                if timeout is None:
+                    return location, await get(location)
+                return location, await asyncio.wait_for(get(location), timeout)
+            except asyncio.TimeoutError:
+                return location, TransportError(f"Request timed out after {timeout}s: {location}")
+            except Exception as e:
+                return location, e
+
+        pending = iter(locations)
+        started = [asyncio.ensure_future(fetch(location)) for location in islice(pending, concurrency)]
+        tasks = deque(started) if ordered else set(started)
+        try:
+            if ordered:
+                while tasks:
+                    result = await tasks[0]
+                    tasks.popleft()
+                    for location in islice(pending, 1):
+                        tasks.append(asyncio.ensure_future(fetch(location)))
+                    yield result
+                return
+
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    for location in islice(pending, 1):
+                        tasks.add(asyncio.ensure_future(fetch(location)))
+                    yield task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
     def __str__(self) -> str:
         """Return string representation of SkyPulse client."""
         mode = "async" if self.async_mode else "sync"
         return f"SkyPulse(api_url='{self.base_url}', mode='{mode}', format='{self.format}')"
+
+def _is_outage(error: Optional[Exception]) -> bool:
+    """Return True for errors that indicate the endpoint itself is failing."""
+    status = getattr(error, "status", None)
+    return isinstance(error, TransportError) or (status is not None and status >= 500)
+
+def _fails_over(error: Exception) -> bool:
+    """Return True if a request failing with error should be tried on another endpoint."""
+    return isinstance(error, (RateLimitError, CircuitOpenError)) or _is_outage(error)
+
+def _observation_stamp(payload: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    """Return (observation_time, localObsDateTime) of a payload, if present."""
+    try:
+        current = payload["current_condition"][0]
+    except (KeyError, IndexError, TypeError):
+        return None
+    stamp = (current.get("observation_time", ""), current.get("localObsDateTime", ""))
+    return stamp if any(stamp) else None
@@ -0,0 +1,160 @@
+"""Columnar, array-backed views of forecast time series.
+
+A ColumnarView packs the hourly and daily series of many locations into
+flat ``array('d')`` columns (one value per row) instead of per-record model
+objects, ready for vectorized analysis with NumPy via ``to_numpy()``.
+Unparsable readings are stored as NaN.
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, List, Sequence, Tuple, Union
+
+from .models import WttrResponse, LazyWttrResponse
+
+HOURLY_FIELDS: Tuple[str, ...] = (
+    "tempC", "FeelsLikeC", "DewPointC", "windspeedKmph", "WindGustKmph",
+    "winddirDegree", "precipMM", "humidity", "pressure", "cloudcover",
+    "visibility", "uvIndex", "chanceofrain", "chanceofsnow",
+)
+DAILY_FIELDS: Tuple[str, ...] = (
+    "maxtempC", "mintempC", "avgtempC", "totalSnow_cm", "sunHour", "uvIndex",
+)
+
+NAN = float("nan")
+
+def _number(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return NAN
+
+def _integer(value: Any) -> int:
+    try:
+        return int(str(value).replace("-", ""))
+    except ValueError:
+        return 0
+
+def _get(record: Any, name: str) -> Any:
+    """Read a field from a payload dict or a model object."""
+    if isinstance(record, dict):
+        return record.get(name)
+    return getattr(record, name, None)
+
+class SeriesTable:
+    """Array-backed columns for one series (hourly or daily) across locations.
+
+    Every row carries a location id (index into ``ColumnarView.locations``),
+    the date as a ``YYYYMMDD`` integer and, for hourly rows, the wttr.in
+    ``HHMM`` time.
+    """
+
+    def __init__(self, fields: Sequence[str]):
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self.location_id = array("l")
+        self.date = array("l")
+        self.time = array("l")
+        self.columns: Dict[str, array] = {name: array("d") for name in self.fields}
+
+    def append(self, location_id: int, date: int, time: int, record: Any) -> None:
+        """Append one row read from a payload dict or model object."""
+        self.location_id.append(location_id)
+        self.date.append(date)
+        self.time.append(time)
+        for name in self.fields:
+            self.columns[name].append(_number(_get(record, name)))
+
+    def column(self, name: str) -> array:
+        """Return the values of one field for every row."""
+        return self.columns[name]
+
+    def rows_for(self, location_id: int) -> List[int]:
+        """Return the row indices belonging to a location id."""
+        return [i for i, value in enumerate(self.location_id) if value == location_id]
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Return zero-copy NumPy views of every column.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("NumPy is required for to_numpy(); install it with 'pip install numpy'")
+        result = {
+            "location_id": np.frombuffer(self.location_id, dtype=np.dtype(f"i{self.location_id.itemsize}")),
+            "date": np.frombuffer(self.date, dtype=np.dtype(f"i{self.date.itemsize}")),
+            "time": np.frombuffer(self.time, dtype=np.dtype(f"i{self.time.itemsize}")),
+        }
+        for name, values in self.columns.items():
+            result[name] = np.frombuffer(values, dtype=np.float64)
+        return result
+
+    def __len__(self) -> int:
+        return len(self.location_id)
+
+class ColumnarView:
+    """Hourly and daily forecast series for many locations in columnar form."""
+
+    def __init__(
+        self,
+        hourly_fields: Sequence[str] = HOURLY_FIELDS,
+        daily_fields: Sequence[str] = DAILY_FIELDS,
+    ):
+        """Initialize an empty view.
+
+        Args:
+            hourly_fields: Hourly readings to keep as columns.
+            daily_fields: Daily readings to keep as columns.
+        """
+        self.hourly = SeriesTable(hourly_fields)
+        self.daily = SeriesTable(daily_fields)
+        self.locations: List[str] = []
+        self._location_ids: Dict[str, int] = {}
+        self.units: Dict[str, str] = {}  # Empty while columns hold the API's metric values
+
+    @classmethod
+    def from_responses(
+        cls,
+        items: Iterable[Tuple[str, Union[WttrResponse, Dict[str, Any], Exception, None]]],
+        hourly_fields: Sequence[str] = HOURLY_FIELDS,
+        daily_fields: Sequence[str] = DAILY_FIELDS,
+    ) -> "ColumnarView":
+        """Build a view from ``(location, response)`` pairs.
+
+        Accepts the output of ``SkyPulse.fetch_many`` directly; entries whose
+        result is an exception or None are skipped.
+        """
+        view = cls(hourly_fields, daily_fields)
+        for location, response in items:
+            if response is not None and not isinstance(response, Exception):
+                view.add(location, response)
+        return view
+
+    def add(self, location: str, response: Union[WttrResponse, Dict[str, Any]]) -> None:
+        """Append a location's forecast.
+
+        Raw payload dicts and lazy responses are read without building any
+        model objects.
+        """
+        if isinstance(response, LazyWttrResponse) and not response.is_decoded("weather"):
+            response = response.raw
+        location_id = self._location_ids.get(location)
+        if location_id is None:
+            location_id = self._location_ids[location] = len(self.locations)
+            self.locations.append(location)
+
+        days = response.get("weather", []) if isinstance(response, dict) else response.weather
+        for day in days:
+            date = _integer(_get(day, "date"))
+            self.daily.append(location_id, date, 0, day)
+            for hour in _get(day, "hourly") or ():
+                self.hourly.append(location_id, date, _integer(_get(hour, "time")), hour)
+
+    def location_id(self, location: str) -> int:
+        """Return the id used for a location in the ``location_id`` columns."""
+        return self._location_ids[location]
+
+    def to_numpy(self) -> Dict[str, Dict[str, Any]]:
+        """Return NumPy views of both series as ``{"hourly": ..., "daily": ...}``."""
+        return {"hourly": self.hourly.to_numpy(), "daily": self.daily.to_numpy()}
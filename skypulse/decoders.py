@@ -0,0 +1,47 @@
+"""JSON decoder selection for SkyPulse.
+
+The fastest available JSON library is picked at import time: ``orjson``,
+then ``ujson``, then the standard library. Every decoder accepts the raw
+response bytes directly, so no intermediate ``str`` is created.
+"""
+
+import json
+from typing import Any, Callable, Dict, Optional, Union
+
+JSONDecoder = Callable[[Union[bytes, str]], Any]
+
+def _load_decoders() -> Dict[str, JSONDecoder]:
+    decoders: Dict[str, JSONDecoder] = {}
+    try:
+        import orjson
+        decoders["orjson"] = orjson.loads
+    except ImportError:
+        pass
+    try:
+        import ujson
+        decoders["ujson"] = ujson.loads
+    except ImportError:
+        pass
+    decoders["json"] = json.loads
+    return decoders
+
+AVAILABLE_DECODERS: Dict[str, JSONDecoder] = _load_decoders()
+DEFAULT_DECODER_NAME: str = next(iter(AVAILABLE_DECODERS))
+
+def get_decoder(name: Optional[str] = None) -> JSONDecoder:
+    """Return a JSON decoder by library name, or the fastest installed one.
+
+    Args:
+        name: "orjson", "ujson" or "json". Defaults to the fastest available.
+
+    Raises:
+        ValueError: If the named library is not installed.
+    """
+    if name is None:
+        return AVAILABLE_DECODERS[DEFAULT_DECODER_NAME]
+    try:
+        return AVAILABLE_DECODERS[name]
+    except KeyError:
+        raise ValueError(f"JSON decoder '{name}' is not available; installed: {', '.join(AVAILABLE_DECODERS)}")
+
+loads: JSONDecoder = get_decoder()
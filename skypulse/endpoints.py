@@ -0,0 +1,102 @@
+"""Load balancing and failover across several API endpoints."""
+
+import itertools
+import threading
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+ROUND_ROBIN = "round_robin"
+LEAST_LATENCY = "least_latency"
+
+@dataclass
+class EndpointStats:
+    """Live statistics of one endpoint."""
+    url: str
+    latency: Optional[float] = None  # EWMA of successful request latency, in seconds
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+
+class EndpointPool:
+    """A set of interchangeable wttr.in endpoints (e.g. self-hosted mirrors).
+
+    ``order()`` returns every endpoint in the order a request should try
+    them: the first is the balanced choice, the rest are failover
+    candidates. With ``"round_robin"`` the starting endpoint rotates on
+    each request; with ``"least_latency"`` endpoints are ranked by an
+    exponentially weighted moving average of observed latency, unmeasured
+    endpoints first. Either way, endpoints that failed their last requests
+    are moved to the back until they answer again.
+    """
+
+    def __init__(self, urls: Sequence[str], strategy: str = ROUND_ROBIN, alpha: float = 0.3):
+        """Initialize the pool.
+
+        Args:
+            urls: Base URLs of the endpoints.
+            strategy: "round_robin" or "least_latency".
+            alpha: Weight of the newest sample in the latency average.
+
+        Raises:
+            ValueError: If urls is empty or the strategy is unknown.
+        """
+        if not urls:
+            raise ValueError("At least one endpoint is required")
+        if strategy not in (ROUND_ROBIN, LEAST_LATENCY):
+            raise ValueError(f"Unknown load balancing strategy '{strategy}'")
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.strategy = strategy
+        self.alpha = alpha
+        self.endpoints: List[EndpointStats] = [EndpointStats(url.rstrip("/")) for url in urls]
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    @property
+    def urls(self) -> List[str]:
+        """Base URLs of the endpoints, in configuration order."""
+        return [endpoint.url for endpoint in self.endpoints]
+
+    def order(self) -> List[str]:
+        """Return endpoint URLs in the order the next request should try them."""
+        with self._lock:
+            if self.strategy == ROUND_ROBIN:
+                start = next(self._counter) % len(self.endpoints)
+                ranked = self.endpoints[start:] + self.endpoints[:start]
+            else:
+                ranked = sorted(self.endpoints, key=lambda e: -1.0 if e.latency is None else e.latency)
+            ranked.sort(key=lambda e: e.consecutive_failures > 0)  # Stable: healthy endpoints first
+            return [endpoint.url for endpoint in ranked]
+
+    def record_success(self, url: str, latency: float) -> None:
+        """Record a successful request and its latency in seconds."""
+        with self._lock:
+            endpoint = self._get(url)
+            endpoint.requests += 1
+            endpoint.consecutive_failures = 0
+            if endpoint.latency is None:
+                endpoint.latency = latency
+            else:
+                endpoint.latency += self.alpha * (latency - endpoint.latency)
+
+    def record_failure(self, url: str) -> None:
+        """Record a failed request."""
+        with self._lock:
+            endpoint = self._get(url)
+            endpoint.requests += 1
+            endpoint.failures += 1
+            endpoint.consecutive_failures += 1
+
+    def stats(self, url: str) -> EndpointStats:
+        """Return the statistics of one endpoint."""
+        with self._lock:
+            return self._get(url)
+
+    def _get(self, url: str) -> EndpointStats:
+        for endpoint in self.endpoints:
+            if endpoint.url == url:
+                return endpoint
+        raise KeyError(url)
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
@@ -0,0 +1,351 @@
+"""Streaming exporters for weather data.
+
+Exporters write flat records (dicts) one at a time, so exporting a sweep
+of many locations never holds more than one record, or one record batch
+for the columnar formats, in memory:
+
+- ``json``: a JSON array, written element by element
+- ``ndjson``: one JSON object per line
+- ``csv``: a header row followed by one row per record
+- ``parquet`` / ``arrow``: Parquet or Arrow IPC files written in record
+  batches (requires ``pip install skypulse[arrow]``)
+
+The record builders (``current_records``, ``hourly_records`` and
+``daily_records``) flatten ``(location, response_or_error)`` pairs such as
+the output of ``SkyPulse.fetch_many`` into rows with a fixed schema,
+converting numeric readings to floats on the way so fractional values
+(``"10.5"``) are kept. Readings are the API's metric values whatever the
+client's ``set_units()`` preferences.
+"""
+
+import csv
+import json
+import math
+from pathlib import Path
+from typing import Any, Dict, IO, Iterable, Iterator, Optional, Tuple, Union
+
+from .columnar import DAILY_FIELDS, HOURLY_FIELDS, _get
+from .models import CurrentCondition, LazyWttrResponse
+
+Schema = Dict[str, type]  # Field name -> str, int or float
+Target = Union[str, Path, IO]
+
+CURRENT_READINGS = (
+    "temp_C", "FeelsLikeC", "humidity", "windspeedKmph", "winddir16Point",
+    "precipMM", "pressure", "cloudcover", "uvIndex",
+)
+
+CURRENT_SCHEMA: Schema = {
+    "location": str, "area": str, "region": str, "country": str, "observed_at": str,
+    **{name: float if name in CurrentCondition.NUMERIC_FIELDS else str for name in CURRENT_READINGS},
+    "description": str, "error": str,
+}
+HOURLY_SCHEMA: Schema = {
+    "location": str, "date": str, "time": int,
+    **{name: float for name in HOURLY_FIELDS},
+    "description": str, "error": str,
+}
+DAILY_SCHEMA: Schema = {
+    "location": str, "date": str,
+    **{name: float for name in DAILY_FIELDS},
+    "sunrise": str, "sunset": str, "error": str,
+}
+
+def _coerce(value: Any, kind: type) -> Any:
+    """Convert a reading to the schema type, None when missing or unparsable."""
+    if value is None or value == "":
+        return None
+    if kind is str and isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    try:
+        value = kind(value)
+    except (TypeError, ValueError):
+        return None
+    if kind is float and math.isnan(value):
+        return None
+    return value
+
+def _conform(schema: Schema, record: Dict[str, Any]) -> Dict[str, Any]:
+    return {name: _coerce(record.get(name), kind) for name, kind in schema.items()}
+
+def _description(record: Any) -> Optional[str]:
+    descriptions = _get(record, "weatherDesc")
+    return _get(descriptions[0], "value") if descriptions else None
+
+def _sections(response: Any) -> Any:
+    """Read lazy responses from their payload instead of building models."""
+    if isinstance(response, LazyWttrResponse):
+        return response.raw
+    return response
+
+def _error_record(schema: Schema, location: str, error: Exception) -> Dict[str, Any]:
+    return _conform(schema, {"location": location, "error": str(error) or type(error).__name__})
+
+def current_records(items: Iterable[Tuple[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Yield one CURRENT_SCHEMA row per location: current conditions and nearest area."""
+    for location, response in items:
+        if isinstance(response, Exception):
+            yield _error_record(CURRENT_SCHEMA, location, response)
+            continue
+        response = _sections(response)
+        record: Dict[str, Any] = {"location": location}
+        areas = _get(response, "nearest_area")
+        if areas:
+            for field, name in (("area", "areaName"), ("region", "region"), ("country", "country")):
+                values = _get(areas[0], name)
+                record[field] = _get(values[0], "value") if values else None
+        conditions = _get(response, "current_condition")
+        if conditions:
+            current = conditions[0]
+            record["observed_at"] = _get(current, "localObsDateTime")
+            for field in CURRENT_READINGS:
+                record[field] = _get(current, field)
+            record["description"] = _description(current)
+        yield _conform(CURRENT_SCHEMA, record)
+
+def hourly_records(items: Iterable[Tuple[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Yield one HOURLY_SCHEMA row per location, forecast day and hour (j1 format)."""
+    for location, response in items:
+        if isinstance(response, Exception):
+            yield _error_record(HOURLY_SCHEMA, location, response)
+            continue
+        for day in _get(_sections(response), "weather") or []:
+            date = _get(day, "date")
+            for hour in _get(day, "hourly") or []:
+                record: Dict[str, Any] = {"location": location, "date": date, "time": _get(hour, "time")}
+                for field in HOURLY_FIELDS:
+                    record[field] = _get(hour, field)
+                record["description"] = _description(hour)
+                yield _conform(HOURLY_SCHEMA, record)
+
+def daily_records(items: Iterable[Tuple[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Yield one DAILY_SCHEMA row per location and forecast day."""
+    for location, response in items:
+        if isinstance(response, Exception):
+            yield _error_record(DAILY_SCHEMA, location, response)
+            continue
+        for day in _get(_sections(response), "weather") or []:
+            record: Dict[str, Any] = {"location": location, "date": _get(day, "date")}
+            for field in DAILY_FIELDS:
+                record[field] = _get(day, field)
+            astronomy = _get(day, "astronomy")
+            record["sunrise"] = _get(astronomy[0], "sunrise") if astronomy else None
+            record["sunset"] = _get(astronomy[0], "sunset") if astronomy else None
+            yield _conform(DAILY_SCHEMA, record)
+
+SERIES = {
+    "current": (current_records, CURRENT_SCHEMA),
+    "hourly": (hourly_records, HOURLY_SCHEMA),
+    "daily": (daily_records, DAILY_SCHEMA),
+}
+
+class Exporter:
+    """Base class of the streaming exporters.
+
+    ``target`` is a path, opened (and closed) by the exporter, or an open
+    file object, which is flushed after every record so consumers at the
+    other end of a pipe see rows as they are written, and left open.
+    """
+
+    binary = False
+
+    def __init__(self, target: Target, schema: Optional[Schema] = None):
+        self.schema = schema
+        self.count = 0
+        self._owned = isinstance(target, (str, Path))
+        if self._owned:
+            self.stream = open(target, "wb") if self.binary else open(target, "w", encoding="utf-8", newline="")
+        else:
+            self.stream = target
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Write one record."""
+        self._write(record)
+        self.count += 1
+        if not self._owned:
+            self.stream.flush()
+
+    def write_many(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Write every record of an iterable, returning how many were written."""
+        for record in records:
+            self.write(record)
+        return self.count
+
+    def close(self) -> None:
+        """Finish the output and close the target if the exporter opened it."""
+        try:
+            self._finish()
+        finally:
+            if self._owned:
+                self.stream.close()
+            else:
+                self.stream.flush()
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def _finish(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+class JSONExporter(Exporter):
+    """Writes records as the elements of one JSON array."""
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self.stream.write(("[\n" if not self.count else ",\n") + json.dumps(record, ensure_ascii=False))
+
+    def _finish(self) -> None:
+        self.stream.write("\n]\n" if self.count else "[]\n")
+
+class NDJSONExporter(Exporter):
+    """Writes one JSON object per line."""
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+class CSVExporter(Exporter):
+    """Writes a header and one row per record.
+
+    Columns come from the schema, or from the first record without one.
+    Nested values (lists, dicts) are written as JSON.
+    """
+
+    def __init__(self, target: Target, schema: Optional[Schema] = None):
+        super().__init__(target, schema)
+        self._writer: Optional[csv.DictWriter] = None
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        if self._writer is None:
+            self._writer = csv.DictWriter(self.stream, fieldnames=list(self.schema or record), extrasaction="ignore")
+            self._writer.writeheader()
+        self._writer.writerow({
+            name: json.dumps(value, ensure_ascii=False) if isinstance(value, (dict, list)) else value
+            for name, value in record.items()
+        })
+
+class _ArrowExporter(Exporter):
+    """Buffers records into Arrow record batches of ``batch_size`` rows.
+
+    Without a schema, columns and their types are taken from the first
+    record: ints and floats stay numeric, everything else becomes a string.
+    """
+
+    binary = True
+
+    def __init__(self, target: Target, schema: Optional[Schema] = None, batch_size: int = 10_000):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError(
+                f"pyarrow is required for {type(self).__name__}; install it with 'pip install skypulse[arrow]'"
+            )
+        self._pa = pa
+        self.batch_size = batch_size
+        self.arrow_schema = None
+        self._columns: Dict[str, list] = {}
+        self._pending = 0  # Rows buffered in _columns
+        self._writer = None
+        super().__init__(target, schema)
+        if schema is not None:
+            self._set_schema(schema)
+
+    def _set_schema(self, schema: Schema) -> None:
+        types = {str: self._pa.string(), int: self._pa.int64(), float: self._pa.float64()}
+        self.schema = schema
+        self.arrow_schema = self._pa.schema([(name, types[kind]) for name, kind in schema.items()])
+        self._columns = {name: [] for name in schema}
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Write one record; rows reach the target one batch at a time."""
+        if self.schema is None:
+            self._set_schema({
+                name: type(value) if type(value) in (int, float) else str
+                for name, value in record.items()
+            })
+        for name, kind in self.schema.items():
+            self._columns[name].append(_coerce(record.get(name), kind))
+        self.count += 1
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self._flush_batch()
+
+    def _flush_batch(self) -> None:
+        if self.arrow_schema is None:
+            self._set_schema({})
+        batch = self._pa.RecordBatch.from_pydict(self._columns, schema=self.arrow_schema)
+        if self._writer is None:
+            self._writer = self._open_writer()
+        self._write_batch(batch)
+        for values in self._columns.values():
+            values.clear()
+        self._pending = 0
+
+    def _finish(self) -> None:
+        if self._pending or self._writer is None:
+            self._flush_batch()  # An empty file still carries the schema
+        self._writer.close()
+
+    def _open_writer(self):
+        raise NotImplementedError
+
+    def _write_batch(self, batch) -> None:
+        self._writer.write_batch(batch)
+
+class ArrowExporter(_ArrowExporter):
+    """Writes an Arrow IPC file (Feather v2) in record batches."""
+
+    def _open_writer(self):
+        return self._pa.ipc.new_file(self.stream, self.arrow_schema)
+
+class ParquetExporter(_ArrowExporter):
+    """Writes a Parquet file, one row group per record batch."""
+
+    def _open_writer(self):
+        import pyarrow.parquet as pq
+
+        return pq.ParquetWriter(self.stream, self.arrow_schema)
+
+    def _write_batch(self, batch) -> None:
+        self._writer.write_table(self._pa.Table.from_batches([batch]))
+
+EXPORTERS = {
+    "json": JSONExporter,
+    "ndjson": NDJSONExporter,
+    "csv": CSVExporter,
+    "arrow": ArrowExporter,
+    "parquet": ParquetExporter,
+}
+
+def get_exporter(format: str, target: Target, schema: Optional[Schema] = None) -> Exporter:
+    """Create the exporter for a format name.
+
+    Raises:
+        ValueError: If the format is unknown.
+        ImportError: If the format needs pyarrow and it is not installed.
+    """
+    try:
+        exporter = EXPORTERS[format]
+    except KeyError:
+        raise ValueError(f"Unsupported export format: {format} (choose from {', '.join(EXPORTERS)})")
+    return exporter(target, schema)
+
+def export_records(
+    records: Iterable[Dict[str, Any]],
+    format: str,
+    target: Target,
+    schema: Optional[Schema] = None,
+) -> int:
+    """Stream records to target in the given format.
+
+    Returns:
+        Number of records written.
+    """
+    with get_exporter(format, target, schema) as exporter:
+        return exporter.write_many(records)
@@ -0,0 +1,352 @@
+"""Client-side metrics and tracing hooks for SkyPulse.
+
+Pass a ``Metrics`` instance to ``SkyPulse(metrics=...)`` to record, for
+every HTTP request, how long it spent in each phase (rate-limiter wait,
+DNS, connect, time to first byte, body read) plus the time spent decoding
+JSON and building response models, counters for cache hits, retries,
+hedges and errors by type, and the number of requests in flight.
+
+``Metrics`` keeps running totals itself and forwards every event to its
+hooks: ``MetricsHook`` subclasses such as ``PrometheusHook`` and
+``OpenTelemetryHook``, or your own. A client without metrics skips all
+of this; its only cost is one ``is None`` check per instrumentation point.
+"""
+
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .version import __version__
+
+# Request phases, in order
+PHASES = ("wait", "dns", "connect", "ttfb", "body")
+
+@dataclass
+class RequestTrace:
+    """Timeline of one HTTP request (one attempt against one endpoint).
+
+    Phase durations are in seconds and None when not observed: DNS and
+    connect times are only reported by the async transport, and only when
+    a new connection (or DNS lookup) was needed. ``ttfb`` runs from sending
+    the request to receiving the response headers; with the sync transport
+    it includes connecting.
+    """
+    host: str
+    location: str
+    started_at: float = field(default_factory=time.time)  # Wall clock, for tracing backends
+    status: Optional[int] = None
+    error: Optional[str] = None  # Exception type name of a failed request
+    wait: Optional[float] = None  # Rate limiter delay
+    dns: Optional[float] = None
+    connect: Optional[float] = None
+    ttfb: Optional[float] = None
+    body: Optional[float] = None
+    total: Optional[float] = None  # From sending the request to the body being read (or failure)
+    size: int = 0  # Body bytes after transport decompression
+
+    def phases(self) -> Dict[str, float]:
+        """Return the observed phase durations by name."""
+        return {name: getattr(self, name) for name in PHASES if getattr(self, name) is not None}
+
+@dataclass
+class TimingStats:
+    """Running count, sum and maximum of one timing."""
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+class MetricsHook:
+    """Receives instrumentation events from a Metrics instance.
+
+    Override the methods you need; hooks are called synchronously on the
+    thread or event loop making the request, so they should be quick.
+    """
+
+    def on_request(self, trace: RequestTrace) -> None:
+        """Called when an HTTP request completes or fails."""
+
+    def on_timing(self, name: str, seconds: float) -> None:
+        """Called with the duration of a client-side step ("decode" or "build")."""
+
+    def on_count(self, name: str, detail: Optional[str] = None) -> None:
+        """Called when a counted event happens, e.g. ("cache_hit", None) or ("error", "TransportError")."""
+
+    def on_in_flight(self, value: int) -> None:
+        """Called with the new number of requests in flight."""
+
+class Metrics:
+    """Collects client instrumentation and forwards it to hooks.
+
+    One instance may be shared by several clients (and threads).
+
+    Counters:
+        requests, cache_hit, cache_miss, cache_stale, coalesced,
+        not_modified, retry (detail: error type), hedge, circuit_open,
+        fallback, error (detail: error type).
+
+    Timings:
+        Every request phase (see PHASES), ``request`` (total), ``decode``
+        and ``build``.
+    """
+
+    def __init__(self, hooks: Iterable[MetricsHook] = ()):
+        """Initialize metrics.
+
+        Args:
+            hooks: Hooks receiving every event, e.g. PrometheusHook().
+        """
+        self.hooks: List[MetricsHook] = list(hooks)
+        self.counters: Counter = Counter()  # (name, detail) -> count
+        self.timings: Dict[str, TimingStats] = {}
+        self.in_flight = 0
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook: MetricsHook) -> None:
+        """Start forwarding events to another hook."""
+        self.hooks.append(hook)
+
+    def count(self, name: str, detail: Optional[str] = None) -> None:
+        """Count one event."""
+        with self._lock:
+            self.counters[name, detail] += 1
+        for hook in self.hooks:
+            hook.on_count(name, detail)
+
+    def timing(self, name: str, seconds: float) -> None:
+        """Record the duration of a client-side step."""
+        with self._lock:
+            self._observe(name, seconds)
+        for hook in self.hooks:
+            hook.on_timing(name, seconds)
+
+    def request_started(self, host: str, location: str) -> RequestTrace:
+        """Return a trace for a request about to be sent and count it as in flight."""
+        with self._lock:
+            self.in_flight += 1
+            value = self.in_flight
+        for hook in self.hooks:
+            hook.on_in_flight(value)
+        return RequestTrace(host, location)
+
+    def request_finished(self, trace: RequestTrace) -> None:
+        """Record a finished (or failed) request."""
+        with self._lock:
+            self.in_flight -= 1
+            value = self.in_flight
+            self.counters["requests", None] += 1
+            if trace.error is not None:
+                self.counters["error", trace.error] += 1
+            for name, seconds in trace.phases().items():
+                self._observe(name, seconds)
+            if trace.total is not None:
+                self._observe("request", trace.total)
+        for hook in self.hooks:
+            hook.on_in_flight(value)
+            hook.on_request(trace)
+
+    def get(self, name: str, detail: Optional[str] = None) -> int:
+        """Return a counter, summed over all details when detail is None."""
+        with self._lock:
+            if detail is not None:
+                return self.counters[name, detail]
+            return sum(count for (counter, _), count in self.counters.items() if counter == name)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a copy of the counters, timings and in-flight gauge."""
+        with self._lock:
+            return {
+                "counters": {
+                    name if detail is None else f"{name}.{detail}": count
+                    for (name, detail), count in self.counters.items()
+                },
+                "timings": {
+                    name: {"count": stats.count, "total": stats.total, "mean": stats.mean, "max": stats.max}
+                    for name, stats in self.timings.items()
+                },
+                "in_flight": self.in_flight,
+            }
+
+    def reset(self) -> None:
+        """Clear counters and timings; requests in flight are kept."""
+        with self._lock:
+            self.counters.clear()
+            self.timings.clear()
+
+    def _observe(self, name: str, seconds: float) -> None:
+        stats = self.timings.get(name)
+        if stats is None:
+            stats = self.timings[name] = TimingStats()
+        stats.add(seconds)
+
+def aiohttp_trace_config():
+    """Return an aiohttp TraceConfig filling the RequestTrace passed as trace_request_ctx."""
+    import aiohttp
+
+    def trace_of(context) -> Optional[RequestTrace]:
+        trace = context.trace_request_ctx
+        return trace if isinstance(trace, RequestTrace) else None
+
+    async def on_request_start(session, context, params):
+        context.started = time.perf_counter()
+
+    async def on_dns_start(session, context, params):
+        context.dns_started = time.perf_counter()
+
+    async def on_dns_end(session, context, params):
+        trace = trace_of(context)
+        if trace is not None:
+            trace.dns = time.perf_counter() - context.dns_started
+
+    async def on_connect_start(session, context, params):
+        context.connect_started = time.perf_counter()
+
+    async def on_connect_end(session, context, params):
+        trace = trace_of(context)
+        if trace is not None:
+            # Connection creation includes resolving the host
+            trace.connect = time.perf_counter() - context.connect_started - (trace.dns or 0.0)
+
+    async def on_request_end(session, context, params):
+        trace = trace_of(context)
+        if trace is not None:
+            trace.ttfb = time.perf_counter() - context.started - (trace.dns or 0.0) - (trace.connect or 0.0)
+
+    config = aiohttp.TraceConfig()
+    config.on_request_start.append(on_request_start)
+    config.on_dns_resolvehost_start.append(on_dns_start)
+    config.on_dns_resolvehost_end.append(on_dns_end)
+    config.on_connection_create_start.append(on_connect_start)
+    config.on_connection_create_end.append(on_connect_end)
+    config.on_request_end.append(on_request_end)
+    return config
+
+class PrometheusHook(MetricsHook):
+    """Exports client metrics with prometheus_client.
+
+    Creates ``<namespace>_requests_total`` (by host and status),
+    ``<namespace>_request_phase_seconds`` (histogram by phase),
+    ``<namespace>_events_total`` (by event and detail) and
+    ``<namespace>_requests_in_flight``.
+    """
+
+    def __init__(self, registry: Any = None, namespace: str = "skypulse"):
+        """Initialize the hook.
+
+        Args:
+            registry: CollectorRegistry to register with. Defaults to the
+                global registry.
+            namespace: Metric name prefix.
+
+        Raises:
+            ImportError: If prometheus_client is not installed.
+        """
+        try:
+            from prometheus_client import Counter as PromCounter, Gauge, Histogram
+        except ImportError:
+            raise ImportError("prometheus_client is required for PrometheusHook; install it with 'pip install skypulse[prometheus]'")
+        options = {"registry": registry} if registry is not None else {}
+        self.requests = PromCounter(f"{namespace}_requests", "HTTP requests sent", ["host", "status"], **options)
+        self.phases = Histogram(f"{namespace}_request_phase_seconds", "Time spent per request phase", ["phase"], **options)
+        self.events = PromCounter(f"{namespace}_events", "Client events: cache hits, retries, errors, ...", ["event", "detail"], **options)
+        self.in_flight = Gauge(f"{namespace}_requests_in_flight", "HTTP requests in flight", **options)
+
+    def on_request(self, trace: RequestTrace) -> None:
+        self.requests.labels(trace.host, str(trace.status or trace.error)).inc()
+        for name, seconds in trace.phases().items():
+            self.phases.labels(name).observe(seconds)
+        if trace.total is not None:
+            self.phases.labels("request").observe(trace.total)
+
+    def on_timing(self, name: str, seconds: float) -> None:
+        self.phases.labels(name).observe(seconds)
+
+    def on_count(self, name: str, detail: Optional[str] = None) -> None:
+        self.events.labels(name, detail or "").inc()
+
+    def on_in_flight(self, value: int) -> None:
+        self.in_flight.set(value)
+
+class OpenTelemetryHook(MetricsHook):
+    """Exports client metrics, and optionally request spans, with OpenTelemetry.
+
+    Records ``skypulse.requests`` and ``skypulse.events`` counters, a
+    ``skypulse.phase.duration`` histogram and a
+    ``skypulse.requests.in_flight`` gauge. With ``tracing`` enabled each
+    request also becomes a ``skypulse.request`` span carrying its phase
+    durations as attributes.
+    """
+
+    def __init__(self, meter: Any = None, tracer: Any = None, tracing: bool = True):
+        """Initialize the hook.
+
+        Args:
+            meter: Meter to create instruments with. Defaults to the global
+                meter provider's ``skypulse`` meter.
+            tracer: Tracer for request spans. Defaults to the global tracer
+                provider's ``skypulse`` tracer.
+            tracing: Emit a span per request.
+
+        Raises:
+            ImportError: If opentelemetry-api is not installed.
+        """
+        try:
+            from opentelemetry import metrics, trace
+        except ImportError:
+            raise ImportError("opentelemetry-api is required for OpenTelemetryHook; install it with 'pip install skypulse[opentelemetry]'")
+        meter = meter or metrics.get_meter("skypulse", __version__)
+        self.tracer = (tracer or trace.get_tracer("skypulse", __version__)) if tracing else None
+        self.requests = meter.create_counter("skypulse.requests", description="HTTP requests sent")
+        self.events = meter.create_counter("skypulse.events", description="Client events: cache hits, retries, errors, ...")
+        self.phases = meter.create_histogram("skypulse.phase.duration", unit="s", description="Time spent per request phase")
+        self._in_flight = 0
+        self._observation = metrics.Observation
+        meter.create_observable_gauge(
+            "skypulse.requests.in_flight",
+            callbacks=[lambda options: [self._observation(self._in_flight)]],
+            description="HTTP requests in flight",
+        )
+
+    def on_request(self, trace: RequestTrace) -> None:
+        status = str(trace.status or trace.error)
+        self.requests.add(1, {"host": trace.host, "status": status})
+        phases: List[Tuple[str, float]] = list(trace.phases().items())
+        if trace.total is not None:
+            phases.append(("request", trace.total))
+        for name, seconds in phases:
+            self.phases.record(seconds, {"phase": name})
+        if self.tracer is not None:
+            start = int(trace.started_at * 1e9)
+            span = self.tracer.start_span(
+                "skypulse.request",
+                start_time=start,
+                attributes={
+                    "server.address": trace.host,
+                    "skypulse.location": trace.location,
+                    "http.response.status_code": trace.status or 0,
+                    "http.response.body.size": trace.size,
+                    **{f"skypulse.phase.{name}": seconds for name, seconds in phases},
+                },
+            )
+            if trace.error is not None:
+                span.set_attribute("error.type", trace.error)
+            span.end(end_time=start + int(((trace.wait or 0.0) + (trace.total or 0.0)) * 1e9))
+
+    def on_timing(self, name: str, seconds: float) -> None:
+        self.phases.record(seconds, {"phase": name})
+
+    def on_count(self, name: str, detail: Optional[str] = None) -> None:
+        self.events.add(1, {"event": name, "detail": detail or ""})
+
+    def on_in_flight(self, value: int) -> None:
+        self._in_flight = value
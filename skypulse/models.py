@@ -1,8 +1,33 @@
 """Weather data models for SkyPulse."""
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+import sys
+import weakref
+from typing import List, Dict, Any, Optional, ClassVar, Callable, Union
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 
+# Numeric readings arrive as strings; with typed=True they are decoded to int/float once.
+Numeric = Union[str, int, float]
+
+def _to_number(value: Any, kind: Callable[[str], Any]) -> Any:
+    """Convert a numeric string, falling back to float, then to the original value."""
+    try:
+        return kind(value)
+    except (TypeError, ValueError):
+        if kind is float:
+            return value
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return value
+
+def _typed(data: Dict[str, Any], numeric_fields: Dict[str, Callable[[str], Any]]) -> Dict[str, Any]:
+    """Return a copy of data with numeric fields converted."""
+    data = dict(data)
+    for name, kind in numeric_fields.items():
+        if name in data:
+            data[name] = _to_number(data[name], kind)
+    return data
+
 @dataclass
 class UnitPreferences:
     """User preferences for units of measurement."""
@@ -87,10 +112,14 @@ class Astronomy:
     moonrise: str
     moonset: str
     moon_phase: str
-    moon_illumination: str
+    moon_illumination: Numeric
+
+    NUMERIC_FIELDS: ClassVar[Dict[str, Callable[[str], Any]]] = {"moon_illumination": int}
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Astronomy":
+    def from_dict(cls, data: Dict[str, Any], typed: bool = False) -> "Astronomy":
+        if typed:
+            data = _typed(data, cls.NUMERIC_FIELDS)
         return cls(
             sunrise=data["sunrise"],
             sunset=data["sunset"],
@@ -104,30 +133,41 @@ class Astronomy:
 class CurrentCondition:
     """Current weather conditions."""
     observation_time: str
-    temp_C: str
-    temp_F: str
+    temp_C: Numeric
+    temp_F: Numeric
     weatherCode: str
     weatherIconUrl: List[WeatherIconUrl]
     weatherDesc: List[WeatherDesc]
-    windspeedMiles: str
-    windspeedKmph: str
-    winddirDegree: str
+    windspeedMiles: Numeric
+    windspeedKmph: Numeric
+    winddirDegree: Numeric
     winddir16Point: str
-    precipMM: str
-    precipInches: str
-    humidity: str
-    visibility: str
-    visibilityMiles: str
-    pressure: str
-    pressureInches: str
-    cloudcover: str
-    FeelsLikeC: str
-    FeelsLikeF: str
-    uvIndex: str
+    precipMM: Numeric
+    precipInches: Numeric
+    humidity: Numeric
+    visibility: Numeric
+    visibilityMiles: Numeric
+    pressure: Numeric
+    pressureInches: Numeric
+    cloudcover: Numeric
+    FeelsLikeC: Numeric
+    FeelsLikeF: Numeric
+    uvIndex: Numeric
     localObsDateTime: str
 
+    NUMERIC_FIELDS: ClassVar[Dict[str, Callable[[str], Any]]] = {
+        "temp_C": int, "temp_F": int,
+        "windspeedMiles": int, "windspeedKmph": int, "winddirDegree": int,
+        "precipMM": float, "precipInches": float,
+        "humidity": int, "visibility": int, "visibilityMiles": int,
+        "pressure": int, "pressureInches": float, "cloudcover": int,
+        "FeelsLikeC": int, "FeelsLikeF": int, "uvIndex": int,
+    }
+
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "CurrentCondition":
+    def from_dict(cls, data: Dict[str, Any], typed: bool = False) -> "CurrentCondition":
+        if typed:
+            data = _typed(data, cls.NUMERIC_FIELDS)
         return cls(
             observation_time=data["observation_time"],
             temp_C=data["temp_C"],
@@ -156,16 +196,22 @@ class CurrentCondition:
 @dataclass
 class NearestArea:
     """Nearest area information."""
-    latitude: str
-    longitude: str
-    population: str
+    latitude: Numeric
+    longitude: Numeric
+    population: Numeric
     areaName: List[AreaName]
     country: List[Country]
     region: List[Region]
     weatherUrl: List[WeatherUrl]
 
+    NUMERIC_FIELDS: ClassVar[Dict[str, Callable[[str], Any]]] = {
+        "latitude": float, "longitude": float, "population": int,
+    }
+
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "NearestArea":
+    def from_dict(cls, data: Dict[str, Any], typed: bool = False) -> "NearestArea":
+        if typed:
+            data = _typed(data, cls.NUMERIC_FIELDS)
         return cls(
             latitude=data["latitude"],
             longitude=data["longitude"],
@@ -176,26 +222,105 @@ class NearestArea:
             weatherUrl=[WeatherUrl.from_dict(x) for x in data["weatherUrl"]]
         )
 
+@dataclass
+class Hourly:
+    """Forecast for one 3-hour slot of a day (j1 format only)."""
+    time: Numeric
+    tempC: Numeric
+    tempF: Numeric
+    FeelsLikeC: Numeric
+    FeelsLikeF: Numeric
+    HeatIndexC: Numeric
+    HeatIndexF: Numeric
+    DewPointC: Numeric
+    DewPointF: Numeric
+    WindChillC: Numeric
+    WindChillF: Numeric
+    windspeedMiles: Numeric
+    windspeedKmph: Numeric
+    WindGustMiles: Numeric
+    WindGustKmph: Numeric
+    winddirDegree: Numeric
+    winddir16Point: str
+    weatherCode: str
+    weatherIconUrl: List[WeatherIconUrl]
+    weatherDesc: List[WeatherDesc]
+    precipMM: Numeric
+    precipInches: Numeric
+    humidity: Numeric
+    visibility: Numeric
+    visibilityMiles: Numeric
+    pressure: Numeric
+    pressureInches: Numeric
+    cloudcover: Numeric
+    uvIndex: Numeric
+    chanceofrain: Numeric
+    chanceofremdry: Numeric
+    chanceofwindy: Numeric
+    chanceofovercast: Numeric
+    chanceofsunshine: Numeric
+    chanceoffrost: Numeric
+    chanceofhightemp: Numeric
+    chanceoffog: Numeric
+    chanceofsnow: Numeric
+    chanceofthunder: Numeric
+
+    NUMERIC_FIELDS: ClassVar[Dict[str, Callable[[str], Any]]] = {
+        "time": int, "tempC": int, "tempF": int,
+        "FeelsLikeC": int, "FeelsLikeF": int, "HeatIndexC": int, "HeatIndexF": int,
+        "DewPointC": int, "DewPointF": int, "WindChillC": int, "WindChillF": int,
+        "windspeedMiles": int, "windspeedKmph": int, "WindGustMiles": int, "WindGustKmph": int,
+        "winddirDegree": int, "precipMM": float, "precipInches": float,
+        "humidity": int, "visibility": int, "visibilityMiles": int,
+        "pressure": int, "pressureInches": float, "cloudcover": int, "uvIndex": int,
+        "chanceofrain": int, "chanceofremdry": int, "chanceofwindy": int,
+        "chanceofovercast": int, "chanceofsunshine": int, "chanceoffrost": int,
+        "chanceofhightemp": int, "chanceoffog": int, "chanceofsnow": int, "chanceofthunder": int,
+    }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], typed: bool = False) -> "Hourly":
+        if typed:
+            data = _typed(data, cls.NUMERIC_FIELDS)
+        values = {
+            f.name: data[f.name] for f in fields(cls)
+            if f.name not in ("weatherIconUrl", "weatherDesc")
+        }
+        return cls(
+            weatherIconUrl=[WeatherIconUrl.from_dict(x) for x in data["weatherIconUrl"]],
+            weatherDesc=[WeatherDesc.from_dict(x) for x in data["weatherDesc"]],
+            **values
+        )
+
 @dataclass
 class Weather:
     """Weather forecast data."""
     date: str
     astronomy: List[Astronomy]
-    maxtempC: str
-    maxtempF: str
-    mintempC: str
-    mintempF: str
-    avgtempC: str
-    avgtempF: str
-    totalSnow_cm: str
-    sunHour: str
-    uvIndex: str
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Weather":
+    maxtempC: Numeric
+    maxtempF: Numeric
+    mintempC: Numeric
+    mintempF: Numeric
+    avgtempC: Numeric
+    avgtempF: Numeric
+    totalSnow_cm: Numeric
+    sunHour: Numeric
+    uvIndex: Numeric
+    hourly: List[Hourly] = field(default_factory=list)
+
+    NUMERIC_FIELDS: ClassVar[Dict[str, Callable[[str], Any]]] = {
+        "maxtempC": int, "maxtempF": int, "mintempC": int, "mintempF": int,
+        "avgtempC": int, "avgtempF": int,
+        "totalSnow_cm": float, "sunHour": float, "uvIndex": int,
+    }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], typed: bool = False) -> "Weather":
+        if typed:
+            data = _typed(data, cls.NUMERIC_FIELDS)
         return cls(
             date=data["date"],
-            astronomy=[Astronomy.from_dict(x) for x in data["astronomy"]],
+            astronomy=[Astronomy.from_dict(x, typed) for x in data["astronomy"]],
             maxtempC=data["maxtempC"],
             maxtempF=data["maxtempF"],
             mintempC=data["mintempC"],
@@ -204,9 +329,134 @@ class Weather:
             avgtempF=data["avgtempF"],
             totalSnow_cm=data["totalSnow_cm"],
             sunHour=data["sunHour"],
-            uvIndex=data["uvIndex"]
+            uvIndex=data["uvIndex"],
+            hourly=[Hourly.from_dict(x, typed) for x in data.get("hourly", [])]
         )
 
+class CompactValue:
+    """Slotted, immutable stand-in for the single-string wrapper models.
+
+    Instances are interned, so every ``weatherDesc`` reading "Sunny" across a
+    fleet of conditions shares one object. The intern table holds them weakly:
+    a value no longer used by any model is released.
+    """
+    __slots__ = ("value", "__weakref__")
+    _interned: ClassVar["weakref.WeakValueDictionary[str, CompactValue]"] = weakref.WeakValueDictionary()
+
+    def __init__(self, value: str):
+        object.__setattr__(self, "value", value)
+
+    @classmethod
+    def of(cls, value: str) -> "CompactValue":
+        """Return the shared wrapper for value."""
+        wrapper = cls._interned.get(value)
+        if wrapper is None:
+            wrapper = cls._interned.setdefault(value, cls(sys.intern(value)))
+        return wrapper
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompactValue":
+        return cls.of(data["value"])
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("CompactValue is immutable")
+
+    def __eq__(self, other: Any) -> bool:
+        return getattr(other, "value", None) == self.value
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __repr__(self) -> str:
+        return f"CompactValue(value={self.value!r})"
+
+class _CompactModel:
+    """Base for slotted model variants mirroring a dataclass model's attributes.
+
+    Scalar strings are interned and lists of wrappers become tuples of shared
+    CompactValue objects, so instances carry no per-object ``__dict__``.
+    """
+    __slots__ = ()
+    _model: ClassVar[Any] = None
+    _nested: ClassVar[Dict[str, Any]] = {}
+    NUMERIC_FIELDS: ClassVar[Dict[str, Callable[[str], Any]]] = {}
+    _fallbacks: ClassVar[Dict[str, str]] = {}
+
+    def __init__(self, **values: Any):
+        for name in self.__slots__:
+            setattr(self, name, values[name])
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], typed: bool = False) -> Any:
+        numeric = cls.NUMERIC_FIELDS if typed else {}
+        values = {}
+        for name in cls.__slots__:
+            nested = cls._nested.get(name)
+            if nested is not None:
+                values[name] = tuple(_decode(nested, data.get(name, ()), typed))
+                continue
+            if name in data or name not in cls._fallbacks:
+                value = data[name]
+            else:
+                value = data.get(cls._fallbacks[name], "")
+            if name in numeric:
+                value = _to_number(value, numeric[name])
+            values[name] = sys.intern(value) if isinstance(value, str) else value
+        return cls(**values)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (type(self), self._model)):
+            return NotImplemented
+        return all(tuple(getattr(self, n)) == tuple(getattr(other, n)) if n in self._nested
+                   else getattr(self, n) == getattr(other, n) for n in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({values})"
+
+def _decode(model: Any, items: List[Dict[str, Any]], typed: bool = False) -> List[Any]:
+    """Decode a list of payload entries, passing typed only to models with numeric fields."""
+    if typed and hasattr(model, "NUMERIC_FIELDS"):
+        return [model.from_dict(x, typed=True) for x in items]
+    return [model.from_dict(x) for x in items]
+
+class CompactAstronomy(_CompactModel):
+    """Memory-compact variant of Astronomy."""
+    __slots__ = tuple(f.name for f in fields(Astronomy))
+    _model = Astronomy
+    NUMERIC_FIELDS = Astronomy.NUMERIC_FIELDS
+
+class CompactCurrentCondition(_CompactModel):
+    """Memory-compact variant of CurrentCondition."""
+    __slots__ = tuple(f.name for f in fields(CurrentCondition))
+    _model = CurrentCondition
+    NUMERIC_FIELDS = CurrentCondition.NUMERIC_FIELDS
+    _nested = {"weatherIconUrl": CompactValue, "weatherDesc": CompactValue}
+    _fallbacks = {"localObsDateTime": "observation_time"}
+
+class CompactHourly(_CompactModel):
+    """Memory-compact variant of Hourly."""
+    __slots__ = tuple(f.name for f in fields(Hourly))
+    _model = Hourly
+    NUMERIC_FIELDS = Hourly.NUMERIC_FIELDS
+    _nested = {"weatherIconUrl": CompactValue, "weatherDesc": CompactValue}
+
+class CompactNearestArea(_CompactModel):
+    """Memory-compact variant of NearestArea."""
+    __slots__ = tuple(f.name for f in fields(NearestArea))
+    _model = NearestArea
+    NUMERIC_FIELDS = NearestArea.NUMERIC_FIELDS
+    _nested = {"areaName": CompactValue, "country": CompactValue, "region": CompactValue, "weatherUrl": CompactValue}
+
+class CompactWeather(_CompactModel):
+    """Memory-compact variant of Weather."""
+    __slots__ = tuple(f.name for f in fields(Weather))
+    _model = Weather
+    NUMERIC_FIELDS = Weather.NUMERIC_FIELDS
+    _nested = {"astronomy": CompactAstronomy, "hourly": CompactHourly}
+
 @dataclass
 class WttrResponse:
     """Full weather response."""
@@ -214,12 +464,83 @@ class WttrResponse:
     current_condition: List[CurrentCondition]
     nearest_area: List[NearestArea]
     weather: List[Weather]
+    # A client's preferred units (see SkyPulse.set_units) and the readings
+    # converted to them, keyed by section then metric field. Empty for metric
+    # clients; the model fields themselves always hold the API's metric values.
+    units: Dict[str, str] = field(default_factory=dict)
+    converted: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    SECTIONS: ClassVar[Dict[str, Any]] = {
+        "request": Request,
+        "current_condition": CurrentCondition,
+        "nearest_area": NearestArea,
+        "weather": Weather,
+    }
+    COMPACT_SECTIONS: ClassVar[Dict[str, Any]] = {
+        "request": Request,
+        "current_condition": CompactCurrentCondition,
+        "nearest_area": CompactNearestArea,
+        "weather": CompactWeather,
+    }
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "WttrResponse":
-        return cls(
-            request=[Request.from_dict(x) for x in data.get("request", [])],
-            current_condition=[CurrentCondition.from_dict(x) for x in data.get("current_condition", [])],
-            nearest_area=[NearestArea.from_dict(x) for x in data.get("nearest_area", [])],
-            weather=[Weather.from_dict(x) for x in data.get("weather", [])]
-        )
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        lazy: bool = False,
+        compact: bool = False,
+        typed: bool = False,
+    ) -> "WttrResponse":
+        """Build a response from a decoded API payload.
+
+        Args:
+            data: Decoded j1/j2 payload.
+            lazy: Defer decoding of each section until it is first accessed.
+            compact: Build slotted Compact* models instead of dataclasses.
+            typed: Convert numeric readings (temp_C, humidity, maxtempC, ...)
+                to int/float once at decode time instead of keeping strings.
+        """
+        sections = cls.COMPACT_SECTIONS if compact else cls.SECTIONS
+        if lazy:
+            return LazyWttrResponse(data, sections, typed)
+        return cls(**{
+            name: _decode(model, data.get(name, []), typed)
+            for name, model in sections.items()
+        })
+
+class LazyWttrResponse(WttrResponse):
+    """Weather response that decodes each section on first attribute access.
+
+    Only the sections a caller actually touches are turned into model
+    objects; e.g. reading ``current_condition[0].temp_C`` never builds the
+    forecast or location models.
+    """
+
+    def __init__(self, data: Dict[str, Any], sections: Optional[Dict[str, Any]] = None, typed: bool = False):
+        self._data = data
+        self._sections = sections or self.SECTIONS
+        self._typed = typed
+        self.units: Dict[str, str] = {}
+        self.converted: Dict[str, Dict[str, Any]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        model = None if name.startswith("_") else self._sections.get(name)
+        if model is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        value = _decode(model, self._data.get(name, []), self._typed)
+        setattr(self, name, value)
+        return value
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, WttrResponse):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.SECTIONS)
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """The undecoded payload this response wraps."""
+        return self._data
+
+    def is_decoded(self, section: str) -> bool:
+        """Return whether a section has been decoded yet."""
+        return section in self.__dict__
@@ -1,14 +1,24 @@
 """Real-time weather notification system with streaming support."""
 
 import asyncio
-import json
-from typing import Optional, AsyncGenerator, Dict, Any
+import heapq
+import itertools
+import logging
+import time
+import zlib
+from collections import Counter, OrderedDict, deque
+from typing import Optional, AsyncGenerator, AsyncIterator, Dict, Any, Iterable, List, Set, Tuple
 from datetime import datetime
 import aiohttp
 from dataclasses import dataclass
 
 from .client import SkyPulse
-from .models import Weather, Location
+from .models import CurrentCondition
+from .columnar import _number
+
+logger = logging.getLogger(__name__)
+
+Change = Tuple[Any, Any]  # (previous, current)
 
 @dataclass
 class WeatherNotification:
@@ -17,40 +27,181 @@ class WeatherNotification:
     condition: str
     location: str
     timestamp: str
+    changes: Optional[Dict[str, Change]] = None  # Delta mode: readings that changed
 
     @classmethod
-    def from_weather(cls, weather: Weather, location: str) -> 'WeatherNotification':
-        """Create notification from weather data."""
+    def from_weather(cls, weather: CurrentCondition, location: str) -> 'WeatherNotification':
+        """Create notification from current weather conditions."""
         return cls(
-            temperature=weather.temperature_c,
-            condition=weather.condition.description,
+            temperature=float(weather.temp_C),
+            condition=_condition(weather),
             location=location,
             timestamp=datetime.now().isoformat()
         )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert notification to dictionary."""
-        return {
+        result = {
             "temperature": self.temperature,
             "condition": self.condition,
             "location": self.location,
             "timestamp": self.timestamp
         }
+        if self.changes is not None:
+            result["changes"] = {name: list(change) for name, change in self.changes.items()}
+        return result
+
+@dataclass
+class ChangeThresholds:
+    """What counts as a change worth notifying in delta mode.
+
+    Differences are measured against the last reading that was notified,
+    so slow drifts are reported once they add up. ``None`` disables a check.
+    Readings are compared in the API's metric units whatever the client's
+    ``set_units()`` preferences.
+    """
+    temperature_delta: Optional[float] = 1.0  # °C
+    feels_like_delta: Optional[float] = None  # °C
+    humidity_delta: Optional[float] = None  # Percentage points
+    wind_delta: Optional[float] = None  # km/h
+    wind_speed_above: Optional[float] = None  # km/h; notify when wind crosses this limit
+    precipitation_above: Optional[float] = None  # mm; notify when precipitation crosses this limit
+    condition_change: bool = True  # Notify when the weather description changes
+
+# Reading name -> CurrentCondition field
+READINGS: Dict[str, str] = {
+    "temperature": "temp_C",
+    "feels_like": "FeelsLikeC",
+    "humidity": "humidity",
+    "wind_speed": "windspeedKmph",
+    "precipitation": "precipMM",
+}
+
+class ChangeDetector:
+    """Compares readings per location and reports threshold crossings."""
+
+    def __init__(self, thresholds: Optional[ChangeThresholds] = None):
+        self.thresholds = thresholds or ChangeThresholds()
+        self._last: Dict[str, Dict[str, Any]] = {}
+
+    def check(self, location: str, weather: CurrentCondition) -> Optional[Dict[str, Change]]:
+        """Return the changed readings if a threshold is crossed, else None.
+
+        The first reading of a location is always reported, with every
+        reading as ``(None, value)``. When a change is reported, the reading
+        becomes the new reference for the location.
+        """
+        current = {name: _number(getattr(weather, field, None)) for name, field in READINGS.items()}
+        current["condition"] = _condition(weather)
+        previous = self._last.get(location)
+        if previous is None:
+            self._last[location] = current
+            return {name: (None, value) for name, value in current.items()}
+
+        t = self.thresholds
+        triggered = (
+            _moved(previous, current, "temperature", t.temperature_delta)
+            or _moved(previous, current, "feels_like", t.feels_like_delta)
+            or _moved(previous, current, "humidity", t.humidity_delta)
+            or _moved(previous, current, "wind_speed", t.wind_delta)
+            or _crossed(previous, current, "wind_speed", t.wind_speed_above)
+            or _crossed(previous, current, "precipitation", t.precipitation_above)
+            or (t.condition_change and previous["condition"] != current["condition"])
+        )
+        if not triggered:
+            return None
+        self._last[location] = current
+        return {
+            name: (previous[name], value)
+            for name, value in current.items()
+            if value != previous[name] and value == value  # NaN never equals itself
+        }
+
+    def forget(self, location: str) -> None:
+        """Drop the reference reading of a location."""
+        self._last.pop(location, None)
+
+def _condition(weather: CurrentCondition) -> str:
+    return weather.weatherDesc[0].value if weather.weatherDesc else ""
+
+def _moved(previous: Dict[str, Any], current: Dict[str, Any], name: str, delta: Optional[float]) -> bool:
+    return delta is not None and abs(current[name] - previous[name]) >= delta
+
+def _crossed(previous: Dict[str, Any], current: Dict[str, Any], name: str, limit: Optional[float]) -> bool:
+    return limit is not None and (previous[name] > limit) != (current[name] > limit)
 
 class WeatherNotifier:
-    """Real-time weather notification system."""
+    """Real-time weather notification system.
+
+    Any number of locations can be watched. Polls run on one persistent
+    client session, are ordered by a heap keyed on each location's next due
+    time, and are spread evenly over the update interval (each location gets
+    a fixed offset derived from its name) so that thousands of locations do
+    not all poll at once.
+    """
 
-    def __init__(self, update_interval: int = 300):
+    def __init__(
+        self,
+        update_interval: int = 300,
+        client: Optional[SkyPulse] = None,
+        max_concurrency: int = 32,
+        retry_interval: float = 60,
+        queue_size: int = 1024,
+        delta: Optional[ChangeThresholds] = None,
+    ):
         """Initialize the notifier.
-        
+
         Args:
             update_interval: Time between updates in seconds (default: 5 minutes)
+            client: Optional async SkyPulse client to poll with, e.g. one
+                configured with a cache or rate limiter. Its session is only
+                closed by close() if the notifier opened it.
+            max_concurrency: Maximum number of polls in flight.
+            retry_interval: Seconds before a failed poll is retried.
+            queue_size: Notifications buffered for a slow consumer before
+                polling pauses.
+            delta: Only notify when a reading crosses these thresholds; such
+                notifications carry the changed readings in ``changes``.
         """
-        self.client = SkyPulse(async_mode=True)
+        self.client = client or SkyPulse(async_mode=True)
+        self._owns_client = client is None
+        self._opened_session = False  # Whether close() should close the client's session
         self.update_interval = update_interval
+        self.max_concurrency = max_concurrency
+        self.retry_interval = retry_interval
+        self.queue_size = queue_size
+        self.detector = ChangeDetector(delta) if delta is not None else None
         self._location: Optional[str] = None
         self._ip_location: Optional[str] = None
 
+        # Scheduled polls: heap of (due time, token, location). A location's
+        # token changes when it is removed or re-added, invalidating old entries.
+        self._schedule: List[Tuple[float, int, str]] = []
+        self._watched: Dict[str, Tuple[int, float]] = {}  # location -> (token, interval)
+        self._tokens = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the client session if this notifier created the client or opened its session."""
+        if self._owns_client or self._opened_session:
+            self._opened_session = False
+            await self.client.__aexit__(None, None, None)
+
+    async def _ensure_session(self) -> None:
+        """Open the client session once; every poll reuses it."""
+        if not self.client.is_open:
+            await self.client.__aenter__()
+            self._opened_session = True
+
     async def _get_ip_location(self) -> str:
         """Get location from IP address."""
         async with aiohttp.ClientSession() as session:
@@ -70,23 +221,354 @@ class WeatherNotifier:
         """Set a specific location for weather updates."""
         self._location = location
 
-    async def get_current_notification(self) -> WeatherNotification:
+    def add_location(self, location: str, interval: Optional[float] = None, stagger: bool = True) -> None:
+        """Watch a location.
+
+        Args:
+            location: Location to poll.
+            interval: Seconds between polls. Defaults to update_interval.
+            stagger: Delay the first poll by the location's offset within the
+                interval instead of polling immediately.
+        """
+        interval = interval or self.update_interval
+        token = next(self._tokens)
+        self._watched[location] = (token, interval)
+        offset = interval * zlib.crc32(location.encode("utf-8")) / 2**32 if stagger else 0.0
+        self._push(time.monotonic() + offset, token, location)
+
+    def add_locations(self, locations: Iterable[str], interval: Optional[float] = None) -> None:
+        """Watch several locations, spreading their polls over the interval."""
+        for location in locations:
+            self.add_location(location, interval)
+
+    def remove_location(self, location: str) -> None:
+        """Stop watching a location."""
+        self._watched.pop(location, None)
+        if self.detector is not None:
+            self.detector.forget(location)
+
+    @property
+    def locations(self) -> List[str]:
+        """Locations currently watched."""
+        return list(self._watched)
+
+    async def get_current_notification(self, location: Optional[str] = None) -> WeatherNotification:
         """Get current weather notification."""
-        location = await self._get_location()
-        async with self.client:
-            weather = await self.client.get_current_async(location)
-            return WeatherNotification.from_weather(weather, location)
-
-    async def stream_notifications(self) -> AsyncGenerator[WeatherNotification, None]:
-        """Stream weather notifications in real-time."""
-        while True:
-            try:
-                notification = await self.get_current_notification()
-                yield notification
-                await asyncio.sleep(self.update_interval)
-            except Exception as e:
-                print(f"Error getting weather update: {e}")
-                await asyncio.sleep(60)  # Wait a minute before retrying
+        location = location or await self._get_location()
+        await self._ensure_session()
+        weather = await self.client.get_current_weather_async(location)
+        return WeatherNotification.from_weather(weather, location)
+
+    async def _get_change_notification(self, location: str) -> Optional[WeatherNotification]:
+        """Get a notification for a location in delta mode, or None if nothing changed enough."""
+        await self._ensure_session()
+        weather = await self.client.get_current_weather_async(location)
+        changes = self.detector.check(location, weather)
+        if changes is None:
+            return None
+        notification = WeatherNotification.from_weather(weather, location)
+        notification.changes = changes
+        return notification
+
+    async def stream_notifications(self, ip_lookup: bool = True) -> AsyncGenerator[WeatherNotification, None]:
+        """Stream weather notifications in real-time.
+
+        Watches the locations added with add_location(), or the configured
+        (or IP-based) location when none were added.
+
+        Args:
+            ip_lookup: Look the location up from the IP address when no
+                location was added or configured. Without it the stream
+                waits for locations to be added.
+        """
+        if not self._watched and (self._location or ip_lookup):
+            self.add_location(await self._get_location(), stagger=False)
+        await self._ensure_session()
+
+        queue: "asyncio.Queue[WeatherNotification]" = asyncio.Queue(self.queue_size)
+        self._wakeup = asyncio.Event()
+        scheduler = asyncio.ensure_future(self._run_schedule(queue))
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            scheduler.cancel()
+            await asyncio.gather(scheduler, return_exceptions=True)
+            self._wakeup = None
+
+    async def _run_schedule(self, queue: "asyncio.Queue[WeatherNotification]") -> None:
+        """Start polls as they fall due until cancelled."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        polls = set()
+        try:
+            while True:
+                now = time.monotonic()
+                while self._schedule and self._schedule[0][0] <= now:
+                    due, token, location = heapq.heappop(self._schedule)
+                    if self._watched.get(location, (None,))[0] != token:
+                        continue  # Removed or re-added since it was scheduled
+                    await semaphore.acquire()
+                    poll = asyncio.ensure_future(self._poll(location, token, due, queue, semaphore))
+                    polls.add(poll)
+                    poll.add_done_callback(polls.discard)
+
+                self._wakeup.clear()
+                delay = self._schedule[0][0] - time.monotonic() if self._schedule else None
+                # asyncio.wait rather than wait_for: the latter can swallow a
+                # cancellation that races with the event being set.
+                waiter = asyncio.ensure_future(self._wakeup.wait())
+                try:
+                    await asyncio.wait({waiter}, timeout=max(delay, 0.0) if delay is not None else None)
+                finally:
+                    waiter.cancel()
+        finally:
+            for poll in polls:
+                poll.cancel()
+            await asyncio.gather(*polls, return_exceptions=True)
+
+    async def _poll(
+        self,
+        location: str,
+        token: int,
+        due: float,
+        queue: "asyncio.Queue[WeatherNotification]",
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        """Poll one location, queue its notification and schedule the next poll."""
+        failed = False
+        try:
+            if self.detector is not None:
+                notification = await self._get_change_notification(location)
+            else:
+                notification = await self.get_current_notification(location)
+        except Exception as e:
+            logger.warning("Error getting weather update for %s: %s", location, e)
+            notification = None
+            failed = True
+        finally:
+            semaphore.release()
+
+        watched = self._watched.get(location)
+        if watched is not None and watched[0] == token:
+            interval = min(self.retry_interval, watched[1]) if failed else watched[1]
+            # Keep the location's phase in the interval instead of drifting by poll latency
+            self._push(max(due + interval, time.monotonic()), token, location)
+        if notification is not None:
+            await queue.put(notification)
+
+    def _push(self, due: float, token: int, location: str) -> None:
+        heapq.heappush(self._schedule, (due, token, location))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+# Subscription overflow policies
+DROP_OLDEST = "drop_oldest"
+COALESCE = "coalesce"
+BLOCK = "block"
+
+class Subscription:
+    """One subscriber's bounded stream of notifications from a NotificationHub.
+
+    Iterate with ``async for``; iteration ends once the subscription is
+    closed and drained. When the buffer is full the overflow policy
+    decides what happens to a new notification:
+
+    * ``"drop_oldest"``: the oldest buffered notification is discarded.
+    * ``"coalesce"``: only the latest notification per location is kept,
+      so a slow subscriber always sees current data.
+    * ``"block"``: the hub waits for the subscriber to catch up, pausing
+      delivery to every subscriber (and, eventually, polling).
+    """
+
+    def __init__(self, hub: "NotificationHub", locations: Optional[Set[str]], maxsize: int, overflow: str):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if overflow not in (DROP_OLDEST, COALESCE, BLOCK):
+            raise ValueError(f"Unknown overflow policy '{overflow}'")
+        self.locations = locations
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.dropped = 0  # Notifications discarded or replaced because the buffer was full
+        self.closed = False
+        self.error: Optional[BaseException] = None  # Why the hub stopped delivering, if it failed
+        self._hub = hub
+        self._buffer: "deque[WeatherNotification]" = deque()
+        self._latest: "OrderedDict[str, WeatherNotification]" = OrderedDict()
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+
+    def wants(self, location: str) -> bool:
+        """Return True if this subscription receives notifications for location."""
+        return self.locations is None or location in self.locations
+
+    def __len__(self) -> int:
+        return len(self._latest) if self.overflow == COALESCE else len(self._buffer)
+
+    async def put(self, notification: WeatherNotification) -> None:
+        """Buffer a notification, applying the overflow policy."""
+        if self.closed:
+            return
+        if self.overflow == COALESCE:
+            if notification.location in self._latest:
+                self._latest.move_to_end(notification.location)
+                self.dropped += 1
+            elif len(self._latest) >= self.maxsize:
+                self._latest.popitem(last=False)  # Least recently updated location
+                self.dropped += 1
+            self._latest[notification.location] = notification
+        else:
+            if self.overflow == BLOCK:
+                while len(self._buffer) >= self.maxsize and not self.closed:
+                    self._space.clear()
+                    await self._space.wait()
+            elif len(self._buffer) >= self.maxsize:
+                self._buffer.popleft()
+                self.dropped += 1
+            self._buffer.append(notification)
+        self._ready.set()
+
+    async def get(self) -> WeatherNotification:
+        """Return the next notification, waiting for one if needed.
+
+        Raises:
+            StopAsyncIteration: If the subscription is closed and drained.
+            Exception: The error that stopped the hub, once drained.
+        """
+        while not len(self):
+            if self.closed:
+                if self.error is not None:
+                    raise self.error
+                raise StopAsyncIteration
+            self._ready.clear()
+            await self._ready.wait()
+        if self.overflow == COALESCE:
+            _, notification = self._latest.popitem(last=False)
+        else:
+            notification = self._buffer.popleft()
+        self._space.set()
+        return notification
+
+    def close(self, error: Optional[BaseException] = None) -> None:
+        """Unsubscribe; buffered notifications can still be read.
+
+        Args:
+            error: Raise this from iteration once the buffer is drained,
+                instead of ending it.
+        """
+        if not self.closed:
+            self.closed = True
+            self.error = error
+            self._hub._unsubscribe(self)
+            self._ready.set()
+            self._space.set()
+
+    def __aiter__(self) -> AsyncIterator[WeatherNotification]:
+        return self
+
+    async def __anext__(self) -> WeatherNotification:
+        return await self.get()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+class NotificationHub:
+    """Fans notifications from one WeatherNotifier out to many subscribers.
+
+    Each location is polled once however many subscribers watch it; every
+    notification is copied into the bounded buffer of each interested
+    subscriber. Locations subscribed to are added to the notifier on first
+    use and removed again when their last subscriber leaves. The hub never
+    falls back to the notifier's IP-based location. If the notifier's stream
+    fails, every subscription is closed with the error, which iteration
+    raises once the buffer is drained.
+    """
+
+    def __init__(self, notifier: Optional[WeatherNotifier] = None):
+        """Initialize the hub.
+
+        Args:
+            notifier: Notifier to poll with. Defaults to a new WeatherNotifier.
+        """
+        self.notifier = notifier or WeatherNotifier()
+        self._subscriptions: Set[Subscription] = set()
+        self._refs: Counter = Counter()
+        self._added: Set[str] = set()  # Locations this hub added to the notifier
+        self._task: Optional[asyncio.Future] = None
+
+    def subscribe(
+        self,
+        locations: Optional[Iterable[str]] = None,
+        maxsize: int = 100,
+        overflow: str = DROP_OLDEST,
+    ) -> Subscription:
+        """Subscribe to notifications. Must be called from a running event loop.
+
+        Args:
+            locations: Locations to receive, added to the notifier if needed.
+                None receives every location the notifier watches.
+            maxsize: Notifications buffered for this subscriber.
+            overflow: "drop_oldest", "coalesce" or "block".
+
+        Returns:
+            A Subscription to iterate with ``async for``.
+        """
+        wanted = set(locations) if locations is not None else None
+        subscription = Subscription(self, wanted, maxsize, overflow)
+        for location in wanted or ():
+            if self._refs[location] == 0 and location not in self.notifier.locations:
+                self.notifier.add_location(location)
+                self._added.add(location)
+            self._refs[location] += 1
+        self._subscriptions.add(subscription)
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._dispatch())
+        return subscription
+
+    @property
+    def subscribers(self) -> int:
+        """Number of open subscriptions."""
+        return len(self._subscriptions)
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions.discard(subscription)
+        for location in subscription.locations or ():
+            self._refs[location] -= 1
+            if self._refs[location] <= 0:
+                del self._refs[location]
+                if location in self._added:
+                    self._added.discard(location)
+                    self.notifier.remove_location(location)
+
+    async def _dispatch(self) -> None:
+        """Copy every notification into the buffers of interested subscribers."""
+        try:
+            async for notification in self.notifier.stream_notifications(ip_lookup=False):
+                for subscription in list(self._subscriptions):
+                    if subscription.wants(notification.location):
+                        await subscription.put(notification)
+        except Exception as e:
+            for subscription in list(self._subscriptions):
+                subscription.close(e)
+
+    async def close(self) -> None:
+        """Stop polling and close every subscription."""
+        for subscription in list(self._subscriptions):
+            subscription.close()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
 
 async def print_weather_updates(notifier: WeatherNotifier):
     """Print weather updates to console."""
@@ -98,7 +580,10 @@ async def main():
     notifier = WeatherNotifier(update_interval=300)  # Update every 5 minutes
     # Optional: Set specific location
     # notifier.set_location("London, UK")
-    await print_weather_updates(notifier)
+    # Or watch many locations at once:
+    # notifier.add_locations(["London, UK", "Paris, France", "Tokyo, Japan"])
+    async with notifier:
+        await print_weather_updates(notifier)
 
 if __name__ == "__main__":
     try:
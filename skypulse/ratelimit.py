@@ -0,0 +1,187 @@
+"""Client-side rate limiting for SkyPulse."""
+
+import asyncio
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+_STATE = struct.Struct("<dddd")  # tokens, updated, rate, penalty
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or HTTP date) to seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+class RateLimiter:
+    """Adaptive token bucket shared by every request of a client.
+
+    Requests take one token each; tokens refill at ``rate`` per second up
+    to ``burst``. When the API throttles (429, or 503 with Retry-After),
+    the bucket is paused for the advertised delay and the rate is cut
+    multiplicatively; every successful request then raises it additively
+    back towards ``max_rate``.
+
+    With ``path`` the bucket state lives in a small file guarded by an
+    exclusive ``flock``, so all processes on a host using the same path
+    share one budget (POSIX only).
+    """
+
+    def __init__(
+        self,
+        rate: float = 5.0,
+        burst: Optional[float] = None,
+        adaptive: bool = True,
+        min_rate: Optional[float] = None,
+        max_backoff: float = 60.0,
+        path: Optional[str] = None,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            rate: Requests per second allowed, and the adaptive ceiling.
+            burst: Bucket size. Defaults to one second of requests (at least 1).
+            adaptive: Lower the rate on throttling and recover it on success.
+            min_rate: Lowest rate adaptation may reach. Defaults to ``rate / 20``.
+            max_backoff: Longest pause in seconds applied after a throttled
+                response without Retry-After.
+            path: Optional state file shared between processes.
+
+        Raises:
+            ValueError: If rate or burst is not positive.
+            RuntimeError: If ``path`` is given on a platform without fcntl.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst is not None and burst <= 0:
+            raise ValueError("burst must be positive")
+        if path is not None and fcntl is None:
+            raise RuntimeError("Shared rate limiting requires fcntl (POSIX)")
+        self.max_rate = rate
+        self.min_rate = min_rate if min_rate is not None else rate / 20
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self.adaptive = adaptive
+        self.max_backoff = max_backoff
+        self.path = path
+        self.throttled = 0
+        self._lock = threading.Lock()
+        self._clock = time.time if path is not None else time.monotonic
+        self._tokens = self.burst
+        self._updated = self._clock()
+        self._rate = rate
+        self._penalty = 0.0
+        self._fd = None
+        if path is not None:
+            self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    @property
+    def rate(self) -> float:
+        """Current allowed requests per second."""
+        with self._state():
+            return self._rate
+
+    def acquire(self) -> float:
+        """Take a token, sleeping until one is available.
+
+        Returns:
+            Seconds waited.
+        """
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self) -> float:
+        """Take a token without blocking the event loop.
+
+        Returns:
+            Seconds waited.
+        """
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def record_success(self) -> None:
+        """Report a successful request, recovering the rate if it was lowered."""
+        with self._state():
+            self._penalty = 0.0
+            if self.adaptive and self._rate < self.max_rate:
+                self._rate = min(self.max_rate, self._rate + self.max_rate / 50)
+
+    def backoff(self, retry_after: Optional[float] = None) -> None:
+        """Report a throttled request and pause the bucket.
+
+        Args:
+            retry_after: Delay requested by the server. Without one the
+                pause doubles on each consecutive throttle, up to max_backoff.
+        """
+        with self._state():
+            self.throttled += 1
+            now = self._clock()
+            if retry_after is None:
+                self._penalty = min(self.max_backoff, max(1.0 / self._rate, self._penalty * 2))
+                retry_after = self._penalty
+            if self.adaptive:
+                self._rate = max(self.min_rate, self._rate / 2)
+            self._refill(now)
+            self._tokens = min(self._tokens, 1.0)
+            self._updated = max(self._updated, now + retry_after)
+
+    def close(self) -> None:
+        """Close the shared state file, if any."""
+        if getattr(self, "_fd", None) is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _reserve(self) -> float:
+        """Take a token now and return how long the caller must wait for it."""
+        with self._state():
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1.0
+            wait = max(0.0, self._updated - now)
+            if self._tokens < 0:
+                wait += -self._tokens / self._rate
+            return wait
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+
+    @contextmanager
+    def _state(self):
+        """Hold the bucket state, synchronized with other processes when shared."""
+        with self._lock:
+            if self._fd is None:
+                yield
+                return
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                data = os.pread(self._fd, _STATE.size, 0)
+                if len(data) == _STATE.size:
+                    self._tokens, self._updated, self._rate, self._penalty = _STATE.unpack(data)
+                yield
+                os.pwrite(self._fd, _STATE.pack(self._tokens, self._updated, self._rate, self._penalty), 0)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def __del__(self):
+        self.close()
@@ -0,0 +1,88 @@
+"""Retry and request hedging policy for SkyPulse."""
+
+import random
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional, Tuple, Type
+
+@dataclass
+class RetryPolicy:
+    """When and how often failed requests are retried.
+
+    Delays grow exponentially from ``backoff_base`` and are drawn uniformly
+    from ``[0, delay]`` ("full jitter") so that many clients retrying the
+    same outage do not synchronize. A throttled response's Retry-After is
+    always honoured as the minimum delay.
+
+    With ``hedge`` enabled, an async request that has not answered within
+    the ``hedge_quantile`` of recently observed latencies is raced against
+    a second, identical request; the first successful answer wins.
+    """
+    max_attempts: int = 3  # Total tries per request, including the first
+    backoff_base: float = 0.2  # Seconds before the second try (before jitter)
+    backoff_max: float = 10.0  # Upper bound of a single delay
+    jitter: bool = True
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    retry_on: Tuple[Type[Exception], ...] = ()  # Extra exception types to retry, whether or not they are SkyPulseErrors
+    hedge: bool = False
+    hedge_quantile: float = 0.95
+    hedge_min_samples: int = 20  # Latencies observed before hedging starts
+    hedge_delay: Optional[float] = None  # Fixed hedge delay, overrides the quantile
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if not 0 < self.hedge_quantile < 1:
+            raise ValueError("hedge_quantile must be between 0 and 1")
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Return True if a request failing with error may be retried."""
+        from .client import TransportError, APIError
+
+        if isinstance(error, TransportError) or isinstance(error, self.retry_on):
+            return True
+        return isinstance(error, APIError) and getattr(error, "status", None) in self.retry_statuses
+
+    def delay_for(self, error: BaseException, attempt: int) -> Optional[float]:
+        """Return seconds to wait before retrying after attempt failed, or None to give up.
+
+        Args:
+            error: The error raised by the failed attempt.
+            attempt: Number of the failed attempt, starting at 1.
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(error):
+            return None
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+class LatencyTracker:
+    """Sliding window of recent request latencies."""
+
+    def __init__(self, window: int = 256):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._sorted = None
+
+    def record(self, seconds: float) -> None:
+        """Add one observed latency."""
+        with self._lock:
+            self._samples.append(seconds)
+            self._sorted = None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return the q-quantile of the window, or None when it is empty."""
+        with self._lock:
+            if not self._samples:
+                return None
+            if self._sorted is None:
+                self._sorted = sorted(self._samples)
+            return self._sorted[min(len(self._sorted) - 1, int(q * len(self._sorted)))]
+
+    def __len__(self) -> int:
+        return len(self._samples)
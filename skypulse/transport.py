@@ -0,0 +1,98 @@
+"""HTTP transport configuration for SkyPulse."""
+
+from dataclasses import dataclass
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:  # aiohttp is imported on first async use
+    import aiohttp
+
+@dataclass
+class TransportConfig:
+    """Connection pooling and timeout settings for the sync and async transports."""
+    pool_connections: int = 10  # Number of per-host pools kept by requests
+    pool_maxsize: int = 32  # Connections kept alive per host
+    pool_block: bool = False  # Wait for a free connection instead of discarding extras
+    total_connections: int = 100  # aiohttp connector limit across all hosts
+    keep_alive: bool = True
+    keepalive_timeout: float = 30.0  # Seconds an idle aiohttp connection is kept
+    dns_cache_ttl: Optional[int] = 300  # Seconds aiohttp caches DNS results, None to disable
+    connect_timeout: Optional[float] = 10.0
+    read_timeout: Optional[float] = 30.0
+    compression: bool = True  # Ask for gzip/deflate (and brotli when installed) encoded responses
+
+    @property
+    def timeout(self) -> Tuple[Optional[float], Optional[float]]:
+        """Timeout tuple in the form accepted by requests."""
+        return (self.connect_timeout, self.read_timeout)
+
+def brotli_available() -> bool:
+    """Return True if a brotli decoder usable by requests and aiohttp is installed."""
+    return find_spec("brotli") is not None or find_spec("brotlicffi") is not None
+
+def accept_encoding(config: TransportConfig) -> str:
+    """Return the Accept-Encoding header value to send for config.
+
+    Only encodings both transports can decode are offered: brotli is added
+    when the Brotli package is installed (``pip install skypulse[fast]``).
+    """
+    if not config.compression:
+        return "identity"
+    return "br, gzip, deflate" if brotli_available() else "gzip, deflate"
+
+def default_headers(config: TransportConfig, user_agent: str) -> Dict[str, str]:
+    """Return the headers sent with every request."""
+    return {"User-Agent": user_agent, "Accept-Encoding": accept_encoding(config)}
+
+def session_headers(config: TransportConfig, headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Return the headers a requests session sends for config, adding ``Connection: close`` without keep-alive."""
+    headers = dict(headers or {})
+    if not config.keep_alive:
+        headers["Connection"] = "close"
+    return headers
+
+def create_session(config: TransportConfig, headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """Create a requests session with pooled adapters sized from config."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize,
+        pool_block=config.pool_block,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(session_headers(config, headers))
+    return session
+
+def create_connector(config: TransportConfig) -> "aiohttp.TCPConnector":
+    """Create an aiohttp connector from config. Must be called inside a running event loop."""
+    import aiohttp
+
+    if config.keep_alive:
+        return aiohttp.TCPConnector(
+            limit=config.total_connections,
+            limit_per_host=config.pool_maxsize,
+            keepalive_timeout=config.keepalive_timeout,
+            ttl_dns_cache=config.dns_cache_ttl,
+            use_dns_cache=config.dns_cache_ttl is not None,
+        )
+    return aiohttp.TCPConnector(
+        limit=config.total_connections,
+        limit_per_host=config.pool_maxsize,
+        force_close=True,
+        ttl_dns_cache=config.dns_cache_ttl,
+        use_dns_cache=config.dns_cache_ttl is not None,
+    )
+
+def create_client_timeout(config: TransportConfig) -> "aiohttp.ClientTimeout":
+    """Create the default aiohttp timeout from config."""
+    import aiohttp
+
+    return aiohttp.ClientTimeout(
+        total=None,
+        sock_connect=config.connect_timeout,
+        sock_read=config.read_timeout,
+    )
@@ -0,0 +1,218 @@
+"""Unit conversion for SkyPulse readings.
+
+Readings are taken from the API's metric fields and converted column by
+column: one pass over a whole array of values per quantity. NumPy is used
+for the arithmetic when installed, with a pure-Python fallback.
+
+A client with non-metric preferences (``SkyPulse.set_units``) leaves the
+metric fields of its responses (temp_C, windspeedKmph, ...) untouched and
+attaches the readings in the preferred units as ``response.converted``
+columns, with ``response.units`` naming the unit of each quantity.
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple, Union
+
+from .models import UnitPreferences, WttrResponse, LazyWttrResponse
+from .columnar import ColumnarView, _number, _get
+
+_UNLOADED = object()
+np: Any = _UNLOADED  # NumPy, imported on first use; None when it is not installed
+
+def _numpy() -> Any:
+    """Return the numpy module, or None if it is not installed."""
+    global np
+    if np is _UNLOADED:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover - exercised when NumPy is absent
+            numpy = None
+        np = numpy
+    return np
+
+# (scale, offset) applied to the metric value: converted = value * scale + offset
+CONVERSIONS: Dict[str, Dict[str, Tuple[float, float]]] = {
+    "temperature": {"C": (1.0, 0.0), "F": (9.0 / 5.0, 32.0)},
+    "wind_speed": {"kmh": (1.0, 0.0), "mph": (0.621371, 0.0), "ms": (1.0 / 3.6, 0.0)},
+    "pressure": {"mb": (1.0, 0.0), "in": (0.0295300, 0.0)},
+    "precipitation": {"mm": (1.0, 0.0), "in": (1.0 / 25.4, 0.0)},
+    "distance": {"km": (1.0, 0.0), "mi": (0.621371, 0.0)},
+}
+
+# Metric API fields and the quantity they measure
+FIELD_QUANTITIES: Dict[str, str] = {
+    "temp_C": "temperature", "FeelsLikeC": "temperature", "tempC": "temperature",
+    "HeatIndexC": "temperature", "DewPointC": "temperature", "WindChillC": "temperature",
+    "maxtempC": "temperature", "mintempC": "temperature", "avgtempC": "temperature",
+    "windspeedKmph": "wind_speed", "WindGustKmph": "wind_speed",
+    "pressure": "pressure",
+    "precipMM": "precipitation",
+    "visibility": "distance",
+}
+
+# Columns of a current-conditions snapshot: name -> (metric field, quantity or None)
+SNAPSHOT_FIELDS: Dict[str, Tuple[str, Optional[str]]] = {
+    "temperature": ("temp_C", "temperature"),
+    "feels_like": ("FeelsLikeC", "temperature"),
+    "wind_speed": ("windspeedKmph", "wind_speed"),
+    "pressure": ("pressure", "pressure"),
+    "precipitation": ("precipMM", "precipitation"),
+    "visibility": ("visibility", "distance"),
+    "humidity": ("humidity", None),
+    "cloudcover": ("cloudcover", None),
+}
+
+def convert_values(values: Sequence[float], quantity: str, unit: str) -> array:
+    """Convert metric values of one quantity to unit in a single batch pass.
+
+    Args:
+        values: Metric readings (any sequence of floats, e.g. array('d')).
+        quantity: "temperature", "wind_speed", "pressure", "precipitation"
+            or "distance".
+        unit: Target unit, e.g. "F" or "mph".
+
+    Returns:
+        A new array('d') with the converted values.
+    """
+    scale, offset = _conversion(quantity, unit)
+    result = array("d", values)
+    _apply_in_place(result, scale, offset)
+    return result
+
+def _conversion(quantity: str, unit: str) -> Tuple[float, float]:
+    try:
+        return CONVERSIONS[quantity][unit]
+    except KeyError:
+        raise ValueError(f"Unsupported unit '{unit}' for {quantity}")
+
+def _apply_in_place(values: array, scale: float, offset: float) -> None:
+    """Apply value * scale + offset to an array('d') in place."""
+    if scale == 1.0 and offset == 0.0:
+        return
+    numpy = _numpy()
+    if numpy is not None:
+        view = numpy.frombuffer(values, dtype=numpy.float64)
+        view *= scale
+        view += offset
+        return
+    values[:] = array("d", [value * scale + offset for value in values])
+
+class UnitConverter:
+    """Applies UnitPreferences to batches of readings."""
+
+    def __init__(self, preferences: Optional[UnitPreferences] = None):
+        """Initialize the converter.
+
+        Raises:
+            ValueError: If a preference names an unsupported unit.
+        """
+        self.preferences = preferences or UnitPreferences()
+        self.units: Dict[str, str] = {
+            quantity: getattr(self.preferences, quantity) for quantity in CONVERSIONS
+        }
+        for quantity, unit in self.units.items():
+            _conversion(quantity, unit)
+
+    @property
+    def is_metric(self) -> bool:
+        """True if every preference is the API's own metric unit (no conversion)."""
+        return all(CONVERSIONS[quantity][unit] == (1.0, 0.0) for quantity, unit in self.units.items())
+
+    def convert(self, values: Sequence[float], quantity: str) -> array:
+        """Convert metric values of a quantity to the preferred unit."""
+        return convert_values(values, quantity, self.units[quantity])
+
+    def convert_field(self, values: Sequence[float], field: str) -> array:
+        """Convert a column of a metric API field (e.g. "tempC") to the preferred unit."""
+        quantity = FIELD_QUANTITIES.get(field)
+        return array("d", values) if quantity is None else self.convert(values, quantity)
+
+    def convert_columns(self, data: Dict[str, Any]) -> Dict[str, Dict[str, array]]:
+        """Convert the readings of a metric API payload to the preferred units.
+
+        Each metric field (see FIELD_QUANTITIES) of the current conditions,
+        daily forecasts and hourly slots is gathered into one column and
+        converted in a single pass. The payload itself is not modified.
+
+        Returns:
+            ``{section: {field: array('d')}}`` for the sections
+            "current_condition", "weather" and "hourly" (every day's slots in
+            order), with NaN for unparsable readings; empty when no
+            conversion is needed.
+        """
+        if self.is_metric:
+            return {}
+        days = data.get("weather") or []
+        sections = {
+            "current_condition": data.get("current_condition") or [],
+            "weather": days,
+            "hourly": [hour for day in days for hour in day.get("hourly") or ()],
+        }
+        converted: Dict[str, Dict[str, array]] = {}
+        for section, records in sections.items():
+            columns = {}
+            for field, quantity in FIELD_QUANTITIES.items():
+                if records and field in records[0]:
+                    values = array("d", [_number(record.get(field)) for record in records])
+                    _apply_in_place(values, *_conversion(quantity, self.units[quantity]))
+                    columns[field] = values
+            if columns:
+                converted[section] = columns
+        return converted
+
+    def apply(self, view: ColumnarView) -> ColumnarView:
+        """Convert every unit-bearing column of a ColumnarView in place.
+
+        A view is converted at most once; its ``units`` attribute records
+        the unit of each converted quantity.
+        """
+        if view.units:
+            raise ValueError("ColumnarView has already been converted")
+        for table in (view.hourly, view.daily):
+            for field, values in table.columns.items():
+                quantity = FIELD_QUANTITIES.get(field)
+                if quantity is not None:
+                    _apply_in_place(values, *_conversion(quantity, self.units[quantity]))
+        view.units = dict(self.units)
+        return view
+
+    def snapshot(
+        self,
+        items: Iterable[Tuple[str, Union[WttrResponse, Dict[str, Any], Exception, None]]],
+    ) -> Dict[str, Any]:
+        """Build converted current-condition columns for many locations.
+
+        Args:
+            items: ``(location, response)`` pairs such as the output of
+                ``SkyPulse.fetch_many``; errors and empty results are skipped.
+
+        Returns:
+            A dict with a ``location`` list, one array('d') per reading in
+            SNAPSHOT_FIELDS, and ``units`` naming the unit of each column.
+        """
+        locations = []
+        columns = {name: array("d") for name in SNAPSHOT_FIELDS}
+        for location, response in items:
+            current = _current_condition(response)
+            if current is None:
+                continue
+            locations.append(location)
+            for name, (field, _) in SNAPSHOT_FIELDS.items():
+                columns[name].append(_number(_get(current, field)))
+
+        units = {}
+        for name, (_, quantity) in SNAPSHOT_FIELDS.items():
+            if quantity is not None:
+                _apply_in_place(columns[name], *_conversion(quantity, self.units[quantity]))
+                units[name] = self.units[quantity]
+        units["humidity"] = units["cloudcover"] = "%"
+        return dict(columns, location=locations, units=units)
+
+def _current_condition(response: Any) -> Any:
+    """Return the first current-condition record of a response or payload."""
+    if response is None or isinstance(response, Exception):
+        return None
+    if isinstance(response, LazyWttrResponse) and not response.is_decoded("current_condition"):
+        response = response.raw
+    conditions = response.get("current_condition") if isinstance(response, dict) else response.current_condition
+    return conditions[0] if conditions else None
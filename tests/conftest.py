@@ -0,0 +1,139 @@
+"""Shared offline fixtures for the SkyPulse test suite."""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import aiohttp
+import pytest
+import requests
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+# The mock wttr.in server lives with the benchmarks that also drive it
+sys.path.insert(0, str(Path(__file__).parent.parent / "benchmarks"))
+
+
+def load_payload(name: str = "london_j1.json") -> dict:
+    """Load a recorded wttr.in payload."""
+    with open(FIXTURES / name, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, payload, status_code=200, headers=None):
+        self._payload = payload
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = json.dumps(payload).encode() if payload is not None else b""
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error", response=self)
+
+
+class FakeSession:
+    """Minimal stand-in for requests.Session that records every call."""
+
+    def __init__(self, payload=None, status_code=200, headers=None):
+        self.payload = payload if payload is not None else load_payload()
+        self.status_code = status_code
+        self.response_headers = headers or {}
+        self.headers = {}
+        self.calls = []
+
+    def get(self, url, params=None, **kwargs):
+        self.calls.append((url, dict(params or {}), kwargs))
+        return FakeResponse(self.payload, self.status_code, dict(self.response_headers))
+
+    def close(self):
+        pass
+
+
+class FakeAsyncResponse:
+    """Minimal stand-in for aiohttp.ClientResponse."""
+
+    def __init__(self, payload, status=200, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._body = json.dumps(payload).encode() if payload is not None else b""
+
+    async def read(self):
+        return self._body
+
+    async def json(self, **kwargs):
+        return json.loads(self._body)
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            url = URL("http://fake.invalid/")
+            info = aiohttp.RequestInfo(url, "GET", CIMultiDictProxy(CIMultiDict()), url)
+            raise aiohttp.ClientResponseError(
+                info, (), status=self.status, message="error", headers=self.headers
+            )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeAsyncSession:
+    """Minimal stand-in for aiohttp.ClientSession with optional latency."""
+
+    def __init__(self, payload=None, status=200, headers=None, delay=0.0):
+        self.payload = payload if payload is not None else load_payload()
+        self.status = status
+        self.response_headers = headers or {}
+        self.delay = delay
+        self.calls = []
+        self.closed = False
+
+    def get(self, url, params=None, **kwargs):
+        self.calls.append((url, dict(params or {}), kwargs))
+        return _DelayedResponse(self, FakeAsyncResponse(self.payload, self.status, dict(self.response_headers)))
+
+    async def close(self):
+        self.closed = True
+
+
+class _DelayedResponse:
+    def __init__(self, session, response):
+        self._session = session
+        self._response = response
+
+    async def __aenter__(self):
+        if self._session.delay:
+            await asyncio.sleep(self._session.delay)
+        return self._response
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def j1_payload():
+    return load_payload("london_j1.json")
+
+
+@pytest.fixture
+def j2_payload():
+    return load_payload("london_j2.json")
+
+
+@pytest.fixture
+def wttr_server():
+    """A local mock wttr.in serving the recorded fixtures."""
+    from mock_wttr import MockWttrServer
+
+    with MockWttrServer() as server:
+        yield server
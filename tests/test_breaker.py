@@ -0,0 +1,138 @@
+import asyncio
+
+import pytest
+import requests
+
+from skypulse import SkyPulse, CircuitBreaker, CircuitOpenError, RetryPolicy, APIError
+from skypulse import breaker as breaker_module
+
+from conftest import FakeResponse, FakeSession, FakeAsyncSession
+
+
+class DownSession(FakeSession):
+    """Fails with connection errors while ``down`` is set."""
+
+    down = True
+
+    def get(self, url, params=None, **kwargs):
+        self.calls.append((url, dict(params or {}), kwargs))
+        if self.down:
+            raise requests.exceptions.ConnectionError("connection refused")
+        return FakeResponse(self.payload)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(breaker_module.time, "monotonic", clock)
+    return clock
+
+
+def test_circuit_opens_after_consecutive_failures(j1_payload, clock):
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=30)
+    client = SkyPulse(circuit_breaker=breaker)
+    client.session = DownSession(j1_payload)
+
+    for _ in range(3):
+        with pytest.raises(APIError):
+            client.get_weather("London")
+    assert breaker.state(client.base_url) == "open"
+
+    with pytest.raises(CircuitOpenError) as excinfo:
+        client.get_weather("London")
+    assert len(client.session.calls) == 3
+    assert excinfo.value.retry_in == 30
+
+
+def test_half_open_probe_closes_or_reopens(j1_payload, clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+    client = SkyPulse(circuit_breaker=breaker)
+    client.session = DownSession(j1_payload)
+
+    with pytest.raises(APIError):
+        client.get_weather("London")
+    clock.now += 10
+    with pytest.raises(APIError):
+        client.get_weather("London")  # Probe fails
+    assert breaker.state(client.base_url) == "open"
+    with pytest.raises(CircuitOpenError):
+        client.get_weather("London")
+
+    clock.now += 10
+    client.session.down = False
+    client.get_weather("London")
+    assert breaker.state(client.base_url) == "closed"
+    assert len(client.session.calls) == 3
+
+
+def test_breaker_is_keyed_per_host(j1_payload, clock):
+    breaker = CircuitBreaker(failure_threshold=1)
+    down = SkyPulse(api_url="https://mirror.invalid", circuit_breaker=breaker)
+    down.session = DownSession(j1_payload)
+    up = SkyPulse(circuit_breaker=breaker)
+    up.session = FakeSession(j1_payload)
+
+    with pytest.raises(APIError):
+        down.get_weather("London")
+    assert up.get_weather("London").current_condition
+    assert breaker.state("https://mirror.invalid") == "open"
+    assert breaker.state(up.base_url) == "closed"
+
+
+def test_client_errors_do_not_trip_the_breaker(j1_payload):
+    breaker = CircuitBreaker(failure_threshold=1)
+    client = SkyPulse(circuit_breaker=breaker)
+    client.session = FakeSession(j1_payload, status_code=404)
+    with pytest.raises(Exception):
+        client.get_weather("Atlantis")
+    assert breaker.state(client.base_url) == "closed"
+
+
+def test_open_circuit_stops_retries(j1_payload, clock):
+    breaker = CircuitBreaker(failure_threshold=2)
+    client = SkyPulse(circuit_breaker=breaker, retry=RetryPolicy(max_attempts=5, backoff_base=0))
+    client.session = DownSession(j1_payload)
+
+    with pytest.raises(CircuitOpenError):
+        client.get_weather("London")
+    assert len(client.session.calls) == 2
+
+
+def test_open_circuit_falls_back_to_last_known_payload(j1_payload, clock):
+    breaker = CircuitBreaker(failure_threshold=1)
+    client = SkyPulse(conditional=True, circuit_breaker=breaker)
+    client.session = FakeSession(j1_payload)
+    first = client.get_weather("London")
+
+    client.session = DownSession(j1_payload)
+    breaker.record_failure(client.base_url)
+
+    assert client.get_weather("London") is first
+    with pytest.raises(CircuitOpenError):
+        client.get_weather("Paris")
+    assert client.session.calls == []
+
+    breaker.fallback_to_cache = False
+    with pytest.raises(CircuitOpenError):
+        client.get_weather("London")
+
+
+def test_async_open_circuit_fails_fast(j1_payload, clock):
+    async def run():
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_failure("https://wttr.in")
+        async with SkyPulse(async_mode=True, circuit_breaker=breaker) as client:
+            client._async_session = FakeAsyncSession(j1_payload)
+            with pytest.raises(CircuitOpenError):
+                await client.get_weather_async("London")
+            return len(client._async_session.calls)
+
+    assert asyncio.run(run()) == 0
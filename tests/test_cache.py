@@ -0,0 +1,139 @@
+import asyncio
+import time
+
+from skypulse import SkyPulse, ResponseCache, DiskCache
+
+from conftest import FakeSession, FakeAsyncSession
+
+
+def test_derived_lookups_share_one_request(j1_payload):
+    client = SkyPulse(cache=ResponseCache(ttl=60))
+    client.session = FakeSession(j1_payload)
+
+    client.get_weather("London")
+    client.get_current_weather("London")
+    client.get_forecast("London")
+    client.get_location_info("London")
+
+    assert len(client.session.calls) == 1
+    assert client.cache.stats.hits == 3
+    assert client.cache.stats.misses == 1
+
+
+def test_cache_key_includes_location_and_format(j1_payload):
+    cache = ResponseCache(ttl=60)
+    j1 = SkyPulse(cache=cache)
+    j2 = SkyPulse(format="j2", cache=cache)
+    j1.session = j2.session = FakeSession(j1_payload)
+
+    j1.get_weather("London")
+    j1.get_weather("Paris")
+    j2.get_weather("London")
+
+    assert len(j1.session.calls) == 3
+    assert len(cache) == 3
+
+
+def test_entries_expire_after_ttl():
+    cache = ResponseCache(ttl=0.05)
+    key = ResponseCache.make_key("https://wttr.in", "London", "j1", {})
+    cache.set(key, {"ok": True})
+    assert cache.get(key) == {"ok": True}
+
+    time.sleep(0.06)
+    assert cache.get(key) is None
+    assert cache.stats.expirations == 1
+
+
+def test_lru_eviction():
+    cache = ResponseCache(ttl=60, maxsize=2)
+    a, b, c = (ResponseCache.make_key("u", name, "j1", {}) for name in "abc")
+    cache.set(a, {"a": 1})
+    cache.set(b, {"b": 1})
+    cache.get(a)
+    cache.set(c, {"c": 1})
+
+    assert a in cache and c in cache
+    assert b not in cache
+    assert cache.stats.evictions == 1
+
+
+def test_async_requests_use_cache(j1_payload):
+    async def run():
+        client = SkyPulse(async_mode=True, cache=ResponseCache(ttl=60))
+        client._async_session = FakeAsyncSession(j1_payload)
+        await client.get_current_weather_async("London")
+        await client.get_forecast_async("London")
+        return client
+
+    client = asyncio.run(run())
+    assert len(client._async_session.calls) == 1
+    assert client.cache.stats.hit_rate == 0.5
+
+
+def test_disk_cache_survives_restart(tmp_path, j1_payload):
+    path = str(tmp_path / "weather.db")
+    first = SkyPulse(cache=DiskCache(path, ttl=60))
+    first.session = FakeSession(j1_payload)
+    first.get_weather("London")
+    first.cache.close()
+
+    second = SkyPulse(cache=DiskCache(path, ttl=60))
+    second.session = FakeSession(j1_payload)
+    response = second.get_weather("London")
+
+    assert second.session.calls == []
+    assert response.current_condition[0].temp_C == "11"
+
+
+def test_disk_cache_stores_raw_response_body(tmp_path, j1_payload):
+    client = SkyPulse(cache=DiskCache(str(tmp_path / "weather.db"), ttl=60))
+    client.session = FakeSession(j1_payload)
+    client.get_weather("London")
+
+    key = ResponseCache.make_key(client.base_url, "London", "j1", {"format": "j1"})
+    assert client.cache._load(key)[1] == client.session.get("London").content
+    assert client.cache.get(key) == j1_payload
+
+
+def test_disk_cache_prunes_oldest_entries(tmp_path):
+    cache = DiskCache(str(tmp_path / "weather.db"), maxsize=2)
+    for name in "abc":
+        cache.set(ResponseCache.make_key("u", name, "j1", {}), {"name": name})
+    assert len(cache) == 2
+    assert ResponseCache.make_key("u", "a", "j1", {}) not in cache
+
+
+def test_stale_entry_served_while_revalidating(tmp_path, j1_payload):
+    cache = DiskCache(str(tmp_path / "weather.db"), ttl=0.01, stale_ttl=60)
+    client = SkyPulse(cache=cache)
+    client.session = FakeSession(j1_payload)
+    client.get_weather("London")
+    time.sleep(0.02)
+
+    client.session.payload = dict(j1_payload, request=[{"type": "City", "query": "Refreshed"}])
+    stale = client.get_weather("London")
+    assert stale.request[0].query == "London, United Kingdom"
+
+    deadline = time.monotonic() + 2
+    while client._revalidating and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(client.session.calls) == 2
+    assert cache.stats.stale_hits == 1
+    key = ResponseCache.make_key(client.base_url, "London", "j1", {"format": "j1"})
+    assert cache.get_stale(key)["request"][0]["query"] == "Refreshed"
+
+
+def test_async_stale_entry_revalidates_in_background(j1_payload):
+    async def run():
+        client = SkyPulse(async_mode=True, cache=ResponseCache(ttl=0.01, stale_ttl=60))
+        client._async_session = FakeAsyncSession(j1_payload)
+        await client.get_weather_async("London")
+        await asyncio.sleep(0.02)
+        await client.get_weather_async("London")
+        await asyncio.gather(*client._background_tasks)
+        return client
+
+    client = asyncio.run(run())
+    assert len(client._async_session.calls) == 2
+    assert client.cache.stats.stale_hits == 1
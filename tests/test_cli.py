@@ -0,0 +1,102 @@
+import csv
+import io
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from conftest import FakeSession
+import skypulse.cli as cli
+from skypulse.export import CURRENT_SCHEMA
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    """Route every client the CLI creates through a FakeSession and record it."""
+    created = []
+    client_class = cli.SkyPulse
+
+    def make_client(status_code=200):
+        def factory(**kwargs):
+            session = FakeSession(status_code=status_code)
+            created.append(session)
+            return client_class(session=session, **kwargs)
+        monkeypatch.setattr(cli, "SkyPulse", factory)
+        return created
+
+    return make_client
+
+
+def test_read_locations_skips_blanks_and_comments():
+    source = io.StringIO("London\n\n  # office list\n  New York \nParis\n")
+    assert list(cli.read_locations(source)) == ["London", "New York", "Paris"]
+
+
+def test_batch_streams_ndjson_from_stdin(sessions):
+    created = sessions()
+    result = CliRunner().invoke(cli.app, ["batch", "-c", "4"], input="London\n# skip\nParis\nTokyo\n")
+
+    assert result.exit_code == 0
+    records = [json.loads(line) for line in result.stdout.splitlines() if line.startswith("{")]
+    assert sorted(record["location"] for record in records) == ["London", "Paris", "Tokyo"]
+    assert records[0]["temp_C"] == 11  # Typed decoding keeps numbers numeric
+    assert records[0]["description"] == "Partly cloudy"
+    assert records[0]["error"] is None
+    # One pooled client serves the whole batch
+    assert len(created) == 1 and len(created[0].calls) == 3
+
+
+def test_batch_writes_csv_file(sessions, tmp_path):
+    sessions()
+    locations = tmp_path / "locations.txt"
+    locations.write_text("London\nParis\n", encoding="utf-8")
+    output = tmp_path / "out.csv"
+
+    result = CliRunner().invoke(cli.app, ["batch", str(locations), "-f", "csv", "-o", str(output), "--ordered"])
+
+    assert result.exit_code == 0
+    with open(output, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["location"] for row in rows] == ["London", "Paris"]
+    assert rows[0]["country"] == "United Kingdom"
+    assert list(rows[0]) == list(CURRENT_SCHEMA)
+
+
+def test_batch_reports_failures(sessions):
+    sessions(status_code=500)
+    result = CliRunner().invoke(cli.app, ["batch"], input="London\n")
+
+    assert result.exit_code == 1
+    record = json.loads(result.stdout.splitlines()[0])
+    assert record["location"] == "London"
+    assert record["error"] and record["temp_C"] is None
+
+
+def test_batch_rejects_unknown_format(sessions):
+    created = sessions()
+    result = CliRunner().invoke(cli.app, ["batch", "-f", "xml"], input="London\n")
+
+    assert result.exit_code == 2
+    assert not created
+
+
+def test_batch_writes_hourly_parquet(sessions, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    sessions()
+    output = tmp_path / "hourly.parquet"
+
+    result = CliRunner().invoke(cli.app, ["batch", "-s", "hourly", "-f", "parquet", "-o", str(output)], input="London\nParis\n")
+
+    assert result.exit_code == 0
+    table = pq.read_table(output)
+    assert set(table.column("location").to_pylist()) == {"London", "Paris"}
+    assert table.num_rows == 2 * 24  # 3 days of 8 three-hourly rows per location
+    assert table.schema.field("tempC").type == "double"
+
+
+def test_export_data_streams_records(tmp_path):
+    output = tmp_path / "rows.ndjson"
+    records = ({"location": f"city-{i}", "temp_C": i} for i in range(3))
+
+    assert cli.export_data(records, "ndjson", str(output)) == output
+    assert [json.loads(line)["temp_C"] for line in output.read_text().splitlines()] == [0, 1, 2]
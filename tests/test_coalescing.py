@@ -0,0 +1,71 @@
+import asyncio
+
+from skypulse import SkyPulse, APIError
+
+from conftest import FakeAsyncSession
+
+
+def run_with_session(coro_factory, session):
+    async def run():
+        client = SkyPulse(async_mode=True)
+        client._async_session = session
+        return client, await coro_factory(client)
+
+    return asyncio.run(run())
+
+
+def test_burst_of_identical_requests_shares_upstream_calls(j1_payload):
+    session = FakeAsyncSession(j1_payload, delay=0.05)
+    cities = [f"City{i}" for i in range(20)]
+
+    async def burst(client):
+        return await asyncio.gather(*(client.get_weather_async(cities[i % 20]) for i in range(500)))
+
+    client, results = run_with_session(burst, session)
+
+    assert len(results) == 500
+    assert len(session.calls) == 20
+    assert client._inflight == {}
+
+
+def test_compare_locations_with_duplicates(j1_payload):
+    session = FakeAsyncSession(j1_payload, delay=0.01)
+
+    async def compare(client):
+        return await client.compare_locations_async(["London", "London", "Paris"])
+
+    _, result = run_with_session(compare, session)
+
+    assert set(result) == {"London", "Paris"}
+    assert len(session.calls) == 2
+
+
+def test_errors_are_shared_and_not_cached(j1_payload):
+    session = FakeAsyncSession(j1_payload, status=500, delay=0.01)
+
+    async def burst(client):
+        return await asyncio.gather(
+            *(client.get_weather_async("London") for _ in range(5)), return_exceptions=True
+        )
+
+    client, results = run_with_session(burst, session)
+
+    assert all(isinstance(r, APIError) for r in results)
+    assert len(session.calls) == 1
+    assert client._inflight == {}
+
+
+def test_cancelled_caller_does_not_cancel_shared_request(j1_payload):
+    session = FakeAsyncSession(j1_payload, delay=0.05)
+
+    async def scenario(client):
+        first = asyncio.ensure_future(client.get_weather_async("London"))
+        second = asyncio.ensure_future(client.get_weather_async("London"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second
+
+    _, response = run_with_session(scenario, session)
+
+    assert response.current_condition[0].temp_C == "11"
+    assert len(session.calls) == 1
@@ -0,0 +1,61 @@
+import math
+
+import pytest
+
+from skypulse import ColumnarView, WttrResponse, APIError
+
+
+def test_hourly_records_are_decoded(j1_payload):
+    day = WttrResponse.from_dict(j1_payload).weather[0]
+
+    assert len(day.hourly) == 8
+    assert day.hourly[4].time == "1200"
+    assert day.hourly[4].tempC == "10"
+    assert day.hourly[4].weatherDesc[0].value == "Light rain"
+
+
+def test_j2_has_no_hourly_records(j2_payload):
+    assert WttrResponse.from_dict(j2_payload).weather[0].hourly == []
+
+
+def test_columnar_view_from_mixed_sources(j1_payload, j2_payload):
+    view = ColumnarView.from_responses([
+        ("London", j1_payload),
+        ("Paris", WttrResponse.from_dict(j1_payload, typed=True)),
+        ("Rome", WttrResponse.from_dict(j1_payload, lazy=True)),
+        ("Oslo", j2_payload),
+        ("Nowhere", APIError("boom")),
+    ])
+
+    assert view.locations == ["London", "Paris", "Rome", "Oslo"]
+    assert len(view.daily) == 12
+    assert len(view.hourly) == 72
+    assert list(view.hourly.time[:3]) == [0, 300, 600]
+    assert view.daily.date[0] == 20240117
+    assert list(view.hourly.column("tempC")[:8]) == [6.0, 7.0, 8.0, 9.0, 10.0, 6.0, 7.0, 8.0]
+    assert view.hourly.rows_for(view.location_id("Rome")) == list(range(48, 72))
+    assert view.daily.rows_for(view.location_id("Oslo")) == [9, 10, 11]
+
+
+def test_lazy_response_is_read_without_building_models(j1_payload):
+    response = WttrResponse.from_dict(j1_payload, lazy=True)
+    ColumnarView().add("London", response)
+    assert not response.is_decoded("weather")
+
+
+def test_unparsable_values_become_nan(j1_payload):
+    j1_payload["weather"][0]["hourly"][0]["tempC"] = ""
+    view = ColumnarView.from_responses([("London", j1_payload)])
+    assert math.isnan(view.hourly.column("tempC")[0])
+
+
+def test_to_numpy_is_zero_copy(j1_payload):
+    np = pytest.importorskip("numpy")
+    view = ColumnarView.from_responses([("London", j1_payload), ("Paris", j1_payload)])
+
+    arrays = view.to_numpy()
+    assert arrays["hourly"]["tempC"].shape == (48,)
+    assert arrays["daily"]["maxtempC"].tolist() == [10.0, 11.0, 12.0] * 2
+    assert np.nanmean(arrays["hourly"]["precipMM"]) == pytest.approx(0.35)
+    view.hourly.column("tempC")[0] = 99.0
+    assert arrays["hourly"]["tempC"][0] == 99.0
@@ -0,0 +1,111 @@
+import asyncio
+import copy
+
+from skypulse import SkyPulse
+
+from conftest import FakeResponse, FakeSession, FakeAsyncResponse, FakeAsyncSession
+
+
+class ETagSession(FakeSession):
+    """Answers 304 when the client presents the current ETag."""
+
+    etag = '"v1"'
+
+    def get(self, url, params=None, **kwargs):
+        self.calls.append((url, dict(params or {}), kwargs))
+        if (kwargs.get("headers") or {}).get("If-None-Match") == self.etag:
+            return FakeResponse(None, 304, {"ETag": self.etag})
+        return FakeResponse(self.payload, 200, {"ETag": self.etag, "Last-Modified": "Wed, 17 Jan 2024 10:20:00 GMT"})
+
+
+def test_not_modified_reuses_parsed_response(j1_payload):
+    client = SkyPulse(conditional=True)
+    client.session = ETagSession(j1_payload)
+
+    first = client.get_weather("London")
+    second = client.get_weather("London")
+
+    assert second is first
+    assert client.session.calls[0][2]["headers"] is None
+    assert client.session.calls[1][2]["headers"] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 17 Jan 2024 10:20:00 GMT",
+    }
+    assert client.validators.not_modified == 1
+
+
+def test_changed_etag_decodes_new_payload(j1_payload):
+    client = SkyPulse(conditional=True)
+    client.session = ETagSession(j1_payload)
+    first = client.get_weather("London")
+
+    client.session.etag = '"v2"'
+    client.session.payload = copy.deepcopy(j1_payload)
+    client.session.payload["current_condition"][0].update(observation_time="11:20 AM", temp_C="12")
+    second = client.get_weather("London")
+
+    assert second is not first
+    assert second.current_condition[0].temp_C == "12"
+
+
+def test_new_etag_with_same_observation_returns_new_data(j1_payload):
+    client = SkyPulse(conditional=True)
+    client.session = ETagSession(j1_payload)
+    first = client.get_weather("London")
+
+    # The forecast changed but the current observation did not.
+    client.session.etag = '"v2"'
+    client.session.payload = copy.deepcopy(j1_payload)
+    client.session.payload["weather"][0]["maxtempC"] = "99"
+    second = client.get_weather("London")
+
+    assert second is not first
+    assert second.weather[0].maxtempC == "99"
+    assert client.validators.unchanged == 0
+    # The new ETag is stored next to the new payload, so a 304 keeps serving it.
+    assert client.get_weather("London").weather[0].maxtempC == "99"
+    assert client.validators.not_modified == 1
+
+
+def test_unchanged_observation_skips_model_rebuild_without_validators(j1_payload):
+    client = SkyPulse(conditional=True)
+    client.session = FakeSession(j1_payload)
+    first = client.get_weather("London")
+
+    # Same observation, different bytes (e.g. a reordered body): still reused.
+    client.session.payload = dict(reversed(list(j1_payload.items())))
+    second = client.get_weather("London")
+
+    assert second is first
+    assert client.validators.unchanged == 1
+    assert client.session.calls[1][2]["headers"] is None
+
+
+def test_async_not_modified(j1_payload):
+    class AsyncETagSession(FakeAsyncSession):
+        def get(self, url, params=None, **kwargs):
+            self.calls.append((url, dict(params or {}), kwargs))
+            if (kwargs.get("headers") or {}).get("If-None-Match") == '"v1"':
+                return FakeAsyncResponse(None, 304)
+            return FakeAsyncResponse(self.payload, 200, {"ETag": '"v1"'})
+
+    async def run():
+        client = SkyPulse(async_mode=True, conditional=True)
+        client._async_session = AsyncETagSession(j1_payload)
+        first = await client.get_weather_async("London")
+        second = await client.get_weather_async("London")
+        return client, first, second
+
+    client, first, second = asyncio.run(run())
+    assert second is first
+    assert client.validators.not_modified == 1
+
+
+def test_disabled_by_default(j1_payload):
+    client = SkyPulse()
+    client.session = ETagSession(j1_payload)
+    client.get_weather("London")
+    client.get_weather("London")
+
+    assert client.validators is None
+    assert all(call[2]["headers"] is None for call in client.session.calls)
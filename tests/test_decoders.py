@@ -0,0 +1,55 @@
+import asyncio
+import json
+
+import pytest
+
+from skypulse import SkyPulse, APIError
+from skypulse.decoders import AVAILABLE_DECODERS, DEFAULT_DECODER_NAME, get_decoder
+
+from conftest import FakeSession, FakeAsyncSession
+
+
+def test_stdlib_is_always_available():
+    assert get_decoder("json") is json.loads
+    assert DEFAULT_DECODER_NAME == next(iter(AVAILABLE_DECODERS))
+
+
+def test_unknown_decoder_rejected():
+    with pytest.raises(ValueError):
+        get_decoder("simdjson-not-installed")
+
+
+@pytest.mark.parametrize("name", list(AVAILABLE_DECODERS))
+def test_decoders_accept_raw_bytes(name, j1_payload):
+    raw = json.dumps(j1_payload).encode()
+    assert get_decoder(name)(raw) == j1_payload
+
+
+def test_client_decodes_raw_bytes_with_custom_decoder(j1_payload):
+    seen = []
+
+    def decoder(raw):
+        seen.append(type(raw))
+        return json.loads(raw)
+
+    client = SkyPulse(json_decoder=decoder)
+    client.session = FakeSession(j1_payload)
+    client.get_weather("London")
+
+    async def run():
+        async_client = SkyPulse(async_mode=True, json_decoder=decoder)
+        async_client._async_session = FakeAsyncSession(j1_payload)
+        await async_client.get_weather_async("London")
+
+    asyncio.run(run())
+    assert seen == [bytes, bytes]
+
+
+def test_invalid_json_raises_api_error():
+    client = SkyPulse(json_decoder="json")
+    client.session = FakeSession({"ok": True})
+    client.session.get = lambda *a, **k: type("R", (), {
+        "status_code": 200, "headers": {}, "content": b"<html>oops</html>", "raise_for_status": lambda self: None})()
+
+    with pytest.raises(APIError):
+        client.get_weather("London")
@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+import requests
+
+from skypulse import SkyPulse, EndpointPool, CircuitBreaker, LocationError
+
+from conftest import FakeResponse, FakeSession, FakeAsyncResponse, FakeAsyncSession, _DelayedResponse
+
+MIRRORS = ["https://a.example", "https://b.example", "https://c.example"]
+
+
+class MirrorSession(FakeSession):
+    """Answers per host; hosts listed in ``down`` refuse connections."""
+
+    def __init__(self, payload, down=(), status=None):
+        super().__init__(payload)
+        self.down = set(down)
+        self.status = dict(status or {})
+
+    def get(self, url, params=None, **kwargs):
+        self.calls.append((url, dict(params or {}), kwargs))
+        host = url.rsplit("/", 1)[0]
+        if host in self.down:
+            raise requests.exceptions.ConnectionError("connection refused")
+        return FakeResponse(self.payload, self.status.get(host, 200))
+
+
+def hosts(session):
+    return [url.rsplit("/", 1)[0] for url, _, _ in session.calls]
+
+
+def test_round_robin_spreads_requests(j1_payload):
+    client = SkyPulse(api_url=MIRRORS)
+    client.session = MirrorSession(j1_payload)
+
+    for _ in range(6):
+        client.get_weather("London")
+
+    assert hosts(client.session) == MIRRORS * 2
+    assert client.base_url == MIRRORS[0]
+
+
+def test_failover_to_next_endpoint(j1_payload):
+    client = SkyPulse(api_url=MIRRORS)
+    client.session = MirrorSession(j1_payload, down={MIRRORS[0]}, status={MIRRORS[1]: 502})
+
+    assert client.get_weather("London").current_condition
+    assert hosts(client.session) == MIRRORS
+    assert client.endpoints.stats(MIRRORS[0]).consecutive_failures == 1
+
+    # Failing endpoints move to the back until they recover
+    assert client.endpoints.order()[0] == MIRRORS[2]
+
+
+def test_client_errors_do_not_fail_over(j1_payload):
+    client = SkyPulse(api_url=MIRRORS)
+    client.session = MirrorSession(j1_payload, status={host: 404 for host in MIRRORS})
+
+    with pytest.raises(LocationError):
+        client.get_weather("Atlantis")
+    assert len(client.session.calls) == 1
+
+
+def test_least_latency_prefers_fastest_endpoint():
+    pool = EndpointPool(MIRRORS, strategy="least_latency", alpha=0.5)
+    assert pool.order() == MIRRORS  # Unmeasured endpoints keep configuration order
+
+    pool.record_success(MIRRORS[0], 0.30)
+    pool.record_success(MIRRORS[1], 0.05)
+    pool.record_success(MIRRORS[2], 0.10)
+    assert pool.order() == [MIRRORS[1], MIRRORS[2], MIRRORS[0]]
+
+    pool.record_success(MIRRORS[1], 0.45)  # EWMA: 0.05 -> 0.25
+    assert pool.stats(MIRRORS[1]).latency == pytest.approx(0.25)
+    assert pool.order() == [MIRRORS[2], MIRRORS[1], MIRRORS[0]]
+
+
+def test_open_circuits_are_skipped(j1_payload):
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.record_failure(MIRRORS[0])
+    client = SkyPulse(api_url=MIRRORS[:2], circuit_breaker=breaker)
+    client.session = MirrorSession(j1_payload)
+
+    client.get_weather("London")
+    client.get_weather("London")
+
+    assert hosts(client.session) == [MIRRORS[1], MIRRORS[1]]
+
+
+def test_invalid_pool_configuration():
+    with pytest.raises(ValueError):
+        EndpointPool([])
+    with pytest.raises(ValueError):
+        SkyPulse(api_url=MIRRORS, load_balancing="random")
+
+
+def test_async_failover(j1_payload):
+    class Mirrors(FakeAsyncSession):
+        def get(self, url, params=None, **kwargs):
+            self.calls.append((url, dict(params or {}), kwargs))
+            status = 503 if url.startswith(MIRRORS[0]) else 200
+            return _DelayedResponse(self, FakeAsyncResponse(self.payload, status))
+
+    async def run():
+        async with SkyPulse(api_url=MIRRORS[:2], async_mode=True) as client:
+            client._async_session = Mirrors(j1_payload)
+            await client.get_weather_async("London")
+            return hosts(client._async_session)
+
+    assert asyncio.run(run()) == MIRRORS[:2]
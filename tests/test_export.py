@@ -0,0 +1,171 @@
+import csv
+import io
+import json
+
+import pytest
+
+from conftest import FakeSession, load_payload
+from skypulse import SkyPulse, UnitPreferences
+from skypulse.export import (
+    CURRENT_SCHEMA,
+    DAILY_SCHEMA,
+    HOURLY_SCHEMA,
+    EXPORTERS,
+    NDJSONExporter,
+    current_records,
+    daily_records,
+    export_records,
+    get_exporter,
+    hourly_records,
+)
+from skypulse.models import WttrResponse
+
+
+@pytest.fixture
+def items():
+    payload = load_payload()
+    return [
+        ("London", WttrResponse.from_dict(payload)),
+        ("Paris", WttrResponse.from_dict(payload, lazy=True)),
+        ("Atlantis", ValueError("Unknown location")),
+    ]
+
+
+def test_current_records_flatten_and_type_readings(items):
+    records = list(current_records(items))
+
+    assert [record["location"] for record in records] == ["London", "Paris", "Atlantis"]
+    assert records[0] == records[1] | {"location": "London"}  # Lazy payloads read the same
+    assert records[0]["temp_C"] == 11 and records[0]["precipMM"] == 0.1
+    assert records[0]["description"] == "Partly cloudy"
+    assert all(list(record) == list(CURRENT_SCHEMA) for record in records)
+    assert records[2]["error"] == "Unknown location" and records[2]["temp_C"] is None
+
+
+def test_fractional_readings_are_kept():
+    payload = load_payload()
+    payload["current_condition"][0].update(temp_C="10.5", pressure="1012.3")
+    payload["weather"][0].update(maxtempC="10.5")
+
+    current = next(current_records([("London", WttrResponse.from_dict(payload))]))
+    daily = next(daily_records([("London", payload)]))
+
+    assert current["temp_C"] == 10.5 and current["pressure"] == 1012.3
+    assert current["humidity"] == 82.0
+    assert daily["maxtempC"] == 10.5
+
+
+def test_unit_converted_client_exports_metric_readings():
+    payload = load_payload()
+    client = SkyPulse(session=FakeSession(payload))
+    client.set_units(UnitPreferences(temperature="F", wind_speed="mph", pressure="in"))
+    items = [("London", client.get_weather("London"))]
+
+    record = next(current_records(items))
+
+    assert record["temp_C"] == 11 and record["FeelsLikeC"] is not None
+    assert record["windspeedKmph"] == 19 and record["pressure"] is not None
+    assert next(hourly_records(items))["tempC"] == 6
+
+
+def test_series_records_cover_every_day_and_hour(items):
+    hourly = list(hourly_records(items[:1]))
+    daily = list(daily_records(items[:1]))
+
+    assert len(hourly) == 24 and list(hourly[0]) == list(HOURLY_SCHEMA)
+    assert hourly[0]["date"] == "2024-01-17" and hourly[1]["time"] == 300
+    assert len(daily) == 3 and daily[0]["sunrise"] == "07:59 AM"
+    assert list(daily[0]) == list(DAILY_SCHEMA)
+
+
+def test_ndjson_and_json_round_trip(items):
+    lines, array = io.StringIO(), io.StringIO()
+    assert export_records(current_records(items), "ndjson", lines) == 3
+    export_records(current_records(items), "json", array)
+
+    parsed = [json.loads(line) for line in lines.getvalue().splitlines()]
+    assert parsed == json.loads(array.getvalue())
+    assert parsed[0]["country"] == "United Kingdom"
+
+
+def test_json_exporter_writes_empty_array():
+    out = io.StringIO()
+    assert export_records([], "json", out) == 0
+    assert json.loads(out.getvalue()) == []
+
+
+def test_csv_without_schema_uses_first_record_and_encodes_nested_values():
+    out = io.StringIO()
+    export_records([{"location": "London", "extra": {"a": 1}}], "csv", out)
+
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert rows == [{"location": "London", "extra": '{"a": 1}'}]
+
+
+def test_stream_targets_are_flushed_and_left_open():
+    class Stream(io.StringIO):
+        flushes = 0
+
+        def flush(self):
+            self.flushes += 1
+            super().flush()
+
+    out = Stream()
+    with NDJSONExporter(out) as exporter:
+        exporter.write({"location": "London"})
+        assert out.flushes == 1  # Visible to the reader of a pipe right away
+    assert not out.closed
+
+
+def test_unknown_format_raises():
+    with pytest.raises(ValueError, match="Unsupported export format"):
+        get_exporter("xml", io.StringIO())
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow"])
+def test_columnar_formats_write_in_batches(tmp_path, items, format):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    path = tmp_path / f"hourly.{format}"
+    with EXPORTERS[format](path, HOURLY_SCHEMA, batch_size=10) as exporter:
+        exporter.write_many(hourly_records(items))
+
+    if format == "parquet":
+        table = pq.read_table(path)
+        assert pq.ParquetFile(path).num_row_groups == 5  # 49 rows in batches of 10
+    else:
+        reader = pa.ipc.open_file(path)
+        table = reader.read_all()
+        assert reader.num_record_batches == 5
+    assert table.num_rows == 49
+    assert table.schema.field("tempC").type == pa.float64()
+    assert table.column("error").to_pylist()[-1] == "Unknown location"
+
+
+def test_columnar_schema_inferred_from_first_record(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+
+    path = tmp_path / "rows.arrow"
+    export_records([{"location": "London", "temp_C": 11, "uv": 1.5}, {"location": "Paris", "temp_C": "n/a"}], "arrow", path)
+
+    table = pa.ipc.open_file(path).read_all()
+    assert table.to_pylist() == [
+        {"location": "London", "temp_C": 11, "uv": 1.5},
+        {"location": "Paris", "temp_C": None, "uv": None},
+    ]
+
+
+def test_columnar_formats_require_pyarrow(monkeypatch, tmp_path):
+    import builtins
+
+    real_import = builtins.__import__
+
+    def without_pyarrow(name, *args, **kwargs):
+        if name.startswith("pyarrow"):
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", without_pyarrow)
+    with pytest.raises(ImportError, match="skypulse\\[arrow\\]"):
+        get_exporter("parquet", tmp_path / "out.parquet", CURRENT_SCHEMA)
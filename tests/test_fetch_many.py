@@ -0,0 +1,127 @@
+import asyncio
+import threading
+import time
+
+from skypulse import SkyPulse, LocationError, TransportError, WttrResponse
+
+from conftest import FakeSession, FakeAsyncSession, FakeAsyncResponse
+
+
+class SlowSession(FakeSession):
+    """Sync session that sleeps per location and tracks peak concurrency."""
+
+    def __init__(self, payload, delays):
+        super().__init__(payload)
+        self.delays = delays
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, **kwargs):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delays.get(url.rsplit("/", 1)[-1], 0.01))
+            return super().get(url, params, **kwargs)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class SlowAsyncSession(FakeAsyncSession):
+    """Async session whose responses take delay seconds, tracking peak concurrency."""
+
+    def __init__(self, payload, delay):
+        super().__init__(payload)
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+
+    def get(self, url, params=None, **kwargs):
+        self.calls.append((url, dict(params or {}), kwargs))
+        return _TrackedResponse(self, FakeAsyncResponse(self.payload))
+
+
+class _TrackedResponse:
+    def __init__(self, session, response):
+        self._session = session
+        self._response = response
+
+    async def __aenter__(self):
+        self._session.active += 1
+        self._session.peak = max(self._session.peak, self._session.active)
+        await asyncio.sleep(self._session.delay)
+        return self._response
+
+    async def __aexit__(self, *exc):
+        self._session.active -= 1
+        return False
+
+
+def test_fetch_many_streams_in_completion_order(j1_payload):
+    client = SkyPulse()
+    client.session = SlowSession(j1_payload, {"Slow": 0.2})
+
+    results = list(client.fetch_many(["Slow", "A", "B", "C"], concurrency=4))
+
+    assert [location for location, _ in results][-1] == "Slow"
+    assert all(isinstance(result, WttrResponse) for _, result in results)
+
+
+def test_fetch_many_ordered_and_bounded(j1_payload):
+    client = SkyPulse()
+    client.session = SlowSession(j1_payload, {"Slow": 0.1})
+    locations = ["Slow"] + [f"City{i}" for i in range(20)]
+
+    results = list(client.fetch_many(iter(locations), concurrency=3, ordered=True))
+
+    assert [location for location, _ in results] == locations
+    assert client.session.peak <= 3
+
+
+def test_fetch_many_yields_errors(j1_payload):
+    client = SkyPulse()
+    client.session = FakeSession(j1_payload, status_code=404)
+
+    [(location, error)] = list(client.fetch_many(["Nowhere"]))
+
+    assert location == "Nowhere"
+    assert isinstance(error, LocationError)
+
+
+def collect_async(session, locations, **kwargs):
+    async def run():
+        client = SkyPulse(async_mode=True)
+        client._async_session = session
+        return [item async for item in client.fetch_many_async(locations, **kwargs)]
+
+    return asyncio.run(run())
+
+
+def test_fetch_many_async_bounded_concurrency(j1_payload):
+    session = SlowAsyncSession(j1_payload, delay=0.01)
+    locations = (f"City{i}" for i in range(100))
+
+    results = collect_async(session, locations, concurrency=10, ordered=True)
+
+    assert [location for location, _ in results] == [f"City{i}" for i in range(100)]
+    assert all(isinstance(result, WttrResponse) for _, result in results)
+    assert len(session.calls) == 100
+    assert 1 < session.peak <= 10
+
+    session = SlowAsyncSession(j1_payload, delay=0.01)
+    results = collect_async(session, (f"City{i}" for i in range(100)), concurrency=10)
+
+    assert len(results) == 100 and all(isinstance(result, WttrResponse) for _, result in results)
+    assert 1 < session.peak <= 10
+
+
+def test_fetch_many_async_per_request_timeout(j1_payload):
+    session = FakeAsyncSession(j1_payload, delay=0.2)
+
+    [(location, error)] = collect_async(session, ["London"], timeout=0.01)
+
+    assert location == "London"
+    assert isinstance(error, TransportError)
+    assert "timed out" in str(error)
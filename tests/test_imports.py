@@ -0,0 +1,30 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY = ("openai", "aiohttp", "numpy", "rich.live", "rich.markdown", "rich.progress")
+
+
+def _loaded_after(module):
+    code = f"import sys, {module}; print(' '.join(sorted(sys.modules)))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize("module", ["skypulse", "skypulse.cli"])
+def test_heavy_dependencies_load_lazily(module):
+    loaded = _loaded_after(module)
+    assert not loaded & set(HEAVY)
+
+
+def test_units_loads_numpy_on_first_conversion():
+    code = (
+        "import sys; from skypulse.units import _numpy; "
+        "assert 'numpy' not in sys.modules; _numpy(); print('numpy' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "True"
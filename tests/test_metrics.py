@@ -0,0 +1,148 @@
+import asyncio
+
+import pytest
+
+from conftest import FakeSession, FakeAsyncSession
+from skypulse import SkyPulse, ResponseCache, RetryPolicy, APIError
+from skypulse.metrics import Metrics, MetricsHook, RequestTrace
+
+
+class RecordingHook(MetricsHook):
+    def __init__(self):
+        self.requests = []
+        self.timings = []
+        self.counts = []
+        self.in_flight = []
+
+    def on_request(self, trace):
+        self.requests.append(trace)
+
+    def on_timing(self, name, seconds):
+        self.timings.append(name)
+
+    def on_count(self, name, detail=None):
+        self.counts.append((name, detail))
+
+    def on_in_flight(self, value):
+        self.in_flight.append(value)
+
+
+def test_sync_requests_are_traced(j1_payload):
+    hook = RecordingHook()
+    metrics = Metrics([hook])
+    client = SkyPulse(session=FakeSession(j1_payload), cache=ResponseCache(), metrics=metrics)
+
+    client.get_weather("London")
+    client.get_weather("London")
+
+    assert metrics.get("requests") == 1
+    assert metrics.get("cache_miss") == 1 and metrics.get("cache_hit") == 1
+    assert set(metrics.timings) >= {"request", "decode", "build"}
+    assert metrics.in_flight == 0 and hook.in_flight == [1, 0]
+    trace = hook.requests[0]
+    assert (trace.host, trace.location, trace.status, trace.error) == (SkyPulse.DEFAULT_API_URL, "London", 200, None)
+    assert trace.size > 0 and trace.total >= 0
+
+
+def test_errors_and_retries_are_counted_by_type():
+    metrics = Metrics()
+    client = SkyPulse(
+        session=FakeSession(status_code=503),
+        retry=RetryPolicy(max_attempts=3, backoff_base=0, jitter=False),
+        metrics=metrics,
+    )
+
+    with pytest.raises(APIError):
+        client.get_weather("London")
+
+    assert metrics.get("requests") == 3
+    assert metrics.get("error", "APIError") == 3
+    assert metrics.get("retry") == 2
+    assert metrics.snapshot()["counters"]["retry.APIError"] == 2
+
+
+def test_async_requests_are_traced_and_coalesced(j1_payload):
+    hook = RecordingHook()
+    metrics = Metrics([hook])
+
+    async def run():
+        async with SkyPulse(async_mode=True, metrics=metrics) as client:
+            await client._async_session.close()
+            client._async_session = session = FakeAsyncSession(j1_payload, delay=0.01)
+            await asyncio.gather(client.get_weather_async("London"), client.get_weather_async("London"))
+            return session
+
+    session = asyncio.run(run())
+    assert metrics.get("requests") == 1 and metrics.get("coalesced") == 1
+    assert isinstance(session.calls[0][2]["trace_request_ctx"], RequestTrace)
+    assert hook.requests[0].body is not None
+    assert hook.timings == ["decode", "build", "build"]
+
+
+def test_phases_are_measured_against_a_server(wttr_server):
+    metrics = Metrics()
+
+    async def run():
+        async with SkyPulse(api_url=wttr_server.url, async_mode=True, metrics=metrics) as client:
+            await client.get_weather_async("London")
+
+    asyncio.run(run())
+    with SkyPulse(api_url=wttr_server.url, metrics=metrics) as client:
+        client.get_weather("Paris")
+
+    timings = metrics.snapshot()["timings"]
+    assert timings["ttfb"]["count"] == 2 and timings["body"]["count"] == 2
+    assert timings["connect"]["count"] == 1  # Reported by the async transport only
+
+
+def test_disabled_metrics_leave_requests_untouched(j1_payload):
+    session = FakeSession(j1_payload)
+    SkyPulse(session=session).get_weather("London")
+    assert session.calls[0][2].keys() == {"timeout", "headers"}
+
+
+def test_prometheus_hook(j1_payload):
+    prometheus = pytest.importorskip("prometheus_client")
+    from skypulse.metrics import PrometheusHook
+
+    registry = prometheus.CollectorRegistry()
+    client = SkyPulse(session=FakeSession(j1_payload), metrics=Metrics([PrometheusHook(registry)]))
+    client.get_weather("London")
+
+    labels = {"host": SkyPulse.DEFAULT_API_URL, "status": "200"}
+    assert registry.get_sample_value("skypulse_requests_total", labels) == 1
+    assert registry.get_sample_value("skypulse_request_phase_seconds_count", {"phase": "decode"}) == 1
+    assert registry.get_sample_value("skypulse_requests_in_flight") == 0
+
+
+def test_opentelemetry_hook(j1_payload):
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+    from skypulse.metrics import OpenTelemetryHook
+
+    reader = InMemoryMetricReader()
+    spans = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(spans))
+    hook = OpenTelemetryHook(
+        meter=MeterProvider(metric_readers=[reader]).get_meter("test"),
+        tracer=tracer_provider.get_tracer("test"),
+    )
+    client = SkyPulse(session=FakeSession(j1_payload), metrics=Metrics([hook]))
+    client.get_weather("London")
+
+    names = {
+        metric.name
+        for resource in reader.get_metrics_data().resource_metrics
+        for scope in resource.scope_metrics
+        for metric in scope.metrics
+    }
+    assert {"skypulse.requests", "skypulse.phase.duration", "skypulse.requests.in_flight"} <= names
+    (span,) = spans.get_finished_spans()
+    assert span.name == "skypulse.request"
+    assert span.attributes["skypulse.location"] == "London"
+    assert span.attributes["http.response.status_code"] == 200
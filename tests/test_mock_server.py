@@ -0,0 +1,65 @@
+import asyncio
+import time
+
+import pytest
+
+from conftest import FIXTURES, load_payload
+from mock_wttr import MockConfig, MockWttrServer
+from skypulse import SkyPulse, APIError, RateLimitError
+
+
+def test_serves_recorded_fixtures(wttr_server):
+    with SkyPulse(api_url=wttr_server.url) as client:
+        assert client.get_raw("Anywhere") == (FIXTURES / "london_j1.json").read_bytes()
+        response = client.get_weather("Tokyo")
+    expected = load_payload()["current_condition"][0]["temp_C"]
+    assert response.current_condition[0].temp_C == expected
+    assert wttr_server.stats.statuses == {200: 2}
+
+
+def test_serves_j2_to_async_clients(wttr_server):
+    async def run():
+        async with SkyPulse(api_url=wttr_server.url, async_mode=True, format="j2") as client:
+            return await client.compare_locations_async(["London", "Paris", "Tokyo"])
+
+    results = asyncio.run(run())
+    assert all(response is not None and response.weather for response in results.values())
+
+
+def test_latency_is_applied():
+    with MockWttrServer(MockConfig(latency=0.1)) as server:
+        started = time.perf_counter()
+        SkyPulse(api_url=server.url).get_weather("London")
+        assert time.perf_counter() - started >= 0.1
+
+
+def test_throttles_with_retry_after():
+    with MockWttrServer(MockConfig(throttle_rate=1.0, retry_after=7)) as server:
+        with pytest.raises(RateLimitError) as exc:
+            SkyPulse(api_url=server.url).get_weather("London")
+    assert exc.value.retry_after == 7
+    assert server.stats.statuses == {429: 1}
+
+
+def test_error_rate_is_seeded():
+    config = MockConfig(error_rate=0.5, seed=1)
+    with MockWttrServer(config) as server:
+        client = SkyPulse(api_url=server.url)
+        outcomes = []
+        for _ in range(20):
+            try:
+                client.get_weather("London")
+                outcomes.append(True)
+            except APIError as e:
+                assert e.status == 500
+                outcomes.append(False)
+    assert 0 < outcomes.count(False) < 20
+    assert server.stats.requests == 20
+
+
+def test_revalidation_answers_not_modified(wttr_server):
+    with SkyPulse(api_url=wttr_server.url, conditional=True) as client:
+        first = client.get_weather("London")
+        second = client.get_weather("London")
+    assert second == first
+    assert wttr_server.stats.statuses == {200: 1, 304: 1}
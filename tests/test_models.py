@@ -0,0 +1,117 @@
+import gc
+
+import pytest
+
+from skypulse import SkyPulse, WttrResponse, LazyWttrResponse, Weather, CompactCurrentCondition, CompactValue
+
+from conftest import FakeSession
+
+
+def test_eager_decoding(j1_payload):
+    response = WttrResponse.from_dict(j1_payload)
+
+    assert response.current_condition[0].temp_C == "11"
+    assert response.current_condition[0].weatherDesc[0].value == "Partly cloudy"
+    assert response.nearest_area[0].areaName[0].value == "London"
+    assert [day.date for day in response.weather] == ["2024-01-17", "2024-01-18", "2024-01-19"]
+
+
+def test_lazy_decoding_only_builds_accessed_sections(j1_payload, monkeypatch):
+    built = []
+    original = Weather.from_dict.__func__
+    monkeypatch.setattr(Weather, "from_dict", classmethod(lambda cls, data: built.append(data) or original(cls, data)))
+
+    response = WttrResponse.from_dict(j1_payload, lazy=True)
+    assert isinstance(response, LazyWttrResponse)
+    assert response.current_condition[0].temp_C == "11"
+    assert built == []
+    assert not response.is_decoded("weather")
+
+    assert response.weather[0].maxtempC == "10"
+    assert len(built) == 3
+    response.weather
+    assert len(built) == 3
+
+
+def test_lazy_response_equals_eager(j1_payload):
+    lazy = WttrResponse.from_dict(j1_payload, lazy=True)
+    eager = WttrResponse.from_dict(j1_payload)
+    assert lazy == eager
+    assert eager == lazy
+
+
+def test_client_lazy_option(j1_payload):
+    client = SkyPulse(lazy=True)
+    client.session = FakeSession(j1_payload)
+    assert isinstance(client.get_weather("London"), LazyWttrResponse)
+    assert client.get_current_weather("London").humidity == "82"
+
+
+def test_compact_models_match_dataclass_api(j1_payload):
+    compact = WttrResponse.from_dict(j1_payload, compact=True)
+    eager = WttrResponse.from_dict(j1_payload)
+
+    current = compact.current_condition[0]
+    assert isinstance(current, CompactCurrentCondition)
+    assert not hasattr(current, "__dict__")
+    assert current.temp_C == "11"
+    assert current.weatherDesc[0].value == "Partly cloudy"
+    assert compact.weather[0].astronomy[0].sunrise == "07:59 AM"
+    assert compact == eager
+
+
+def test_compact_wrappers_are_shared_and_immutable(j1_payload):
+    first = CompactCurrentCondition.from_dict(j1_payload["current_condition"][0])
+    second = CompactCurrentCondition.from_dict(j1_payload["current_condition"][0])
+
+    assert first.weatherDesc[0] is second.weatherDesc[0]
+    with pytest.raises(AttributeError):
+        first.weatherDesc[0].value = "Sunny"
+
+
+def test_compact_current_condition_falls_back_to_observation_time(j1_payload):
+    data = dict(j1_payload["current_condition"][0])
+    del data["localObsDateTime"]
+    assert CompactCurrentCondition.from_dict(data).localObsDateTime == "10:20 AM"
+
+
+def test_typed_decoding_converts_numbers_once(j1_payload):
+    response = WttrResponse.from_dict(j1_payload, typed=True)
+    current = response.current_condition[0]
+
+    assert current.temp_C == 11 and isinstance(current.temp_C, int)
+    assert current.precipMM == 0.1
+    assert current.weatherCode == "116"
+    assert response.weather[0].sunHour == 3.5
+    assert response.weather[0].astronomy[0].moon_illumination == 40
+    assert response.nearest_area[0].latitude == 51.517
+    assert j1_payload["current_condition"][0]["temp_C"] == "11"
+
+
+def test_typed_decoding_tolerates_unexpected_values(j1_payload):
+    data = dict(j1_payload["current_condition"][0], temp_C="", pressureInches="29.9", humidity="7.5")
+    current = CompactCurrentCondition.from_dict(data, typed=True)
+
+    assert current.temp_C == ""
+    assert current.pressureInches == 29.9
+    assert current.humidity == 7.5
+
+
+def test_typed_option_combines_with_lazy_and_compact(j1_payload):
+    client = SkyPulse(lazy=True, compact=True, typed=True)
+    client.session = FakeSession(j1_payload)
+
+    response = client.get_weather("London")
+    assert response.current_condition[0].FeelsLikeC == 9
+    assert response.weather[1].maxtempC == 11
+    assert response.weather[1].astronomy[0].moon_illumination == 48
+
+
+def test_interned_values_are_released(j1_payload):
+    area = dict(j1_payload["nearest_area"][0], areaName=[{"value": "Nowhere-on-Sea"}])
+    response = WttrResponse.from_dict(dict(j1_payload, nearest_area=[area]), compact=True)
+    assert response.nearest_area[0].areaName[0] is CompactValue.of("Nowhere-on-Sea")
+
+    del response
+    gc.collect()
+    assert "Nowhere-on-Sea" not in CompactValue._interned
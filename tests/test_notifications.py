@@ -0,0 +1,275 @@
+import asyncio
+import copy
+import logging
+import time
+
+from skypulse import SkyPulse, WttrResponse
+from skypulse.notifications import (
+    WeatherNotifier, WeatherNotification, ChangeDetector, ChangeThresholds, NotificationHub, Subscription,
+)
+
+from conftest import FakeAsyncSession
+
+
+def make_notifier(payload, **kwargs):
+    notifier = WeatherNotifier(**kwargs)
+    notifier.client._async_session = FakeAsyncSession(payload)
+    return notifier
+
+
+async def collect(notifier, count):
+    results = []
+    stream = notifier.stream_notifications()
+    async for notification in stream:
+        results.append(notification)
+        if len(results) == count:
+            break
+    await stream.aclose()
+    return results
+
+
+def test_notification_from_current_condition(j1_payload):
+    current = WttrResponse.from_dict(j1_payload).current_condition[0]
+    notification = WeatherNotification.from_weather(current, "London")
+
+    assert notification.temperature == 11.0
+    assert notification.condition == "Partly cloudy"
+    assert notification.to_dict()["location"] == "London"
+
+
+def test_many_locations_share_one_session(j1_payload):
+    notifier = make_notifier(j1_payload, update_interval=0.05)
+    locations = [f"city{i}" for i in range(50)]
+    notifier.add_locations(locations)
+    session = notifier.client._async_session
+
+    results = asyncio.run(collect(notifier, 100))
+
+    assert len(results) == 100
+    assert set(n.location for n in results) == set(locations)
+    assert notifier.client._async_session is session
+    assert len(session.calls) >= 100
+
+
+def test_polls_are_spread_over_the_interval(j1_payload):
+    notifier = make_notifier(j1_payload, update_interval=100)
+    start = time.monotonic()
+    notifier.add_locations(f"city{i}" for i in range(1000))
+
+    offsets = sorted(due - start for due, _, _ in notifier._schedule)
+    assert 0 <= offsets[0] < 1 and 99 < offsets[-1] <= 100.1
+    # Roughly uniform: each tenth of the interval holds about a tenth of the polls
+    buckets = [sum(1 for o in offsets if 10 * i <= o < 10 * (i + 1)) for i in range(10)]
+    assert all(60 <= count <= 140 for count in buckets)
+
+
+def test_removed_location_is_not_polled(j1_payload):
+    notifier = make_notifier(j1_payload, update_interval=0.02)
+    notifier.add_location("London", stagger=False)
+    notifier.add_location("Paris", stagger=False)
+    notifier.remove_location("Paris")
+
+    results = asyncio.run(collect(notifier, 5))
+
+    assert {n.location for n in results} == {"London"}
+    assert notifier.locations == ["London"]
+
+
+def test_single_configured_location_polls_immediately(j1_payload):
+    notifier = make_notifier(j1_payload, update_interval=300)
+    notifier.set_location("London")
+
+    async def run():
+        return await asyncio.wait_for(collect(notifier, 1), 1.0)
+
+    assert asyncio.run(run())[0].location == "London"
+
+
+def test_failed_poll_is_retried(j1_payload, caplog):
+    notifier = make_notifier(j1_payload, update_interval=10, retry_interval=0.01)
+    notifier.client._async_session.status = 500
+    notifier.add_location("London", stagger=False)
+
+    async def run():
+        task = asyncio.ensure_future(collect(notifier, 1))
+        await asyncio.sleep(0.05)
+        notifier.client._async_session.status = 200
+        return await asyncio.wait_for(task, 1.0)
+
+    with caplog.at_level(logging.WARNING, logger="skypulse.notifications"):
+        assert asyncio.run(run())[0].location == "London"
+    assert "Error getting weather update for London" in caplog.text
+
+
+def test_close_leaves_caller_session_open():
+    async def run():
+        async with SkyPulse(async_mode=True) as client:
+            async with WeatherNotifier(client=client):
+                pass
+            caller_open = client.is_open
+
+        unopened = SkyPulse(async_mode=True)
+        async with WeatherNotifier(client=unopened):
+            opened = unopened.is_open
+        return caller_open, opened, unopened.is_open
+
+    assert asyncio.run(run()) == (True, True, False)
+
+
+def reading(payload, **fields):
+    data = copy.deepcopy(payload)
+    current = data["current_condition"][0]
+    if "condition" in fields:
+        current["weatherDesc"] = [{"value": fields.pop("condition")}]
+    current.update(fields)
+    return WttrResponse.from_dict(data).current_condition[0]
+
+
+def test_change_detector_reports_threshold_crossings(j1_payload):
+    detector = ChangeDetector(ChangeThresholds(temperature_delta=2, wind_speed_above=30))
+
+    first = detector.check("London", reading(j1_payload))
+    assert first["temperature"] == (None, 11.0)
+    assert detector.check("London", reading(j1_payload, temp_C="12")) is None
+    # Drift is measured from the last notified reading
+    assert detector.check("London", reading(j1_payload, temp_C="13")) == {"temperature": (11.0, 13.0)}
+    assert detector.check("London", reading(j1_payload, temp_C="13", windspeedKmph="35")) == {
+        "wind_speed": (19.0, 35.0)
+    }
+    assert detector.check("London", reading(j1_payload, temp_C="13", windspeedKmph="40")) is None
+    changes = detector.check("London", reading(j1_payload, temp_C="13", windspeedKmph="40", condition="Heavy rain"))
+    assert changes == {"condition": ("Partly cloudy", "Heavy rain"), "wind_speed": (35.0, 40.0)}
+
+
+def test_delta_mode_skips_unchanged_polls(j1_payload):
+    notifier = make_notifier(j1_payload, update_interval=0.01, delta=ChangeThresholds())
+    notifier.add_location("London", stagger=False)
+    session = notifier.client._async_session
+
+    async def run():
+        stream = notifier.stream_notifications()
+        first = await stream.__anext__()
+        await asyncio.sleep(0.1)
+        session.payload = copy.deepcopy(j1_payload)
+        session.payload["current_condition"][0]["temp_C"] = "15"
+        second = await asyncio.wait_for(stream.__anext__(), 1.0)
+        await stream.aclose()
+        return first, second, len(session.calls)
+
+    first, second, polls = asyncio.run(run())
+    assert first.changes["temperature"] == (None, 11.0)
+    assert second.to_dict()["changes"] == {"temperature": [11.0, 15.0]}
+    assert polls > 3  # Unchanged polls in between produced no notifications
+
+
+def notification(location, temperature=10.0):
+    return WeatherNotification(temperature, "Sunny", location, "2024-01-17T10:20:00")
+
+
+def test_overflow_policies():
+    async def run():
+        hub = NotificationHub(WeatherNotifier())
+        drop = Subscription(hub, None, 2, "drop_oldest")
+        latest = Subscription(hub, None, 2, "coalesce")
+        for location, temperature in [("A", 1), ("B", 2), ("A", 3), ("C", 4)]:
+            await drop.put(notification(location, temperature))
+            await latest.put(notification(location, temperature))
+        dropped = [(n.location, n.temperature) for n in [await drop.get(), await drop.get()]]
+        coalesced = [(n.location, n.temperature) for n in [await latest.get(), await latest.get()]]
+        return dropped, drop.dropped, coalesced, latest.dropped
+
+    dropped, drop_count, coalesced, coalesce_count = asyncio.run(run())
+    assert dropped == [("A", 3), ("C", 4)] and drop_count == 2
+    assert coalesced == [("A", 3), ("C", 4)] and coalesce_count == 2
+
+
+def test_block_policy_waits_for_reader():
+    async def run():
+        blocking = Subscription(NotificationHub(WeatherNotifier()), None, 1, "block")
+        await blocking.put(notification("A"))
+        pending = asyncio.ensure_future(blocking.put(notification("B")))
+        await asyncio.sleep(0.01)
+        was_blocked = not pending.done()
+        first = await blocking.get()
+        await asyncio.wait_for(pending, 1.0)
+        second = await blocking.get()
+        return was_blocked, first.location, second.location
+
+    assert asyncio.run(run()) == (True, "A", "B")
+
+
+def test_hub_fans_out_one_poll_to_many_subscribers(j1_payload):
+    notifier = make_notifier(j1_payload, update_interval=0.02)
+    session = notifier.client._async_session
+
+    async def run():
+        async with NotificationHub(notifier) as hub:
+            london = [hub.subscribe(["London"]) for _ in range(20)]
+            everything = hub.subscribe(overflow="coalesce")
+            paris = hub.subscribe(["Paris"])
+            received = [await asyncio.wait_for(sub.get(), 1.0) for sub in london]
+            await asyncio.wait_for(paris.get(), 1.0)
+            await asyncio.wait_for(everything.get(), 1.0)
+
+            for sub in london:
+                sub.close()
+            assert notifier.locations == ["Paris"]
+            assert hub.subscribers == 2
+        return received
+
+    received = asyncio.run(run())
+    assert {n.location for n in received} == {"London"}
+    london_polls = sum(1 for url, _, _ in session.calls if url.endswith("/London"))
+    assert london_polls < 20  # Twenty subscribers, far fewer upstream requests
+
+
+def test_closed_subscription_ends_iteration():
+    async def run():
+        hub = NotificationHub(WeatherNotifier())
+        sub = Subscription(hub, None, 5, "drop_oldest")
+        await sub.put(notification("A"))
+        sub.close()
+        await sub.put(notification("B"))  # Ignored after close
+        return [n.location async for n in sub]
+
+    assert asyncio.run(run()) == ["A"]
+
+
+def test_hub_does_not_look_up_ip_location(j1_payload):
+    notifier = make_notifier(j1_payload, update_interval=0.02)
+
+    async def no_ip_lookup():
+        raise AssertionError("hub subscribers must not trigger an IP lookup")
+
+    notifier._get_ip_location = no_ip_lookup
+
+    async def run():
+        async with NotificationHub(notifier) as hub:
+            everything = hub.subscribe()
+            await asyncio.sleep(0.05)
+            assert not hub._task.done()
+            hub.subscribe(["London"])
+            return await asyncio.wait_for(everything.get(), 1.0)
+
+    assert asyncio.run(run()).location == "London"
+
+
+def test_hub_failure_reaches_subscribers():
+    class BrokenNotifier(WeatherNotifier):
+        async def stream_notifications(self, ip_lookup=True):
+            raise RuntimeError("stream failed")
+            yield
+
+    async def run():
+        async with NotificationHub(BrokenNotifier()) as hub:
+            sub = hub.subscribe(["London"])
+            try:
+                async for _ in sub:
+                    pass
+            except RuntimeError as e:
+                return e, sub.closed, hub.subscribers
+        return None
+
+    error, closed, subscribers = asyncio.run(asyncio.wait_for(run(), 1.0))
+    assert str(error) == "stream failed"
+    assert closed and subscribers == 0
@@ -0,0 +1,120 @@
+import asyncio
+import time
+
+import pytest
+
+from skypulse import SkyPulse, RateLimiter, RateLimitError, APIError
+from skypulse.ratelimit import parse_retry_after
+
+from conftest import FakeSession, FakeAsyncSession
+
+
+def test_bucket_allows_burst_then_paces():
+    limiter = RateLimiter(rate=100, burst=3)
+
+    assert [limiter._reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter._reserve() == pytest.approx(0.01, abs=0.002)
+    assert limiter._reserve() == pytest.approx(0.02, abs=0.002)
+
+
+def test_acquire_waits_for_tokens():
+    limiter = RateLimiter(rate=50, burst=1)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.09
+
+
+def test_backoff_honours_retry_after_and_adapts():
+    limiter = RateLimiter(rate=10)
+
+    limiter.backoff(2.0)
+
+    assert limiter.rate == 5
+    assert limiter._reserve() == pytest.approx(2.0, abs=0.01)
+    for _ in range(100):
+        limiter.record_success()
+    assert limiter.rate == 10
+
+
+def test_backoff_without_retry_after_doubles():
+    limiter = RateLimiter(rate=10, adaptive=False, max_backoff=0.5)
+    limiter.backoff()
+    assert limiter._penalty == pytest.approx(0.1)
+    limiter.backoff()
+    limiter.backoff()
+    limiter.backoff()
+    assert limiter._penalty == 0.5
+    limiter.record_success()
+    assert limiter._penalty == 0.0
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_shared_state_file(tmp_path):
+    path = str(tmp_path / "bucket")
+    first = RateLimiter(rate=100, burst=2, path=path)
+    second = RateLimiter(rate=100, burst=2, path=path)
+
+    assert first._reserve() == 0.0
+    assert first._reserve() == 0.0
+    assert second._reserve() > 0.0
+    first.close()
+    second.close()
+
+
+def test_429_raises_rate_limit_error(j1_payload):
+    limiter = RateLimiter(rate=100)
+    client = SkyPulse(rate_limiter=limiter)
+    client.session = FakeSession(j1_payload, status_code=429, headers={"Retry-After": "0"})
+
+    with pytest.raises(RateLimitError) as excinfo:
+        client.get_weather("London")
+
+    assert isinstance(excinfo.value, APIError)
+    assert excinfo.value.retry_after == 0.0
+    assert limiter.throttled == 1
+    assert limiter.rate == 50
+
+
+def test_503_with_retry_after_is_throttling_and_plain_503_is_not(j1_payload):
+    client = SkyPulse()
+    client.session = FakeSession(j1_payload, status_code=503, headers={"Retry-After": "1"})
+    with pytest.raises(RateLimitError):
+        client.get_weather("London")
+
+    client.session = FakeSession(j1_payload, status_code=503)
+    with pytest.raises(APIError) as excinfo:
+        client.get_weather("London")
+    assert not isinstance(excinfo.value, RateLimitError)
+
+
+def test_compare_locations_async_raises_throttling(j1_payload):
+    async def run(status, headers=None):
+        async with SkyPulse(async_mode=True) as client:
+            client._async_session = FakeAsyncSession(j1_payload, status=status, headers=headers)
+            return await client.compare_locations_async(["London", "Paris"])
+
+    with pytest.raises(RateLimitError):
+        asyncio.run(run(429, {"Retry-After": "0"}))
+    assert asyncio.run(run(404)) == {"London": None, "Paris": None}
+
+
+def test_async_requests_wait_on_limiter(j1_payload):
+    limiter = RateLimiter(rate=100, burst=1)
+
+    async def run():
+        async with SkyPulse(async_mode=True, rate_limiter=limiter) as client:
+            client._async_session = FakeAsyncSession(j1_payload)
+            start = time.monotonic()
+            results = [r async for r in client.fetch_many_async([f"city{i}" for i in range(5)])]
+            return results, time.monotonic() - start
+
+    results, elapsed = asyncio.run(run())
+    assert len(results) == 5
+    assert elapsed >= 0.035
@@ -0,0 +1,207 @@
+import asyncio
+
+import pytest
+import requests
+
+from skypulse import SkyPulse, RetryPolicy, CircuitBreaker, APIError, LocationError, RateLimitError, TransportError
+
+from conftest import FakeResponse, FakeSession, FakeAsyncSession, _DelayedResponse, FakeAsyncResponse
+
+
+class FlakySession(FakeSession):
+    """Fails with the given outcomes before answering normally."""
+
+    def __init__(self, payload, failures):
+        super().__init__(payload)
+        self.failures = list(failures)
+
+    def get(self, url, params=None, **kwargs):
+        self.calls.append((url, dict(params or {}), kwargs))
+        if self.failures:
+            failure = self.failures.pop(0)
+            if isinstance(failure, Exception):
+                raise failure
+            return FakeResponse(None, failure)
+        return FakeResponse(self.payload)
+
+
+def no_wait(**kwargs):
+    return RetryPolicy(backoff_base=0, **kwargs)
+
+
+def test_transient_failures_are_retried(j1_payload):
+    client = SkyPulse(retry=no_wait(max_attempts=3))
+    client.session = FlakySession(j1_payload, [requests.exceptions.ConnectionError("reset"), 503])
+
+    assert client.get_weather("London").current_condition[0].temp_C == "11"
+    assert len(client.session.calls) == 3
+
+
+def test_retries_stop_after_max_attempts(j1_payload):
+    client = SkyPulse(retry=no_wait(max_attempts=2))
+    client.session = FlakySession(j1_payload, [500, 502, 503])
+
+    with pytest.raises(APIError) as excinfo:
+        client.get_weather("London")
+    assert excinfo.value.status == 502
+    assert len(client.session.calls) == 2
+
+
+def test_permanent_errors_are_not_retried(j1_payload):
+    client = SkyPulse(retry=no_wait())
+    client.session = FlakySession(j1_payload, [404])
+    with pytest.raises(LocationError):
+        client.get_weather("Atlantis")
+
+    client.session = FlakySession(j1_payload, [400])
+    with pytest.raises(APIError):
+        client.get_weather("London")
+    assert len(client.session.calls) == 1
+
+
+def test_no_policy_means_single_attempt(j1_payload):
+    client = SkyPulse()
+    client.session = FlakySession(j1_payload, [requests.exceptions.Timeout("slow")])
+    with pytest.raises(TransportError):
+        client.get_weather("London")
+    assert len(client.session.calls) == 1
+
+
+def test_delay_is_jittered_exponential_and_honours_retry_after():
+    policy = RetryPolicy(max_attempts=5, backoff_base=1.0, backoff_max=3.0)
+    error = TransportError("reset")
+
+    assert all(0 <= policy.delay_for(error, 1) <= 1.0 for _ in range(50))
+    assert all(0 <= policy.delay_for(error, 4) <= 3.0 for _ in range(50))
+    assert policy.delay_for(error, 5) is None
+    assert RetryPolicy(jitter=False, backoff_base=1.0).delay_for(error, 2) == 2.0
+    assert policy.delay_for(RateLimitError("slow down", retry_after=7.0), 1) == 7.0
+
+
+def test_retry_on_extends_retryable_errors():
+    policy = RetryPolicy(retry_on=(APIError,))
+    assert policy.is_retryable(APIError("Invalid JSON response"))
+    assert not RetryPolicy().is_retryable(APIError("Invalid JSON response"))
+
+
+def test_retry_on_applies_to_other_exception_types(j1_payload):
+    client = SkyPulse(retry=no_wait(retry_on=(OSError,)))
+    client.session = FlakySession(j1_payload, [OSError("socket closed")])
+    assert client.get_weather("London").current_condition[0].temp_C == "11"
+    assert len(client.session.calls) == 2
+
+    client = SkyPulse(retry=no_wait())
+    client.session = FlakySession(j1_payload, [OSError("socket closed")])
+    with pytest.raises(OSError):
+        client.get_weather("London")
+    assert len(client.session.calls) == 1
+
+    class Broken(FakeAsyncSession):
+        def get(self, url, params=None, **kwargs):
+            self.calls.append((url, dict(params or {}), kwargs))
+            if len(self.calls) == 1:
+                raise OSError("socket closed")
+            return FakeAsyncResponse(self.payload)
+
+    async def run():
+        async with SkyPulse(async_mode=True, retry=no_wait(retry_on=(OSError,))) as client:
+            client._async_session = Broken(j1_payload)
+            await client.get_weather_async("London")
+            return len(client._async_session.calls)
+
+    assert asyncio.run(run()) == 2
+
+
+class StragglerSession(FakeAsyncSession):
+    """The first request hangs; later ones answer immediately."""
+
+    def get(self, url, params=None, **kwargs):
+        self.calls.append((url, dict(params or {}), kwargs))
+        delay = 5.0 if len(self.calls) == 1 else 0.0
+        return _Slow(delay, FakeAsyncResponse(self.payload))
+
+
+class _Slow:
+    def __init__(self, delay, response):
+        self.delay = delay
+        self.response = response
+
+    async def __aenter__(self):
+        await asyncio.sleep(self.delay)
+        return self.response
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def test_hedged_request_beats_straggler(j1_payload):
+    async def run():
+        policy = RetryPolicy(hedge=True, hedge_delay=0.02)
+        async with SkyPulse(async_mode=True, retry=policy) as client:
+            client._async_session = StragglerSession(j1_payload)
+            response = await asyncio.wait_for(client.get_weather_async("London"), 1.0)
+            return client, response, len(client._async_session.calls)
+
+    client, response, calls = asyncio.run(run())
+    assert response.current_condition[0].temp_C == "11"
+    assert client.hedged == 1
+    assert calls == 2
+
+
+class StallThenFailSession(FakeAsyncSession):
+    """The primary endpoint answers slowly; every other endpoint fails with a 502."""
+
+    def get(self, url, params=None, **kwargs):
+        self.calls.append((url, dict(params or {}), kwargs))
+        if url.startswith("https://a.example/"):
+            return _Slow(0.1, FakeAsyncResponse(self.payload))
+        return FakeAsyncResponse(None, 502)
+
+
+def test_hedge_outcomes_are_recorded_per_endpoint(j1_payload):
+    async def run():
+        client = SkyPulse(
+            api_url=["https://a.example", "https://b.example"],
+            async_mode=True,
+            retry=RetryPolicy(hedge=True, hedge_delay=0.02),
+            circuit_breaker=CircuitBreaker(failure_threshold=1),
+        )
+        async with client:
+            client._async_session = StallThenFailSession(j1_payload)
+            await client.get_weather_async("London")
+            state = client.circuit_breaker.state("https://b.example")
+            await client.get_weather_async("Paris")
+            return client, state, [url for url, _, _ in client._async_session.calls]
+
+    client, state, urls = asyncio.run(run())
+    assert state == "open"  # The failed hedge counts against the hedge endpoint
+    assert client.circuit_breaker.state("https://a.example") == "closed"
+    assert client.endpoints.stats("https://b.example").consecutive_failures == 1
+    assert client.endpoints.stats("https://a.example").consecutive_failures == 0
+    assert client.hedged == 1  # No hedge goes to an endpoint whose circuit is open
+    assert urls == ["https://a.example/London", "https://b.example/London", "https://a.example/Paris"]
+
+
+def test_hedge_delay_follows_observed_latency():
+    client = SkyPulse(retry=RetryPolicy(hedge=True, hedge_min_samples=10))
+    assert client._hedge_delay() is None
+    for i in range(100):
+        client.latency.record(i / 100)
+    assert client._hedge_delay() == pytest.approx(0.95)
+    assert SkyPulse()._hedge_delay() is None
+
+
+def test_async_transient_failures_are_retried(j1_payload):
+    class Flaky(FakeAsyncSession):
+        def get(self, url, params=None, **kwargs):
+            self.calls.append((url, dict(params or {}), kwargs))
+            status = 503 if len(self.calls) == 1 else 200
+            return _DelayedResponse(self, FakeAsyncResponse(self.payload, status))
+
+    async def run():
+        async with SkyPulse(async_mode=True, retry=no_wait()) as client:
+            client._async_session = Flaky(j1_payload)
+            await client.get_weather_async("London")
+            return len(client._async_session.calls)
+
+    assert asyncio.run(run()) == 2
@@ -0,0 +1,173 @@
+import asyncio
+import gzip
+import json
+
+import aiohttp
+import requests
+from aiohttp import web
+
+from skypulse import SkyPulse, TransportConfig
+from skypulse import transport
+
+from conftest import FakeSession, FakeAsyncSession
+
+
+def test_session_pool_sized_from_config():
+    client = SkyPulse(transport=TransportConfig(pool_connections=4, pool_maxsize=64))
+    adapter = client.session.get_adapter("https://wttr.in")
+
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 64
+    assert client.session.headers["User-Agent"] == SkyPulse.USER_AGENT
+
+
+def test_keep_alive_can_be_disabled():
+    client = SkyPulse(transport=TransportConfig(keep_alive=False))
+    assert client.session.headers["Connection"] == "close"
+
+
+def test_default_timeouts_are_sent(j1_payload):
+    client = SkyPulse(transport=TransportConfig(connect_timeout=2, read_timeout=5))
+    client.session = FakeSession(j1_payload)
+
+    client.get_weather("London")
+    client.get_weather("Paris", timeout=1)
+
+    assert client.session.calls[0][2]["timeout"] == (2, 5)
+    assert client.session.calls[1][2]["timeout"] == 1
+
+
+def test_shared_session_is_not_closed():
+    shared = requests.Session()
+    closed = []
+    shared.close = lambda: closed.append(True)
+
+    with SkyPulse(session=shared) as first, SkyPulse(session=shared) as second:
+        assert first.session is second.session is shared
+    assert closed == []
+
+    with SkyPulse() as owned:
+        owned.session.close = lambda: closed.append(True)
+    assert closed == [True]
+
+
+def test_shared_connector_outlives_clients():
+    async def run():
+        connector = aiohttp.TCPConnector(limit_per_host=5)
+        config = TransportConfig(connect_timeout=1, read_timeout=2)
+        async with SkyPulse(async_mode=True, connector=connector, transport=config) as client:
+            assert client._async_session.connector is connector
+            assert client._async_session.timeout.sock_read == 2
+        async with SkyPulse(async_mode=True, connector=connector) as client:
+            assert client._async_session.connector is connector
+        still_open = not connector.closed
+        await connector.close()
+        return still_open
+
+    assert asyncio.run(run())
+
+
+def test_owned_connector_uses_config():
+    async def run():
+        config = TransportConfig(pool_maxsize=7, total_connections=50, dns_cache_ttl=60)
+        async with SkyPulse(async_mode=True, transport=config) as client:
+            connector = client._async_session.connector
+            return connector.limit, connector.limit_per_host
+
+    assert asyncio.run(run()) == (50, 7)
+
+
+def test_compression_is_negotiated(monkeypatch):
+    monkeypatch.setattr(transport, "brotli_available", lambda: False)
+    assert SkyPulse().session.headers["Accept-Encoding"] == "gzip, deflate"
+    assert SkyPulse(transport=TransportConfig(compression=False)).session.headers["Accept-Encoding"] == "identity"
+
+    monkeypatch.setattr(transport, "brotli_available", lambda: True)
+    assert SkyPulse().session.headers["Accept-Encoding"] == "br, gzip, deflate"
+    assert SkyPulse(async_mode=True)._headers["Accept-Encoding"] == "br, gzip, deflate"
+
+
+def test_get_raw_returns_body_without_decoding(j1_payload):
+    client = SkyPulse()
+    client.session = FakeSession(j1_payload)
+
+    body = client.get_raw("London")
+
+    assert isinstance(body, bytes)
+    assert json.loads(body) == j1_payload
+    assert client.session.calls[0][1] == {"format": "j1"}
+
+
+def test_fetch_many_raw(j1_payload):
+    async def run():
+        async with SkyPulse(async_mode=True) as client:
+            client._async_session = FakeAsyncSession(j1_payload)
+            return [result async for result in client.fetch_many_async(["London", "Paris"], raw=True)]
+
+    results = dict(asyncio.run(run()))
+    assert all(json.loads(body) == j1_payload for body in results.values())
+
+    client = SkyPulse()
+    client.session = FakeSession(j1_payload)
+    assert all(isinstance(body, bytes) for _, body in client.fetch_many(["London", "Paris"], raw=True))
+
+
+def test_gzip_response_is_decompressed(j1_payload):
+    body = json.dumps(j1_payload).encode()
+    seen = []
+
+    async def handler(request):
+        seen.append(request.headers.get("Accept-Encoding"))
+        return web.Response(body=gzip.compress(body), content_type="application/json",
+                            headers={"Content-Encoding": "gzip"})
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/{location}", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            async with SkyPulse(api_url=f"http://127.0.0.1:{port}", async_mode=True) as client:
+                raw = await client.get_raw_async("London")
+                weather = await client.get_weather_async("London")
+            return raw, weather
+        finally:
+            await runner.cleanup()
+
+    raw, weather = asyncio.run(run())
+    assert raw == body
+    assert weather.current_condition[0].temp_C == "11"
+    assert all("gzip" in value for value in seen)
+
+
+def test_injected_session_sends_client_headers(j1_payload, monkeypatch):
+    monkeypatch.setattr(transport, "brotli_available", lambda: False)
+    sent = []
+
+    class RecordingAdapter(requests.adapters.BaseAdapter):
+        def send(self, request, **kwargs):
+            sent.append(request.headers)
+            response = requests.Response()
+            response.status_code = 200
+            response._content = json.dumps(j1_payload).encode()
+            response.request, response.url = request, request.url
+            return response
+
+        def close(self):
+            pass
+
+    shared = requests.Session()
+    shared.mount("https://", RecordingAdapter())
+    client = SkyPulse(session=shared, transport=TransportConfig(keep_alive=False), conditional=True)
+    client.validators.headers = lambda key: {"If-None-Match": '"v1"'}
+
+    client.get_weather("London")
+
+    assert sent[0]["User-Agent"] == SkyPulse.USER_AGENT
+    assert sent[0]["Accept-Encoding"] == "gzip, deflate"
+    assert sent[0]["Connection"] == "close"
+    assert sent[0]["If-None-Match"] == '"v1"'
+    assert "SkyPulse" not in shared.headers["User-Agent"]  # The shared session itself is untouched
@@ -0,0 +1,113 @@
+import math
+from array import array
+
+import pytest
+
+from skypulse import SkyPulse, UnitPreferences, UnitConverter, ColumnarView, WttrResponse, convert_values
+from skypulse import units
+
+from conftest import FakeSession
+
+
+def test_convert_values_batch():
+    assert list(convert_values([0.0, 100.0, -40.0], "temperature", "F")) == [32.0, 212.0, -40.0]
+    assert convert_values([36.0], "wind_speed", "ms")[0] == pytest.approx(10.0)
+    assert convert_values([25.4], "precipitation", "in")[0] == pytest.approx(1.0)
+
+
+def test_pure_python_fallback_matches_numpy(monkeypatch):
+    values = array("d", [float(i) for i in range(1000)])
+    expected = list(convert_values(values, "wind_speed", "mph"))
+    monkeypatch.setattr(units, "np", None)
+    assert list(convert_values(values, "wind_speed", "mph")) == pytest.approx(expected)
+
+
+def test_unknown_units_rejected():
+    with pytest.raises(ValueError):
+        UnitConverter(UnitPreferences(temperature="K"))
+    with pytest.raises(ValueError):
+        SkyPulse().set_units(UnitPreferences(wind_speed="knots"))
+
+
+def test_snapshot_converts_current_conditions(j1_payload):
+    converter = UnitConverter(UnitPreferences(temperature="F", wind_speed="mph", distance="mi"))
+    items = [
+        ("London", j1_payload),
+        ("Paris", WttrResponse.from_dict(j1_payload, typed=True)),
+        ("Rome", WttrResponse.from_dict(j1_payload, lazy=True)),
+        ("Nowhere", None),
+    ]
+
+    snapshot = converter.snapshot(items)
+
+    assert snapshot["location"] == ["London", "Paris", "Rome"]
+    assert list(snapshot["temperature"]) == pytest.approx([51.8] * 3)
+    assert snapshot["wind_speed"][0] == pytest.approx(19 * 0.621371)
+    assert snapshot["humidity"][0] == 82.0
+    assert snapshot["units"]["temperature"] == "F"
+    assert snapshot["units"]["pressure"] == "mb"
+
+
+def test_apply_converts_columnar_view_once(j1_payload):
+    view = ColumnarView.from_responses([("London", j1_payload)])
+    client = SkyPulse()
+    client.set_units(UnitPreferences(temperature="F", precipitation="in"))
+
+    client.converter.apply(view)
+
+    assert view.hourly.column("tempC")[0] == pytest.approx(42.8)
+    assert view.daily.column("maxtempC")[0] == pytest.approx(50.0)
+    assert view.hourly.column("humidity")[0] == 70.0
+    assert view.units["temperature"] == "F"
+    with pytest.raises(ValueError):
+        client.converter.apply(view)
+
+
+def test_nan_survives_conversion():
+    assert math.isnan(convert_values([float("nan")], "temperature", "F")[0])
+
+
+def test_client_responses_carry_preferred_units(j1_payload):
+    client = SkyPulse(session=FakeSession(j1_payload))
+    metric = client.get_weather("London")
+    assert metric.units == {} and metric.converted == {}
+
+    client.set_units(UnitPreferences(temperature="F", wind_speed="mph"))
+    response = client.get_weather("London")
+    current = client.get_current_weather("London")
+
+    assert current.temp_C == "11"  # Model fields stay metric
+    assert response.weather[0].maxtempC == "10"
+    assert response.converted["current_condition"]["temp_C"][0] == pytest.approx(51.8)
+    assert response.converted["current_condition"]["windspeedKmph"][0] == pytest.approx(19 * 0.621371)
+    assert "humidity" not in response.converted["current_condition"]
+    assert response.converted["weather"]["maxtempC"][0] == pytest.approx(50.0)
+    assert response.converted["hourly"]["tempC"][0] == pytest.approx(42.8)
+    assert len(response.converted["hourly"]["tempC"]) == sum(len(day["hourly"]) for day in j1_payload["weather"])
+    assert response.units["temperature"] == "F" and response.units["pressure"] == "mb"
+
+
+def test_typed_and_lazy_responses_carry_converted_readings(j1_payload):
+    client = SkyPulse(session=FakeSession(j1_payload), typed=True, lazy=True, conditional=True)
+    metric = client.get_weather("London")
+    client.set_units(UnitPreferences(temperature="F"))
+
+    response = client.get_weather("London")
+
+    assert response is not metric
+    assert response.current_condition[0].temp_C == 11
+    assert response.converted["weather"]["mintempC"][0] == pytest.approx(42.8)
+    assert response.units["temperature"] == "F"
+
+
+def test_client_responses_convert_like_raw_payloads(j1_payload):
+    client = SkyPulse(session=FakeSession(j1_payload))
+    client.set_units(UnitPreferences(temperature="F"))
+    items = [("London", client.get_weather("London")), ("Paris", j1_payload)]
+
+    snapshot = client.converter.snapshot(items)
+    view = client.converter.apply(ColumnarView.from_responses(items))
+
+    assert list(snapshot["temperature"]) == pytest.approx([51.8, 51.8])
+    assert list(view.hourly.column("tempC")[:1]) == pytest.approx([42.8])
+    assert view.daily.column("maxtempC")[0] == pytest.approx(50.0)
@@ -13,13 +13,17 @@ def format_time(time_str):
 def format_temp(temp):
     return f"{temp}°C"
 
-async def test_features():
+def test_features(wttr_server):
+    # Runs offline against the local mock wttr.in
+    asyncio.run(show_features(wttr_server.url))
+
+async def show_features(api_url: str = SkyPulse.DEFAULT_API_URL):
     # Test with both j1 and j2 formats
     for format in ["j1", "j2"]:
         print(f"\n🌟 Testing with format: {format}")
         print("=" * 50)
         
-        async with SkyPulse(async_mode=True, format=format) as client:
+        async with SkyPulse(api_url=api_url, async_mode=True, format=format) as client:
             # Set preferred units
             client.set_units(UnitPreferences(
                 temperature="C",
@@ -85,4 +89,4 @@ async def test_features():
 
 # Run the test
 if __name__ == "__main__":
-    asyncio.run(test_features())
\ No newline at end of file
+    asyncio.run(show_features())
\ No newline at end of file